@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark for outbound WebSocket message encoding.
+
+Usage (from backend directory, with backend venv activated):
+    python benchmarks/bench_codec.py
+    python benchmarks/bench_codec.py --quick --check
+
+Compares, per message:
+1. legacy: model_dump() dict + stdlib json.dumps (what send_json did)
+2. codec: zc_api.common.codec.encode_model (model_dump_json, no dict)
+3. orjson: model_dump() dict + orjson.dumps (only if orjson is installed)
+
+Also times building the model plus encoding it (the full per-message cost)
+and dict encoding via encode_dict vs. stdlib json for payloads that are
+already dicts.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from harness import BenchmarkRunner, add_arguments, create_runner, finish
+
+# Paths - script is in backend/benchmarks/
+SCRIPT_DIR = Path(__file__).parent
+BACKEND_SRC = SCRIPT_DIR.parent / "src"
+THRESHOLDS_PATH = SCRIPT_DIR / "codec_thresholds.json"
+
+sys.path.insert(0, str(BACKEND_SRC))
+
+from pydantic import BaseModel  # noqa: E402
+
+from zc_api.common.codec import encode_dict, encode_model, orjson  # noqa: E402
+from zc_api.models.matchmaking import ServerMatchFound  # noqa: E402
+from zc_api.models.session import ServerGameReady, ServerPinged  # noqa: E402
+
+
+def legacy_encode(model: BaseModel) -> str:
+    """The old path: dict copy, then stdlib json (as Starlette's send_json)."""
+    return json.dumps(model.model_dump(), separators=(",", ":"), ensure_ascii=False)
+
+
+def make_messages() -> dict[str, BaseModel]:
+    return {
+        "pinged": ServerPinged(type="pinged"),
+        "game_ready": ServerGameReady(
+            type="game_ready",
+            match_id="k3Jd8fQpL2xZ",
+            you="Player-0042",
+            opponent="Player-1337",
+            opponent_elemental="fire",
+        ),
+        "match_found": ServerMatchFound(
+            type="match_found",
+            match_id="k3Jd8fQpL2xZ",
+            player_token="S2l0dGVuc0FyZUNvb2xBbmRTb0FyZVlvdQ",
+        ),
+    }
+
+
+def make_state_delta(tile_count: int) -> dict[str, object]:
+    """Dict payload shaped like a board state delta."""
+    return {
+        "type": "state_delta",
+        "turn": 12,
+        "tiles": [
+            {"x": index % 8, "y": index // 8, "owner": "P1" if index % 3 else "P2", "tags": [3, 17, 42]}
+            for index in range(tile_count)
+        ],
+    }
+
+
+def bench_models(runner: BenchmarkRunner) -> None:
+    for name, model in make_messages().items():
+        runner.run(f"encode.legacy[msg={name}]", lambda m=model: legacy_encode(m))
+        runner.run(f"encode.codec[msg={name}]", lambda m=model: encode_model(m))
+        if orjson is not None:
+            runner.run(f"encode.orjson_dump[msg={name}]", lambda m=model: orjson.dumps(m.model_dump()))
+
+    def build_legacy() -> str:
+        return legacy_encode(ServerPinged(type="pinged"))
+
+    def build_codec() -> str:
+        return encode_model(ServerPinged(type="pinged"))
+
+    runner.run("build_and_encode.legacy[msg=pinged]", build_legacy)
+    runner.run("build_and_encode.codec[msg=pinged]", build_codec)
+
+
+def bench_dicts(runner: BenchmarkRunner) -> None:
+    for tile_count in (1, 64):
+        payload = make_state_delta(tile_count)
+        runner.run(
+            f"encode_dict.stdlib[tiles={tile_count}]",
+            lambda p=payload: json.dumps(p, separators=(",", ":"), ensure_ascii=False),
+        )
+        runner.run(f"encode_dict.codec[tiles={tile_count}]", lambda p=payload: encode_dict(p))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_arguments(parser, THRESHOLDS_PATH)
+    args = parser.parse_args()
+
+    runner = create_runner(args)
+    print(f"Running codec benchmarks (orjson {'available' if orjson else 'not installed'})...", file=sys.stderr)
+    bench_models(runner)
+    bench_dicts(runner)
+    return finish("codec", runner, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
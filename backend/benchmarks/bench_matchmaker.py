@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Matchmaking throughput: immediate pairing vs. batched ticks.
+
+Usage (from backend directory, with backend venv activated):
+    python benchmarks/bench_matchmaker.py
+    python benchmarks/bench_matchmaker.py --quick --check
+
+Each case queues N players at once against a fresh SessionRegistry and
+reports nanoseconds per matched player:
+1. immediate: the default Matchmaker; each arrival takes the lock and
+   creates one match
+2. batched: Matchmaker with a tick interval; one tick pairs the whole
+   queue and creates every match with a single create_matches call
+
+3. rated: RatedMatchmaker, with ratings spread over 0-3000; one tick
+   pairs each player with their nearest-rated opponent (bisect per player;
+   the window spans every rating so the queue empties in one tick)
+
+The `[store=async]` variants put the registry behind one event-loop
+round trip per create call (like the backplane hub or an external
+store): immediate pairing then holds the lock across every round trip,
+while a batch pays it once.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+
+from harness import BenchmarkRunner, add_arguments, create_runner, finish
+
+# Paths - script is in backend/benchmarks/
+SCRIPT_DIR = Path(__file__).parent
+BACKEND_SRC = SCRIPT_DIR.parent / "src"
+THRESHOLDS_PATH = SCRIPT_DIR / "matchmaker_thresholds.json"
+
+sys.path.insert(0, str(BACKEND_SRC))
+
+from zc_api.game_manager.session import (  # noqa: E402
+    Matchmaker,
+    MatchPreferences,
+    RatedMatchmaker,
+    RatingWindow,
+    SessionRegistry,
+)
+from zc_api.game_manager.session.matchmaker import MatchFactory  # noqa: E402
+
+QUEUE_SIZES = (100, 1000, 5000)
+
+
+class AsyncStore:
+    """SessionRegistry that yields to the event loop once per create call."""
+
+    def __init__(self) -> None:
+        self._registry = SessionRegistry()
+
+    async def create_match(self, name_a: str, elemental_a: str, name_b: str, elemental_b: str) -> tuple[str, str, str]:
+        await asyncio.sleep(0)
+        return await self._registry.create_match(name_a, elemental_a, name_b, elemental_b)
+
+    async def create_matches(self, players: Sequence[tuple[str, str, str, str]]) -> list[tuple[str, str, str]]:
+        await asyncio.sleep(0)
+        return await self._registry.create_matches(players)
+
+
+def make_store(store: str) -> MatchFactory:
+    return AsyncStore() if store == "async" else SessionRegistry()
+
+
+async def run_immediate(players: int, store: str) -> None:
+    matchmaker = Matchmaker(make_store(store))
+    await asyncio.gather(*(matchmaker.wait_for_match(f"P{index}", "fire") for index in range(players)))
+
+
+async def run_batched(players: int, store: str) -> None:
+    # The tick task is not started; the case calls tick() once everyone is queued
+    matchmaker = Matchmaker(make_store(store), tick_interval=1.0)
+    waiters = [asyncio.create_task(matchmaker.wait_for_match(f"P{index}", "fire")) for index in range(players)]
+    await asyncio.sleep(0)
+    await matchmaker.tick()
+    await asyncio.gather(*waiters)
+
+
+async def run_rated(players: int) -> None:
+    matchmaker = RatedMatchmaker(SessionRegistry(), tick_interval=1.0, window=RatingWindow(initial=3000, maximum=3000))
+    waiters = [
+        asyncio.create_task(
+            matchmaker.wait_for_match(f"P{index}", "fire", MatchPreferences(rating=float(index * 7919 % 3000)))
+        )
+        for index in range(players)
+    ]
+    await asyncio.sleep(0)
+    await matchmaker.tick()
+    await asyncio.gather(*waiters)
+
+
+def bench_matchmaking(runner: BenchmarkRunner, loop: asyncio.AbstractEventLoop) -> None:
+    for store in ("memory", "async"):
+        for players in QUEUE_SIZES:
+            runner.run(
+                f"matchmaking.immediate[store={store},players={players}]",
+                lambda n=players, s=store: loop.run_until_complete(run_immediate(n, s)),
+                ops=players,
+            )
+            runner.run(
+                f"matchmaking.batched[store={store},players={players}]",
+                lambda n=players, s=store: loop.run_until_complete(run_batched(n, s)),
+                ops=players,
+            )
+    for players in QUEUE_SIZES:
+        runner.run(
+            f"matchmaking.rated[players={players}]",
+            lambda n=players: loop.run_until_complete(run_rated(n)),
+            ops=players,
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_arguments(parser, THRESHOLDS_PATH)
+    args = parser.parse_args()
+
+    runner = create_runner(args)
+    print("Running matchmaking benchmarks...", file=sys.stderr)
+    loop = asyncio.new_event_loop()
+    try:
+        bench_matchmaking(runner, loop)
+    finally:
+        loop.close()
+    return finish("matchmaker", runner, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
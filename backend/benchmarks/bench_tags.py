@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the gameplay tag system.
+
+Usage (from backend directory, with backend venv activated):
+    python benchmarks/bench_tags.py                        # JSON to stdout
+    python benchmarks/bench_tags.py --output tags.json     # JSON to file
+    python benchmarks/bench_tags.py --quick --check        # CI smoke run
+    python benchmarks/bench_tags.py --baseline main.json --check
+    python benchmarks/bench_tags.py --filter "container.has_*"
+
+Covers:
+1. Registry interning throughput and path lookups (live and frozen)
+2. Parent walks at hierarchy depths 1-8
+3. Container add/remove at sizes 1-1000
+4. has_any/has_all across sizes 1-1000 x depths 1-8, list vs. bitmask
+5. Serialization round-trips (CSV strings and the binary wire format)
+
+Results are nanoseconds per operation. --check exits with status 1 if any
+result exceeds benchmarks/tag_thresholds.json (generous absolute ceilings
+that catch algorithmic regressions) or, with --baseline, is more than
+--tolerance slower than a previous run on the same machine.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+from harness import BenchmarkRunner, add_arguments, create_runner, finish
+
+# Paths - script is in backend/benchmarks/
+SCRIPT_DIR = Path(__file__).parent
+BACKEND_SRC = SCRIPT_DIR.parent / "src"
+THRESHOLDS_PATH = SCRIPT_DIR / "tag_thresholds.json"
+
+sys.path.insert(0, str(BACKEND_SRC))
+
+from zc_api.tags import (  # noqa: E402
+    GameplayTagBitmaskContainer,
+    GameplayTagContainer,
+    TagRegistry,
+    decode_tags,
+    encode_tags,
+)
+
+SIZES = (1, 10, 100, 1000)
+DEPTHS = (1, 2, 4, 8)
+QUERY_SIZE = 8
+
+CONTAINER_TYPES: dict[str, type[GameplayTagContainer]] = {
+    "list": GameplayTagContainer,
+    "bitmask": GameplayTagBitmaskContainer,
+}
+
+
+def make_paths(count: int, depth: int, prefix: str = "R") -> list[str]:
+    """
+    Generate `count` distinct tag paths with `depth` segments each.
+
+    Paths share ancestors (4 roots, common middle segments) like real game
+    data, e.g. depth 4: "R1.D1.D2.T5".
+    """
+    paths: list[str] = []
+    for index in range(count):
+        if depth == 1:
+            paths.append(f"{prefix}T{index}")
+            continue
+        middle = [f"D{level}" for level in range(1, depth - 1)]
+        paths.append(".".join([f"{prefix}{index % 4}", *middle, f"T{index}"]))
+    return paths
+
+
+def make_registry(paths: list[str]) -> TagRegistry:
+    """Create and activate a registry holding paths."""
+    registry = TagRegistry()
+    for path in paths:
+        registry.request_tag(path)
+    registry.activate()
+    return registry
+
+
+def bench_registry(runner: BenchmarkRunner) -> None:
+    """Interning, lookups and parent walks."""
+    paths = make_paths(1000, 4)
+
+    def intern() -> None:
+        registry = TagRegistry()
+        for path in paths:
+            registry.request_tag(path)
+
+    runner.run("registry.intern[size=1000,depth=4]", intern, ops=len(paths))
+
+    registry = make_registry(paths)
+    request_tag = registry.request_tag
+
+    def lookup() -> None:
+        for path in paths:
+            request_tag(path)
+
+    runner.run("registry.lookup[size=1000,depth=4]", lookup, ops=len(paths))
+
+    snapshot = registry.freeze()
+    find_tag_id = snapshot.find_tag_id
+
+    def snapshot_lookup() -> None:
+        for path in paths:
+            find_tag_id(path)
+
+    runner.run("snapshot.lookup[size=1000,depth=4]", snapshot_lookup, ops=len(paths))
+
+    for depth in DEPTHS:
+        path = make_paths(1, depth)[0]
+        tag = make_registry([path]).request_tag(path)
+
+        def walk_parents(tag=tag) -> None:
+            parent = tag.get_parent()
+            while parent.is_valid():
+                parent = parent.get_parent()
+
+        runner.run(f"tag.parent_walk[depth={depth}]", walk_parents)
+
+
+def bench_containers(runner: BenchmarkRunner) -> None:
+    """Add/remove and set queries across sizes, depths and container types."""
+    for depth in DEPTHS:
+        for size in SIZES:
+            paths = make_paths(size, depth)
+            misses = make_paths(QUERY_SIZE, depth, prefix="Miss")
+            registry = make_registry(paths + misses)
+            tags = [registry.request_tag(path) for path in paths]
+            ancestors = [tag.get_parent() if tag.get_parent().is_valid() else tag for tag in tags]
+
+            for type_name, container_type in CONTAINER_TYPES.items():
+                params = f"type={type_name},size={size},depth={depth}"
+                container = container_type.from_iterable(tags)
+                miss_query = container_type.from_iterable(registry.request_tag(path) for path in misses)
+                hit_query = container_type.from_iterable(ancestors[:QUERY_SIZE])
+
+                def add_remove(container_type=container_type, tags=tags) -> None:
+                    scratch = container_type()
+                    for tag in tags:
+                        scratch.add_tag(tag)
+                    for tag in tags:
+                        scratch.remove_tag(tag)
+
+                def bulk_add_remove(container_type=container_type, tags=tags) -> None:
+                    scratch = container_type()
+                    scratch.add_tags(tags)
+                    scratch.remove_tags(tags)
+
+                runner.run(f"container.add_remove[{params}]", add_remove, ops=size)
+                runner.run(f"container.bulk_add_remove[{params}]", bulk_add_remove, ops=size)
+
+                # Worst cases: has_any misses and has_all hits scan the whole query
+                runner.run(f"container.has_any[{params}]", lambda c=container, q=miss_query: c.has_any(q))
+                runner.run(f"container.has_all[{params}]", lambda c=container, q=hit_query: c.has_all(q))
+
+
+def bench_serialization(runner: BenchmarkRunner) -> None:
+    """CSV and binary wire-format round-trips."""
+    for size in SIZES:
+        paths = make_paths(size, 4)
+        registry = make_registry(paths)
+
+        for type_name, container_type in CONTAINER_TYPES.items():
+            params = f"type={type_name},size={size}"
+            container = container_type.from_iterable(paths)
+
+            def csv_round_trip(container=container, container_type=container_type) -> None:
+                container_type.from_string(container.to_string())
+
+            def wire_round_trip(container=container, container_type=container_type, registry=registry) -> None:
+                decode_tags(encode_tags(container, registry), registry, container_type)
+
+            runner.run(f"serialize.csv_round_trip[{params}]", csv_round_trip)
+            runner.run(f"serialize.wire_round_trip[{params}]", wire_round_trip)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_arguments(parser, THRESHOLDS_PATH)
+    args = parser.parse_args()
+
+    runner = create_runner(args)
+    print("Running tag benchmarks...", file=sys.stderr)
+    bench_registry(runner)
+    bench_containers(runner)
+    bench_serialization(runner)
+    return finish("tags", runner, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,251 @@
+"""
+Minimal benchmark harness shared by the backend benchmark scripts.
+
+Each benchmark is a zero-argument callable that performs `ops` operations.
+The harness calibrates a loop count so one sample takes at least
+`min_time` seconds, takes `repeats` samples and reports nanoseconds per
+operation (median and best). Results are plain dicts so they can be
+written as JSON and compared against thresholds or a previous run.
+
+Result JSON layout:
+    {
+      "suite": "tags",
+      "python": "3.12.3",
+      "results": [
+        {"name": "container.has_any[type=bitmask,size=100,depth=4]",
+         "ns_per_op": 85.2, "best_ns_per_op": 83.9, "ops": 1, "loops": 4096}
+      ],
+      "regressions": [
+        {"name": "...", "value": 120.4, "limit": 100.0, "source": "threshold"}
+      ]
+    }
+
+The load test (loadtest.py) writes its own report but checks it with the
+same find_regressions()/report_regressions(), so thresholds, --baseline
+and --tolerance behave the same for every suite.
+"""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import json
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+
+@dataclass(slots=True)
+class BenchmarkResult:
+    """Timing for one benchmark case."""
+    name: str
+    ns_per_op: float
+    best_ns_per_op: float
+    ops: int
+    loops: int
+
+
+@dataclass(slots=True)
+class Regression:
+    """A measurement that exceeded its threshold or its baseline tolerance."""
+    name: str
+    value: float
+    limit: float
+    source: str  # "threshold" or "baseline"
+
+
+@dataclass(slots=True)
+class BenchmarkRunner:
+    """
+    Runs benchmark cases and collects results.
+
+    Args (fields):
+        min_time: Minimum seconds per sample
+        repeats: Samples per benchmark (median is reported)
+        name_filter: fnmatch pattern selecting benchmarks to run
+    """
+    min_time: float = 0.02
+    repeats: int = 5
+    name_filter: str = "*"
+    results: list[BenchmarkResult] = field(default_factory=list)
+
+    def run(self, name: str, func: Callable[[], object], ops: int = 1) -> BenchmarkResult | None:
+        """
+        Time func and record the result.
+
+        Args:
+            name: Unique benchmark name, e.g. "registry.lookup[size=1000]"
+            func: Callable performing `ops` operations per call
+            ops: Operations per call (results are reported per operation)
+
+        Returns:
+            Result, or None if the name does not match the filter
+        """
+        if not fnmatch.fnmatchcase(name, self.name_filter):
+            return None
+
+        loops = _calibrate(func, self.min_time)
+        samples = [_time_loops(func, loops) / (loops * ops) for _ in range(self.repeats)]
+        result = BenchmarkResult(
+            name=name,
+            ns_per_op=round(statistics.median(samples), 2),
+            best_ns_per_op=round(min(samples), 2),
+            ops=ops,
+            loops=loops,
+        )
+        self.results.append(result)
+        print(f"  {name:<60} {result.ns_per_op:>12,.1f} ns/op", file=sys.stderr)
+        return result
+
+
+def _time_loops(func: Callable[[], object], loops: int) -> int:
+    """Run func `loops` times and return elapsed nanoseconds."""
+    start = time.perf_counter_ns()
+    for _ in range(loops):
+        func()
+    return time.perf_counter_ns() - start
+
+
+def _calibrate(func: Callable[[], object], min_time: float) -> int:
+    """Find a loop count (power of two) whose run takes at least min_time."""
+    target_ns = min_time * 1e9
+    loops = 1
+    while True:
+        if _time_loops(func, loops) >= target_ns or loops >= 1 << 24:
+            return loops
+        loops *= 2
+
+
+def find_regressions(
+    values: Mapping[str, float],
+    thresholds: dict[str, float],
+    baseline: Mapping[str, float] | None = None,
+    tolerance: float = 0.25,
+) -> list[Regression]:
+    """
+    Compare measurements against absolute thresholds and an optional baseline.
+
+    Args:
+        values: Measurement name -> value (ns/op for benchmarks, ms for the load test)
+        thresholds: fnmatch pattern -> max value (first matching pattern wins)
+        baseline: Measurement name -> value from a previous run
+        tolerance: Allowed slowdown relative to the baseline (0.25 = 25%)
+
+    Returns:
+        Regressions found (empty if everything is within limits)
+    """
+    regressions: list[Regression] = []
+    for name, value in values.items():
+        for pattern, limit in thresholds.items():
+            if fnmatch.fnmatchcase(name, pattern):
+                if value > limit:
+                    regressions.append(Regression(name, value, limit, "threshold"))
+                break
+
+        if baseline and name in baseline:
+            limit = baseline[name] * (1 + tolerance)
+            if value > limit:
+                regressions.append(Regression(name, value, round(limit, 2), "baseline"))
+    return regressions
+
+
+def add_regression_arguments(
+    parser: argparse.ArgumentParser,
+    default_thresholds: Path,
+    unit: str = "ns/op",
+) -> None:
+    """Add the report and regression-check options shared by every suite."""
+    parser.add_argument("--output", type=Path, help="Write JSON results to this file (default: stdout)")
+    parser.add_argument("--thresholds", type=Path, default=default_thresholds,
+                        help=f"JSON file of pattern -> max {unit}")
+    parser.add_argument("--baseline", type=Path, help="Previous JSON results to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed slowdown vs. baseline (default 0.25 = 25%%)")
+    parser.add_argument("--check", action="store_true",
+                        help="Exit with status 1 if any regression is found")
+
+
+def add_arguments(parser: argparse.ArgumentParser, default_thresholds: Path) -> None:
+    """Add the common benchmark command-line options."""
+    parser.add_argument("--filter", default="*", help="fnmatch pattern selecting benchmarks")
+    parser.add_argument("--quick", action="store_true", help="Fewer, shorter samples (smoke run)")
+    add_regression_arguments(parser, default_thresholds)
+
+
+def create_runner(args: argparse.Namespace) -> BenchmarkRunner:
+    """Create a runner configured from parsed arguments."""
+    if args.quick:
+        return BenchmarkRunner(min_time=0.002, repeats=3, name_filter=args.filter)
+    return BenchmarkRunner(name_filter=args.filter)
+
+
+def report_regressions(
+    report: dict[str, Any],
+    values: Mapping[str, float],
+    read_values: Callable[[dict[str, Any]], Mapping[str, float]],
+    args: argparse.Namespace,
+) -> int:
+    """
+    Check regressions, add them to the report, write it and compute the exit status.
+
+    Args:
+        report: Suite report (gets a "regressions" list)
+        values: Measurement name -> value for this run
+        read_values: Extracts the same mapping from a previous report (--baseline)
+        args: Parsed arguments (see add_regression_arguments)
+
+    Returns:
+        Process exit status (1 if --check and regressions were found)
+    """
+    thresholds: dict[str, float] = {}
+    if args.thresholds and args.thresholds.exists():
+        thresholds = json.loads(args.thresholds.read_text())
+
+    baseline: Mapping[str, float] | None = None
+    if args.baseline:
+        baseline = read_values(json.loads(args.baseline.read_text()))
+
+    regressions = find_regressions(values, thresholds, baseline, args.tolerance)
+    report["regressions"] = [asdict(regression) for regression in regressions]
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n")
+    else:
+        print(text)
+
+    for regression in regressions:
+        print(
+            f"REGRESSION ({regression.source}): {regression.name} "
+            f"{regression.value:,.1f} > {regression.limit:,.1f}",
+            file=sys.stderr,
+        )
+
+    return 1 if args.check and regressions else 0
+
+
+def _read_result_values(report: dict[str, Any]) -> dict[str, float]:
+    """Benchmark name -> ns/op from a report written by finish()."""
+    return {entry["name"]: entry["ns_per_op"] for entry in report["results"]}
+
+
+def finish(suite: str, runner: BenchmarkRunner, args: argparse.Namespace) -> int:
+    """
+    Check regressions, write the JSON report and compute the exit status.
+
+    Returns:
+        Process exit status (1 if --check and regressions were found)
+    """
+    report: dict[str, Any] = {
+        "suite": suite,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": [asdict(result) for result in runner.results],
+    }
+    values = {result.name: result.ns_per_op for result in runner.results}
+    return report_regressions(report, values, _read_result_values, args)
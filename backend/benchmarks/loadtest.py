@@ -0,0 +1,458 @@
+#!/usr/bin/env python3
+"""
+Load test for matchmaking and game sessions.
+
+Usage (from backend directory, with backend venv activated):
+    python benchmarks/loadtest.py --clients 2000
+    python benchmarks/loadtest.py --clients 200 --pings 5 --output load.json
+    python benchmarks/loadtest.py --url ws://127.0.0.1:8000 --clients 500
+
+Each simulated client queues on /ws/matchmaking, waits for match_found,
+joins /ws/game/{match_id}, exchanges pings with its opponent and
+disconnects. The players in a match take turns: the one whose name sorts
+first sends a ping, and the opponent answers each `pinged` with a ping of
+its own. The round trip is client -> server -> opponent -> server -> client.
+Heartbeats are acknowledged along the way.
+
+By default the app runs in this process: the clients drive the ASGI app
+directly, with no sockets and no uvicorn. Server settings come from the
+environment as usual, e.g. MATCHMAKING_TICK_MS=50. With --url the clients
+connect to a running server instead. This needs the `websockets` package.
+
+Reported (JSON, for regression tracking):
+- time_to_match: connect to /ws/matchmaking until match_found
+- join: connect to /ws/game until game_ready (both players must join)
+- round_trip: ping until the opponent's answering pinged
+- memory per session (in-process only): growth of RSS, and of the Python
+  heap with --tracemalloc, between startup and the moment every client has
+  joined its game. It includes the in-process clients' own connection state.
+
+Regressions are checked with the benchmark harness (harness.py), on
+"metric.stat" names in milliseconds (e.g. "round_trip.p99") plus "failed"
+(clients that errored or timed out). --thresholds takes a JSON file of
+pattern -> max value, --baseline compares against a previous report
+(--tolerance, default 25%), and --check exits with status 1 on any
+regression.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import gc
+import json
+import logging
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlencode
+
+from harness import add_regression_arguments, report_regressions
+
+# Paths - script is in backend/benchmarks/
+SCRIPT_DIR = Path(__file__).parent
+BACKEND_SRC = SCRIPT_DIR.parent / "src"
+THRESHOLDS_PATH = SCRIPT_DIR / "loadtest_thresholds.json"
+
+sys.path.insert(0, str(BACKEND_SRC))
+
+try:
+    import websockets
+except ImportError:  # Only needed for --url
+    websockets = None
+
+DEFAULT_ORIGIN = "http://localhost:5173"
+METRICS = ("time_to_match", "join", "round_trip")
+
+
+class SocketClosed(Exception):
+    """The server closed the WebSocket."""
+
+    def __init__(self, code: int | None) -> None:
+        super().__init__(f"closed with code {code}")
+        self.code = code
+
+
+class AsgiWebSocket:
+    """Client end of a WebSocket served in-process by an ASGI app."""
+
+    def __init__(self, app: Any, path: str, query: dict[str, str], origin: str) -> None:
+        self._app = app
+        self._path = path
+        self._query = query
+        self._origin = origin
+        self._to_app: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+        self._from_app: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+        self._task: asyncio.Task[None] | None = None
+
+    async def connect(self) -> None:
+        scope = {
+            "type": "websocket",
+            "asgi": {"version": "3.0"},
+            "scheme": "ws",
+            "http_version": "1.1",
+            "path": self._path,
+            "raw_path": self._path.encode(),
+            "root_path": "",
+            "query_string": urlencode(self._query).encode(),
+            "headers": [(b"host", b"loadtest"), (b"origin", self._origin.encode())],
+            "client": ("127.0.0.1", 0),
+            "server": ("loadtest", 80),
+            "subprotocols": [],
+            "state": {},
+        }
+        self._task = asyncio.create_task(self._app(scope, self._to_app.get, self._from_app.put))
+        self._to_app.put_nowait({"type": "websocket.connect"})
+
+        message = await self._from_app.get()
+        if message["type"] == "websocket.close":
+            raise SocketClosed(message.get("code"))
+
+    async def send_json(self, payload: dict[str, Any]) -> None:
+        self._to_app.put_nowait({"type": "websocket.receive", "text": json.dumps(payload)})
+
+    async def receive_json(self) -> dict[str, Any]:
+        message = await self._from_app.get()
+        if message["type"] == "websocket.close":
+            raise SocketClosed(message.get("code"))
+        return json.loads(message["text"])
+
+    async def close(self) -> None:
+        if self._task is None:
+            return
+        self._to_app.put_nowait({"type": "websocket.disconnect", "code": 1000})
+        with contextlib.suppress(Exception):
+            await asyncio.wait_for(self._task, timeout=5)
+        self._task = None
+
+
+class RemoteWebSocket:
+    """Client WebSocket to a running server (needs the websockets package)."""
+
+    def __init__(self, base_url: str, path: str, query: dict[str, str], origin: str) -> None:
+        self._url = f"{base_url.rstrip('/')}{path}?{urlencode(query)}"
+        self._origin = origin
+        self._socket: Any = None
+
+    async def connect(self) -> None:
+        self._socket = await websockets.connect(self._url, origin=self._origin, open_timeout=30)
+
+    async def send_json(self, payload: dict[str, Any]) -> None:
+        await self._socket.send(json.dumps(payload))
+
+    async def receive_json(self) -> dict[str, Any]:
+        try:
+            return json.loads(await self._socket.recv())
+        except websockets.ConnectionClosed as error:
+            raise SocketClosed(error.rcvd.code if error.rcvd else None) from None
+
+    async def close(self) -> None:
+        if self._socket is not None:
+            await self._socket.close()
+            self._socket = None
+
+
+# (path, query) -> unconnected client socket
+SocketFactory = Callable[[str, dict[str, str]], "AsgiWebSocket | RemoteWebSocket"]
+
+
+class Rendezvous:
+    """Lets the runner sample memory once every client has joined, then releases them."""
+
+    def __init__(self, parties: int) -> None:
+        self._waiting = parties
+        self.all_arrived = asyncio.Event()
+        self.released = asyncio.Event()
+        if parties == 0:
+            self.all_arrived.set()
+
+    def arrive(self) -> None:
+        self._waiting -= 1
+        if self._waiting == 0:
+            self.all_arrived.set()
+
+
+@dataclass(slots=True)
+class ClientResult:
+    time_to_match: float | None = None
+    join: float | None = None
+    round_trips: list[float] = field(default_factory=list)
+    error: str | None = None
+
+
+async def receive_game_message(socket: AsgiWebSocket | RemoteWebSocket) -> dict[str, Any]:
+    """Next game message, answering heartbeats on the way."""
+    while True:
+        message = await socket.receive_json()
+        if message["type"] != "heartbeat":
+            return message
+        await socket.send_json({"type": "heartbeat_ack", "id": message["id"]})
+
+
+def expect(message: dict[str, Any], message_type: str) -> dict[str, Any]:
+    if message["type"] != message_type:
+        raise RuntimeError(f"expected {message_type}, got {message['type']}")
+    return message
+
+
+async def run_client(
+    index: int,
+    create_socket: SocketFactory,
+    pings: int,
+    rendezvous: Rendezvous,
+    result: ClientResult,
+) -> None:
+    name = f"load-{index:06d}"
+    arrived = False
+    try:
+        started = time.perf_counter()
+        queue = create_socket("/ws/matchmaking", {"name": name, "elemental": "fire"})
+        await queue.connect()
+        try:
+            expect(await queue.receive_json(), "status")
+            found = expect(await queue.receive_json(), "match_found")
+            result.time_to_match = time.perf_counter() - started
+        finally:
+            await queue.close()
+
+        started = time.perf_counter()
+        game = create_socket(f"/ws/game/{found['match_id']}", {"token": found["player_token"]})
+        await game.connect()
+        try:
+            ready = expect(await receive_game_message(game), "game_ready")
+            result.join = time.perf_counter() - started
+
+            rendezvous.arrive()
+            arrived = True
+            await rendezvous.released.wait()
+
+            if name < ready["opponent"]:
+                for _ in range(pings):
+                    sent = time.perf_counter()
+                    await game.send_json({"type": "ping"})
+                    expect(await receive_game_message(game), "pinged")
+                    result.round_trips.append(time.perf_counter() - sent)
+            else:
+                for _ in range(pings):
+                    expect(await receive_game_message(game), "pinged")
+                    await game.send_json({"type": "ping"})
+        finally:
+            await game.close()
+    finally:
+        if not arrived:
+            rendezvous.arrive()
+
+
+async def run_client_with_timeout(
+    index: int,
+    create_socket: SocketFactory,
+    pings: int,
+    rendezvous: Rendezvous,
+    ramp_delay: float,
+    timeout: float,
+) -> ClientResult:
+    result = ClientResult()
+    await asyncio.sleep(ramp_delay)
+    try:
+        await asyncio.wait_for(run_client(index, create_socket, pings, rendezvous, result), timeout=timeout)
+    except TimeoutError:
+        result.error = "timeout"
+    except Exception as error:
+        result.error = f"{type(error).__name__}: {error}"
+    return result
+
+
+@contextlib.asynccontextmanager
+async def run_lifespan(app: Any) -> AsyncIterator[None]:
+    """Run the ASGI lifespan protocol (startup on enter, shutdown on exit)."""
+    to_app: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+    from_app: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+    task = asyncio.create_task(app({"type": "lifespan", "asgi": {"version": "3.0"}, "state": {}}, to_app.get, from_app.put))
+
+    to_app.put_nowait({"type": "lifespan.startup"})
+    message = await from_app.get()
+    if message["type"] != "lifespan.startup.complete":
+        raise RuntimeError(f"app startup failed: {message.get('message')}")
+    try:
+        yield
+    finally:
+        to_app.put_nowait({"type": "lifespan.shutdown"})
+        await from_app.get()
+        await task
+
+
+def read_rss_bytes() -> int | None:
+    """Resident set size of this process (Linux), or None if unavailable."""
+    try:
+        resident_pages = int(Path("/proc/self/statm").read_text().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
+
+
+@dataclass(slots=True)
+class MemorySample:
+    rss: int | None
+    traced: int | None
+
+    @classmethod
+    def take(cls) -> MemorySample:
+        gc.collect()
+        traced = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None
+        return cls(rss=read_rss_bytes(), traced=traced)
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    rank = max(1, -(-len(sorted_values) * fraction // 1))
+    return sorted_values[int(rank) - 1]
+
+
+def summarize(seconds: list[float]) -> dict[str, float | int] | None:
+    """Count, mean, p50/p95/p99 and max in milliseconds."""
+    if not seconds:
+        return None
+    values = sorted(value * 1000 for value in seconds)
+    return {
+        "count": len(values),
+        "mean": round(sum(values) / len(values), 3),
+        "p50": round(percentile(values, 0.50), 3),
+        "p95": round(percentile(values, 0.95), 3),
+        "p99": round(percentile(values, 0.99), 3),
+        "max": round(values[-1], 3),
+    }
+
+
+async def run_load(args: argparse.Namespace) -> dict[str, Any]:
+    rendezvous = Rendezvous(args.clients)
+    memory: dict[str, Any] | None = None
+
+    async def drive(create_socket: SocketFactory, on_all_joined: Callable[[], None]) -> list[ClientResult]:
+        tasks = [
+            asyncio.create_task(
+                run_client_with_timeout(
+                    index,
+                    create_socket,
+                    args.pings,
+                    rendezvous,
+                    ramp_delay=args.ramp_seconds * index / args.clients,
+                    timeout=args.timeout,
+                )
+            )
+            for index in range(args.clients)
+        ]
+        await rendezvous.all_arrived.wait()
+        on_all_joined()
+        rendezvous.released.set()
+        return await asyncio.gather(*tasks)
+
+    started = time.perf_counter()
+    if args.url:
+        results = await drive(
+            lambda path, query: RemoteWebSocket(args.url, path, query, args.origin),
+            lambda: None,
+        )
+    else:
+        # Imported here so --url runs do not need the server's dependencies
+        from zc_api.config import settings
+        from zc_api.main import create_app
+
+        logging.getLogger("zc_api").setLevel(logging.INFO if args.verbose else logging.WARNING)
+        app = create_app()
+        origin = settings.allowed_origins[0] if settings.allowed_origins else DEFAULT_ORIGIN
+
+        if args.tracemalloc:
+            tracemalloc.start()
+        async with run_lifespan(app):
+            baseline = MemorySample.take()
+            joined: list[MemorySample] = []
+            results = await drive(
+                lambda path, query: AsgiWebSocket(app, path, query, origin),
+                lambda: joined.append(MemorySample.take()),
+            )
+        if args.tracemalloc:
+            tracemalloc.stop()
+
+        sessions = sum(1 for result in results if result.join is not None) // 2
+        memory = {"sessions": sessions, "rss_bytes_per_session": None, "traced_bytes_per_session": None}
+        if sessions and joined:
+            for key, before, after in (
+                ("rss_bytes_per_session", baseline.rss, joined[0].rss),
+                ("traced_bytes_per_session", baseline.traced, joined[0].traced),
+            ):
+                if before is not None and after is not None:
+                    memory[key] = round((after - before) / sessions)
+    elapsed = time.perf_counter() - started
+
+    errors = Counter(result.error for result in results if result.error is not None)
+    return {
+        "suite": "loadtest",
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "target": args.url or "in-process",
+        "clients": args.clients,
+        "pings": args.pings,
+        "ramp_seconds": args.ramp_seconds,
+        "completed": args.clients - sum(errors.values()),
+        "failed": sum(errors.values()),
+        "errors": dict(errors.most_common(10)),
+        "duration_seconds": round(elapsed, 3),
+        "latency_ms": {
+            "time_to_match": summarize([r.time_to_match for r in results if r.time_to_match is not None]),
+            "join": summarize([r.join for r in results if r.join is not None]),
+            "round_trip": summarize([rtt for r in results for rtt in r.round_trips]),
+        },
+        "memory": memory,
+    }
+
+
+def get_checked_values(report: dict[str, Any]) -> dict[str, float]:
+    """Failed clients and every latency stat ("round_trip.p99" -> ms) of a report."""
+    values: dict[str, float] = {"failed": report["failed"]}
+    for metric in METRICS:
+        for stat, value in (report["latency_ms"].get(metric) or {}).items():
+            if stat != "count":
+                values[f"{metric}.{stat}"] = value
+    return values
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=1000, help="Simulated players (even)")
+    parser.add_argument("--pings", type=int, default=10, help="Round trips per match")
+    parser.add_argument("--ramp-seconds", type=float, default=0.0, help="Spread client starts over this long")
+    parser.add_argument("--timeout", type=float, default=120.0, help="Per-client timeout in seconds")
+    parser.add_argument("--url", help="Server base URL (ws://host:port); default runs the app in-process")
+    parser.add_argument("--origin", default=DEFAULT_ORIGIN, help="Origin header for --url")
+    parser.add_argument("--tracemalloc", action="store_true",
+                        help="Also report Python heap per session (slows the run)")
+    parser.add_argument("--verbose", action="store_true", help="Keep the server's INFO logs")
+    add_regression_arguments(parser, THRESHOLDS_PATH, unit="ms")
+    args = parser.parse_args()
+
+    if args.clients < 2 or args.clients % 2:
+        parser.error("--clients must be an even number >= 2")
+    if args.url and websockets is None:
+        parser.error("--url needs the websockets package (pip install websockets)")
+
+    print(f"Running {args.clients} clients against {args.url or 'the in-process app'}...", file=sys.stderr)
+    report = asyncio.run(run_load(args))
+
+    for metric in METRICS:
+        stats = report["latency_ms"][metric]
+        if stats is not None:
+            print(f"  {metric:<14} p50 {stats['p50']:>9.2f} ms  p95 {stats['p95']:>9.2f} ms  "
+                  f"p99 {stats['p99']:>9.2f} ms", file=sys.stderr)
+    return report_regressions(report, get_checked_values(report), get_checked_values, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
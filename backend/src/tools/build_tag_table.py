@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Build the binary gameplay tag table from game data.
+
+Usage (from backend directory, with backend venv activated):
+    python src/tools/build_tag_table.py
+
+This script:
+1. Collects every gameplay tag referenced by game_data/**/*.json
+2. Registers them in sorted order (deterministic tag IDs)
+3. Writes game_data/tags.bin, which the server memory-maps at startup,
+   recording a hash of the JSON files so the server can detect a stale table
+
+Run this whenever game data tags change, then commit game_data/tags.bin.
+The printed checksum identifies the tag ID assignment; clients and servers
+using tables with the same checksum agree on every tag ID.
+"""
+
+import sys
+from pathlib import Path
+
+# Paths - script is in backend/src/tools/
+SCRIPT_DIR = Path(__file__).parent
+BACKEND_SRC = SCRIPT_DIR.parent  # backend/src
+
+
+def main() -> None:
+    print("=" * 50)
+    print("Building gameplay tag table")
+    print("=" * 50)
+
+    # Import here so script can show usage even if backend not installed
+    sys.path.insert(0, str(BACKEND_SRC))
+    from zc_api.game_manager.data_loader import (
+        GAME_DATA_DIR,
+        TAG_TABLE_PATH,
+        build_tag_registry,
+        collect_gameplay_tags,
+        hash_game_data_sources,
+    )
+
+    tag_paths = collect_gameplay_tags()
+    print(f"Collected {len(tag_paths)} tags from {GAME_DATA_DIR}")
+
+    registry = build_tag_registry(tag_paths)
+    snapshot = registry.freeze()
+    snapshot.save(TAG_TABLE_PATH, source_digest=hash_game_data_sources())
+
+    print(f"  Tags (incl. parents): {snapshot.get_tag_count()}")
+    print(f"  Checksum: {snapshot.get_checksum()}")
+    print(f"  Written to: {TAG_TABLE_PATH}")
+
+
+if __name__ == "__main__":
+    main()
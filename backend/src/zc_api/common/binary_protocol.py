@@ -0,0 +1,348 @@
+"""
+Schema-driven binary encoding for WebSocket messages.
+
+An alternative to JSON text frames, negotiated per connection through the
+"zc.bin.v1" WebSocket subprotocol. Each message is a binary frame:
+
+    [type id: varint] [fields in model declaration order]
+
+Type IDs and field layouts are generated from the pydantic models (union
+member order), so adding a message or field at the end of a model keeps
+existing IDs. GET /protocol/binary publishes the generated schema for clients.
+
+Field encodings:
+- Literal with one value (the "type" discriminator): omitted
+- Literal with several values: varint index into the options
+- str: varint byte length + UTF-8
+- int: zigzag varint
+- float: 8-byte little-endian double
+- bool: 1 byte
+- list[X]: varint count + items
+- X | None: 1 presence byte + X
+- nested BaseModel: its fields inline
+
+Example:
+    >>> data = SESSION_PROTOCOL.encode(ServerPinged(type="pinged"))   # b'\\x01\\x00' (type ID, seq)
+    >>> SESSION_PROTOCOL.decode(data)                                 # ServerPinged(seq=0, type='pinged')
+"""
+from __future__ import annotations
+
+import struct
+import types
+import typing
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, Literal, Union
+
+from pydantic import BaseModel
+
+BINARY_SUBPROTOCOL = "zc.bin.v1"
+
+_DOUBLE = struct.Struct("<d")
+# Enough for any 64-bit value; longer runs of continuation bytes are rejected
+_MAX_VARINT_BYTES = 10
+
+# Field encoder appends to the buffer; decoder returns (value, next position)
+Encoder = Callable[[bytearray, Any], None]
+Decoder = Callable[[memoryview, int], tuple[Any, int]]
+
+
+class BinaryProtocolError(ValueError):
+    """Raised when a binary frame is malformed or has an unknown type ID."""
+    pass
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(view: memoryview, pos: int) -> tuple[int, int]:
+    result = 0
+    shift = 0
+    end = pos + _MAX_VARINT_BYTES
+    while True:
+        if pos >= len(view):
+            raise BinaryProtocolError("Frame is truncated")
+        if pos >= end:
+            raise BinaryProtocolError("Varint is too long")
+        byte = view[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+
+
+def _encode_str(out: bytearray, value: str) -> None:
+    raw = value.encode()
+    _write_varint(out, len(raw))
+    out += raw
+
+
+def _decode_str(view: memoryview, pos: int) -> tuple[str, int]:
+    length, pos = _read_varint(view, pos)
+    end = pos + length
+    if end > len(view):
+        raise BinaryProtocolError("Frame is truncated")
+    return bytes(view[pos:end]).decode(), end
+
+
+def _encode_int(out: bytearray, value: int) -> None:
+    _write_varint(out, (value << 1) if value >= 0 else ((-value << 1) - 1))
+
+
+def _decode_int(view: memoryview, pos: int) -> tuple[int, int]:
+    raw, pos = _read_varint(view, pos)
+    return (raw >> 1) if not raw & 1 else -((raw + 1) >> 1), pos
+
+
+def _encode_float(out: bytearray, value: float) -> None:
+    out += _DOUBLE.pack(value)
+
+
+def _decode_float(view: memoryview, pos: int) -> tuple[float, int]:
+    if pos + 8 > len(view):
+        raise BinaryProtocolError("Frame is truncated")
+    return _DOUBLE.unpack_from(view, pos)[0], pos + 8
+
+
+def _encode_bool(out: bytearray, value: bool) -> None:
+    out.append(1 if value else 0)
+
+
+def _decode_bool(view: memoryview, pos: int) -> tuple[bool, int]:
+    if pos >= len(view):
+        raise BinaryProtocolError("Frame is truncated")
+    return view[pos] != 0, pos + 1
+
+
+@dataclass(slots=True)
+class _FieldCodec:
+    name: str
+    kind: str  # Published in the schema
+    encode: Encoder | None  # None for constant literals
+    decode: Decoder | None
+    constant: Any = None
+
+
+class MessageSchema:
+    """Compiled field layout for one pydantic model."""
+
+    __slots__ = ('type_id', 'model', 'type_name', '_fields')
+
+    def __init__(self, type_id: int, model: type[BaseModel]) -> None:
+        self.type_id = type_id
+        self.model = model
+        self.type_name = _discriminator(model)
+        self._fields = [_compile_field(name, info.annotation) for name, info in model.model_fields.items()]
+
+    def encode_fields(self, out: bytearray, message: BaseModel) -> None:
+        for field in self._fields:
+            if field.encode is not None:
+                field.encode(out, getattr(message, field.name))
+
+    def decode_fields(self, view: memoryview, pos: int) -> tuple[BaseModel, int]:
+        values: dict[str, Any] = {}
+        for field in self._fields:
+            if field.decode is None:
+                values[field.name] = field.constant
+            else:
+                values[field.name], pos = field.decode(view, pos)
+        # Values were produced from the schema, so skip re-validation
+        return self.model.model_construct(**values), pos
+
+    def describe(self) -> dict[str, Any]:
+        return {
+            "id": self.type_id,
+            "type": self.type_name,
+            "fields": [{"name": field.name, "kind": field.kind} for field in self._fields],
+        }
+
+
+class BinaryProtocol:
+    """
+    Message registry mapping models <-> type IDs, with encode/decode.
+
+    Models must declare a `type` Literal discriminator.
+    """
+
+    __slots__ = ('_by_model', '_by_id', '_by_type_name')
+
+    def __init__(self, models: list[type[BaseModel]]) -> None:
+        self._by_model: dict[type[BaseModel], MessageSchema] = {}
+        self._by_id: list[MessageSchema] = []
+        self._by_type_name: dict[str, MessageSchema] = {}
+        for model in models:
+            if model in self._by_model:
+                continue
+            schema = MessageSchema(len(self._by_id), model)
+            self._by_model[model] = schema
+            self._by_id.append(schema)
+            self._by_type_name[schema.type_name] = schema
+
+    @classmethod
+    def from_unions(cls, *unions: Any) -> BinaryProtocol:
+        """Build a protocol from message unions (or single models), in order."""
+        models: list[type[BaseModel]] = []
+        for union in unions:
+            members = typing.get_args(union) if typing.get_origin(union) in (Union, types.UnionType) else (union,)
+            models.extend(members)
+        return cls(models)
+
+    def encode(self, message: BaseModel | dict[str, Any]) -> bytes:
+        """
+        Encode a message to a binary frame.
+
+        Dicts are validated against the model registered for their "type".
+
+        Raises:
+            BinaryProtocolError: If the message type is not registered
+        """
+        if isinstance(message, dict):
+            schema = self._by_type_name.get(message.get("type", ""))
+            if schema is None:
+                raise BinaryProtocolError(f"Unknown message type: {message.get('type')!r}")
+            message = schema.model.model_validate(message)
+        else:
+            schema = self._by_model.get(type(message))
+            if schema is None:
+                raise BinaryProtocolError(f"Unregistered message model: {type(message).__name__}")
+
+        out = bytearray()
+        _write_varint(out, schema.type_id)
+        schema.encode_fields(out, message)
+        return bytes(out)
+
+    def decode(self, data: bytes | memoryview) -> BaseModel:
+        """
+        Decode a binary frame.
+
+        Raises:
+            BinaryProtocolError: If the frame is malformed or the type ID is unknown
+        """
+        view = memoryview(data)
+        type_id, pos = _read_varint(view, 0)
+        if type_id >= len(self._by_id):
+            raise BinaryProtocolError(f"Unknown message type ID: {type_id}")
+
+        try:
+            message, pos = self._by_id[type_id].decode_fields(view, pos)
+        except (UnicodeDecodeError, IndexError) as error:
+            raise BinaryProtocolError("Malformed frame") from error
+        if pos != len(view):
+            raise BinaryProtocolError("Trailing bytes after message")
+        return message
+
+    def describe(self) -> list[dict[str, Any]]:
+        """Generated schema (type IDs and field layouts) for client codegen."""
+        return [schema.describe() for schema in self._by_id]
+
+
+def _discriminator(model: type[BaseModel]) -> str:
+    annotation = model.model_fields["type"].annotation if "type" in model.model_fields else None
+    options = typing.get_args(annotation) if typing.get_origin(annotation) is Literal else ()
+    if len(options) != 1:
+        raise TypeError(f"{model.__name__} needs a single-value Literal 'type' field")
+    return options[0]
+
+
+def _compile_field(name: str, annotation: Any) -> _FieldCodec:
+    """Build the encoder/decoder for one field annotation."""
+    origin = typing.get_origin(annotation)
+
+    if origin is Literal:
+        options = typing.get_args(annotation)
+        if len(options) == 1:
+            return _FieldCodec(name, f"const:{options[0]}", None, None, options[0])
+        index = {option: position for position, option in enumerate(options)}
+
+        def encode_literal(out: bytearray, value: Any) -> None:
+            _write_varint(out, index[value])
+
+        def decode_literal(view: memoryview, pos: int) -> tuple[Any, int]:
+            position, pos = _read_varint(view, pos)
+            if position >= len(options):
+                raise BinaryProtocolError(f"Invalid option index for {name}")
+            return options[position], pos
+
+        return _FieldCodec(name, "enum:" + "|".join(map(str, options)), encode_literal, decode_literal)
+
+    if origin in (Union, types.UnionType):
+        members = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(members) != 1:
+            raise TypeError(f"Field {name}: only 'X | None' unions are supported")
+        inner = _compile_field(name, members[0])
+        assert inner.encode is not None and inner.decode is not None
+        inner_encode, inner_decode = inner.encode, inner.decode
+
+        def encode_optional(out: bytearray, value: Any) -> None:
+            if value is None:
+                out.append(0)
+            else:
+                out.append(1)
+                inner_encode(out, value)
+
+        def decode_optional(view: memoryview, pos: int) -> tuple[Any, int]:
+            present, pos = _decode_bool(view, pos)
+            return inner_decode(view, pos) if present else (None, pos)
+
+        return _FieldCodec(name, f"optional:{inner.kind}", encode_optional, decode_optional)
+
+    if origin is list:
+        (item_annotation,) = typing.get_args(annotation)
+        item = _compile_field(name, item_annotation)
+        assert item.encode is not None and item.decode is not None
+        item_encode, item_decode = item.encode, item.decode
+
+        def encode_list(out: bytearray, value: list[Any]) -> None:
+            _write_varint(out, len(value))
+            for entry in value:
+                item_encode(out, entry)
+
+        def decode_list(view: memoryview, pos: int) -> tuple[list[Any], int]:
+            count, pos = _read_varint(view, pos)
+            # Each item takes at least one byte (no list holds a field-less model)
+            if count > len(view) - pos:
+                raise BinaryProtocolError("Frame is truncated")
+            items = []
+            for _ in range(count):
+                entry, pos = item_decode(view, pos)
+                items.append(entry)
+            return items, pos
+
+        return _FieldCodec(name, f"list:{item.kind}", encode_list, decode_list)
+
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        nested = [_compile_field(field_name, info.annotation) for field_name, info in annotation.model_fields.items()]
+        nested_model = annotation
+
+        def encode_model(out: bytearray, value: BaseModel) -> None:
+            for field in nested:
+                if field.encode is not None:
+                    field.encode(out, getattr(value, field.name))
+
+        def decode_model(view: memoryview, pos: int) -> tuple[BaseModel, int]:
+            values: dict[str, Any] = {}
+            for field in nested:
+                if field.decode is None:
+                    values[field.name] = field.constant
+                else:
+                    values[field.name], pos = field.decode(view, pos)
+            return nested_model.model_construct(**values), pos
+
+        return _FieldCodec(name, f"model:{annotation.__name__}", encode_model, decode_model)
+
+    scalars: dict[Any, tuple[str, Encoder, Decoder]] = {
+        str: ("str", _encode_str, _decode_str),
+        bool: ("bool", _encode_bool, _decode_bool),
+        int: ("int", _encode_int, _decode_int),
+        float: ("float", _encode_float, _decode_float),
+    }
+    if annotation in scalars:
+        kind, encode, decode = scalars[annotation]
+        return _FieldCodec(name, kind, encode, decode)
+
+    raise TypeError(f"Field {name}: unsupported annotation {annotation!r}")
@@ -0,0 +1,112 @@
+"""
+WebSocket message codec.
+
+Outbound messages used to go model -> model_dump() dict -> send_json()'s
+stdlib json.dumps. The codec serializes pydantic models straight to a JSON
+string with pydantic-core's Rust serializer (no intermediate dict), and
+plain dicts with orjson when it is installed (pip install -e ".[speedups]").
+
+Connections negotiate a MessageFormat (JSON text by default, or the binary
+protocol in zc_api.models.protocol). EncodedMessage encodes a message at
+most once per format, so broadcasts to mixed connections stay encode-once.
+
+Example:
+    >>> await send_model(websocket, ServerPinged(type="pinged"))
+    >>> frame = encode_message({"type": "server_shutdown"})   # '{"type":"server_shutdown"}'
+"""
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # Optional speedup
+    orjson = None
+
+
+class FrameSender(Protocol):
+    async def send_text(self, data: str) -> None: ...
+
+    async def send_bytes(self, data: bytes) -> None: ...
+
+
+def encode_model(model: BaseModel) -> str:
+    """Serialize a pydantic model to a compact JSON text frame."""
+    return model.model_dump_json()
+
+
+def encode_dict(payload: dict[str, Any]) -> str:
+    """Serialize a dict to a compact JSON text frame (same output as send_json)."""
+    if orjson is not None:
+        return orjson.dumps(payload).decode()
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+
+
+def encode_message(message: BaseModel | dict[str, Any]) -> str:
+    """Serialize a model or dict to a JSON text frame."""
+    if isinstance(message, BaseModel):
+        return message.model_dump_json()
+    return encode_dict(message)
+
+
+def get_message_type(message: BaseModel | dict[str, Any]) -> str | None:
+    """Get the "type" discriminator of a model or dict message."""
+    if isinstance(message, BaseModel):
+        return getattr(message, "type", None)
+    return message.get("type")
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class MessageFormat:
+    """Wire format negotiated for a connection."""
+    name: str
+    binary: bool
+    encode: Callable[[BaseModel | dict[str, Any]], str | bytes]
+
+
+JSON_FORMAT = MessageFormat(name="json", binary=False, encode=encode_message)
+
+
+class EncodedMessage:
+    """
+    A message plus its encoded frames, encoded lazily once per format.
+
+    Share one instance across many connections (broadcast, fan-out) or
+    build constant messages once at import.
+    """
+
+    __slots__ = ('message', 'message_type', '_frames')
+
+    def __init__(self, message: BaseModel | dict[str, Any]) -> None:
+        self.message = message
+        self.message_type = get_message_type(message)
+        self._frames: dict[str, str | bytes] = {}
+
+    def frame_for(self, message_format: MessageFormat) -> str | bytes:
+        frame = self._frames.get(message_format.name)
+        if frame is None:
+            frame = self._frames[message_format.name] = message_format.encode(self.message)
+        return frame
+
+
+async def send_model(websocket: FrameSender, model: BaseModel) -> None:
+    """Send a model as a text frame without building an intermediate dict."""
+    await websocket.send_text(model.model_dump_json())
+
+
+async def send_message(
+    websocket: FrameSender,
+    message: BaseModel | dict[str, Any],
+    message_format: MessageFormat = JSON_FORMAT,
+) -> None:
+    """Send a message in the connection's negotiated format."""
+    frame = message_format.encode(message)
+    if isinstance(frame, bytes):
+        await websocket.send_bytes(frame)
+    else:
+        await websocket.send_text(frame)
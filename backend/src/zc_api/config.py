@@ -46,6 +46,67 @@ class Settings(BaseSettings):
 
     allowed_origins: list[str] = []
 
+    # Session registry partitions (power of two). More shards keep per-shard
+    # dicts small and make admin/cleanup passes incremental.
+    session_shard_count: int = Field(default=16, ge=1)
+
+    # Session inactivity TTLs per state, enforced by a timing wheel that
+    # advances every session_expiry_tick_seconds.
+    session_ttl_waiting_seconds: float = Field(default=120, gt=0, description="Created, waiting for both players to join")
+    session_ttl_in_game_seconds: float = Field(default=300, gt=0, description="Both players connected")
+    session_ttl_disconnected_seconds: float = Field(default=60, gt=0, description="A player left mid-game")
+    session_expiry_tick_seconds: float = Field(default=1.0, gt=0)
+
+    # Per-connection outbound queue. When a slow client fills its queue:
+    # drop_oldest discards, coalesce replaces the oldest message of the same
+    # type, disconnect closes the socket (client resyncs on reconnect).
+    outbound_queue_size: int = Field(default=256, ge=1)
+    outbound_overflow_policy: Literal["drop_oldest", "coalesce", "disconnect"] = "disconnect"
+
+    # Bulk notifications (e.g. shutdown): concurrent sends and per-send timeout.
+    fanout_concurrency: int = Field(default=64, ge=1)
+    fanout_send_timeout_seconds: float = Field(default=2.0, gt=0)
+
+    # Recent session messages kept per player so a reconnecting client can
+    # resume from its last seq; older gaps fall back to a resync snapshot.
+    session_replay_buffer_size: int = Field(default=128, ge=1)
+
+    # Server heartbeats: one timer pings every connected player each interval
+    # (RTT shows in /admin/sessions); sockets silent past the timeout are closed.
+    heartbeat_interval_seconds: float = Field(default=5.0, gt=0)
+    heartbeat_timeout_seconds: float = Field(default=15.0, gt=0)
+
+    # Drain mode (SIGUSR1 or POST /admin/drain): stop matchmaking, wait up to
+    # drain_timeout_seconds for in-progress matches, then exit the process.
+    drain_timeout_seconds: float = Field(default=600, gt=0)
+    drain_exit_when_done: bool = True
+
+    # Matchmaking: 0 pairs each player as soon as an opponent is waiting;
+    # otherwise a tick every matchmaking_tick_ms pairs the whole queue at once
+    # and creates the matches in one bulk call (better for very large queues).
+    matchmaking_tick_ms: int = Field(default=0, ge=0)
+
+    # "rated" pairs players by rating (nearest first) within their region and
+    # elemental preferences. The allowed rating gap starts at
+    # matchmaking_rating_window and widens per second waited, up to the max.
+    # Rated matchmaking is always batched (tick defaults to 500 ms).
+    matchmaking_mode: Literal["fifo", "rated"] = "fifo"
+    matchmaking_rating_window: float = Field(default=100, gt=0)
+    matchmaking_rating_widen_per_second: float = Field(default=25, ge=0)
+    matchmaking_rating_window_max: float = Field(default=1000, gt=0)
+
+    # HTTP matchmaking tickets (POST /api/matchmaking/tickets, then long-poll
+    # GET): a ticket not polled for the TTL is cancelled; one poll waits at
+    # most max_wait.
+    matchmaking_ticket_ttl_seconds: float = Field(default=30, gt=0)
+    matchmaking_ticket_max_wait_seconds: float = Field(default=25, gt=0)
+
+    # Session backplane. "memory" keeps matchmaking and sessions in this
+    # process; "unix" shares them between `uvicorn --workers N` processes over
+    # a local socket (the first worker hosts the hub unless one is running).
+    backplane: Literal["memory", "unix"] = "memory"
+    backplane_socket_path: str = "/tmp/zc_backplane.sock"
+
     @field_validator("allowed_origins", mode="before")
     @classmethod
     def ParseOriginsList(cls, value: object, info) -> list[str]:
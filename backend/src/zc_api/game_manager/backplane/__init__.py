@@ -0,0 +1,19 @@
+"""Session backplane - matchmaking, match lookup and message relay across workers."""
+
+from .base import Backplane, MatchmakingConfig, Presence, PresenceHandler, RelayHandler
+from .bus import BusError
+from .hub import BackplaneHub
+from .memory import InMemoryBackplane
+from .unix import UnixBackplane
+
+__all__ = [
+    "Backplane",
+    "MatchmakingConfig",
+    "Presence",
+    "PresenceHandler",
+    "RelayHandler",
+    "BusError",
+    "BackplaneHub",
+    "InMemoryBackplane",
+    "UnixBackplane",
+]
@@ -0,0 +1,48 @@
+"""
+Run the backplane hub standalone, so it outlives any single worker.
+
+Usage:
+    python -m zc_api.game_manager.backplane --socket /tmp/zc_backplane.sock
+    BACKPLANE=unix uvicorn zc_api.main:app --workers 4
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import sys
+
+from zc_api.common.logging import setup_logging
+from zc_api.config import settings
+
+from ..session import SessionTtls
+from .base import MatchmakingConfig
+from .hub import BackplaneHub
+from .unix import acquire_hub_lock
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--socket", default=settings.backplane_socket_path, help="Unix socket path")
+    # Same default as a hub hosted by a worker: matches outlive every session TTL
+    parser.add_argument("--match-ttl", type=float, default=SessionTtls.from_settings(settings).get_longest())
+    args = parser.parse_args()
+
+    setup_logging(log_level=logging.INFO)
+    lock = acquire_hub_lock(args.socket)
+    if lock is None:
+        print(f"A backplane hub is already running for {args.socket}", file=sys.stderr)
+        return 1
+
+    with lock:
+        try:
+            # Pairing mode comes from the same MATCHMAKING_* settings as the workers
+            hub = BackplaneHub(args.socket, args.match_ttl, matchmaking=MatchmakingConfig.from_settings(settings))
+            asyncio.run(hub.serve_forever())
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+"""
+Backplane interface: what GameManager needs to be shared across workers.
+
+With `uvicorn --workers N` each worker has its own event loop, registry and
+sockets. The backplane provides the pieces that must be global:
+
+- Matchmaking: one queue for all workers
+- Match directory: a worker that did not create a match can look up its
+  player slots and build a local GameSession replica
+- Presence: which tokens are connected (on any worker) and whether the
+  game has started
+- Relay: deliver a message to the worker hosting a player's socket
+"""
+from __future__ import annotations
+
+import asyncio
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from zc_api.config import Settings
+
+from ..session import (
+    MatchAssignment,
+    MatchFactory,
+    Matchmaker,
+    MatchPreferences,
+    PlayerSlot,
+    RatedMatchmaker,
+    RatingWindow,
+)
+
+# (match_id, token, payload) -> deliver to the local session
+RelayHandler = Callable[[str, str, dict[str, Any]], Awaitable[None]]
+# (match_id, connected tokens) -> update the local session replica
+PresenceHandler = Callable[[str, frozenset[str]], Awaitable[None]]
+
+
+@dataclass(frozen=True, slots=True)
+class Presence:
+    """Tokens connected to a match across all workers."""
+    connected: frozenset[str]
+    # Both players had been connected before this change (game_ready already sent)
+    was_started: bool
+
+
+@dataclass(frozen=True, slots=True)
+class MatchmakingConfig:
+    """How the backplane's matchmaker pairs players."""
+    # Seconds between batch pairing ticks; None pairs FIFO players immediately
+    tick_interval: float | None = None
+    # Pair by rating, region and elemental preferences (always batched)
+    rating_window: RatingWindow | None = None
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> MatchmakingConfig:
+        rating_window = None
+        if settings.matchmaking_mode == "rated":
+            rating_window = RatingWindow(
+                initial=settings.matchmaking_rating_window,
+                widen_per_second=settings.matchmaking_rating_widen_per_second,
+                maximum=settings.matchmaking_rating_window_max,
+            )
+        return cls(
+            tick_interval=settings.matchmaking_tick_ms / 1000 if settings.matchmaking_tick_ms else None,
+            rating_window=rating_window,
+        )
+
+    def create_matchmaker(self, factory: MatchFactory) -> Matchmaker:
+        if self.rating_window is not None:
+            return RatedMatchmaker(factory, tick_interval=self.tick_interval or 0.5, window=self.rating_window)
+        return Matchmaker(factory, tick_interval=self.tick_interval)
+
+
+class Backplane(ABC):
+    """Cross-worker matchmaking, match directory, presence and message relay."""
+
+    def __init__(self) -> None:
+        self._on_relay: RelayHandler | None = None
+        self._on_presence: PresenceHandler | None = None
+
+    def bind(self, on_relay: RelayHandler, on_presence: PresenceHandler) -> None:
+        """Install the callbacks that deliver relayed messages and presence changes locally."""
+        self._on_relay = on_relay
+        self._on_presence = on_presence
+
+    async def start(self) -> None:  # noqa: B027 - optional hook; in-process backplanes need no setup
+        """Connect to the bus. Call on app startup."""
+        pass
+
+    async def stop(self) -> None:  # noqa: B027 - optional hook, see start()
+        """Disconnect from the bus. Call on app shutdown."""
+        pass
+
+    def get_dependent_worker_count(self) -> int:
+        """Other workers whose bus is hosted in this process (they lose it if this one exits)."""
+        return 0
+
+    async def wait_for_match(
+        self,
+        name: str,
+        elemental: str,
+        preferences: MatchPreferences | None = None,
+    ) -> MatchAssignment:
+        """Queue a player; returns when paired. Cancelling leaves the queue."""
+        future = await self.enqueue(name, elemental, preferences)
+        return await future
+
+    @abstractmethod
+    async def enqueue(
+        self,
+        name: str,
+        elemental: str,
+        preferences: MatchPreferences | None = None,
+    ) -> asyncio.Future[MatchAssignment]:
+        """
+        Queue a player without waiting for the match.
+
+        Returns:
+            Future resolved with the assignment; cancelling it leaves the queue
+
+        Raises:
+            MatchmakingClosedError: If matchmaking is closed here
+        """
+
+    @abstractmethod
+    def close_matchmaking(self) -> None:
+        """
+        Stop queueing players from this worker (drain).
+
+        Players already waiting here get MatchmakingClosedError; other
+        workers keep matchmaking.
+        """
+
+    @abstractmethod
+    async def get_matchmaking_stats(self) -> dict[str, Any]:
+        """Wait queue length, wait ages and counters (of the shared queue, if any)."""
+
+    @abstractmethod
+    async def get_match(self, match_id: str) -> tuple[PlayerSlot, PlayerSlot] | None:
+        """Player slots of a match, or None if unknown or expired."""
+
+    @abstractmethod
+    async def claim(self, match_id: str, token: str) -> Presence:
+        """Record that this worker now hosts the player's socket."""
+
+    @abstractmethod
+    async def release(self, match_id: str, token: str) -> None:
+        """Record that the player's socket on this worker closed."""
+
+    @abstractmethod
+    async def relay(self, match_id: str, token: str, payload: dict[str, Any]) -> None:
+        """
+        Deliver a message to the worker hosting the player (fire and forget).
+
+        If the player is disconnected it goes to the worker that hosted them
+        last (or back to this one), whose session buffers it for resume.
+        """
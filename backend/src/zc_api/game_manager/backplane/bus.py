@@ -0,0 +1,68 @@
+"""
+Framing for the local backplane bus.
+
+Each message is a JSON object prefixed with its length:
+
+    [length: uint32 big-endian] [UTF-8 JSON]
+
+Requests carry an "id" and get a {"id", "result"} reply ({"id", "error"}
+if the hub could not handle it); pushes ("matched", "match_failed",
+"relay", "presence") and fire-and-forget requests have an "op" and no "id".
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import struct
+from typing import Any
+
+from zc_api.common.codec import encode_dict
+
+_HEADER = struct.Struct(">I")
+
+# Frames are small control messages; anything bigger is a protocol error
+MAX_FRAME_BYTES = 1 << 20
+
+
+class BusError(ConnectionError):
+    """Raised when the bus connection is lost or a frame is malformed."""
+    pass
+
+
+async def read_frame(reader: asyncio.StreamReader) -> dict[str, Any] | None:
+    """
+    Read one message.
+
+    Returns:
+        The message, or None at a clean end of stream
+
+    Raises:
+        BusError: If the frame is oversized, truncated or not a JSON object
+    """
+    try:
+        header = await reader.readexactly(_HEADER.size)
+    except asyncio.IncompleteReadError as error:
+        if not error.partial:
+            return None
+        raise BusError("Truncated frame header") from error
+
+    (length,) = _HEADER.unpack(header)
+    if length > MAX_FRAME_BYTES:
+        raise BusError(f"Frame of {length} bytes exceeds {MAX_FRAME_BYTES}")
+
+    try:
+        message = json.loads(await reader.readexactly(length))
+    except asyncio.IncompleteReadError as error:
+        raise BusError("Truncated frame") from error
+    except ValueError as error:
+        raise BusError("Frame is not valid JSON") from error
+
+    if not isinstance(message, dict):
+        raise BusError("Frame is not a JSON object")
+    return message
+
+
+def write_frame(writer: asyncio.StreamWriter, message: dict[str, Any]) -> None:
+    """Buffer one message for sending (the transport flushes it)."""
+    data = encode_dict(message).encode()
+    writer.write(_HEADER.pack(len(data)) + data)
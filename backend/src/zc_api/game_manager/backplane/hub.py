@@ -0,0 +1,313 @@
+"""
+Backplane hub: the one process every worker connects to over a Unix socket.
+
+The hub owns the global state (matchmaking queue, match directory, which
+worker hosts each player's socket) and routes relayed messages. It runs
+inside whichever worker wins the lock file (see UnixBackplane) or
+standalone:
+
+    python -m zc_api.game_manager.backplane --socket /tmp/zc_backplane.sock
+"""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import itertools
+import logging
+import os
+import secrets
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from ..session import MatchPreferences, PlayerSlot
+from .base import MatchmakingConfig
+from .bus import BusError, read_frame, write_frame
+
+logger = logging.getLogger(__name__)
+
+
+class _WorkerLink:
+    """One connected worker."""
+
+    __slots__ = ('worker_id', 'writer', 'tickets', 'claims')
+
+    def __init__(self, worker_id: int, writer: asyncio.StreamWriter) -> None:
+        self.worker_id = worker_id
+        self.writer = writer
+        # Matchmaking ticket -> task waiting in the hub's Matchmaker
+        self.tickets: dict[str, asyncio.Task[None]] = {}
+        # (match_id, token) pairs this worker hosts
+        self.claims: set[tuple[str, str]] = set()
+
+    def send(self, message: dict[str, Any]) -> None:
+        if not self.writer.is_closing():
+            write_frame(self.writer, message)
+
+
+@dataclass(slots=True)
+class _MatchRecord:
+    players: tuple[PlayerSlot, PlayerSlot]
+    # Worker hosting (or last hosting) each token's socket
+    owners: dict[str, _WorkerLink] = field(default_factory=dict)
+    connected: set[str] = field(default_factory=set)
+    started: bool = False
+    last_active: float = field(default_factory=time.monotonic)
+
+
+class MatchDirectory:
+    """Matches known to the hub. Also the hub Matchmaker's MatchFactory."""
+
+    def __init__(self, match_ttl: float) -> None:
+        self._match_ttl = match_ttl
+        self._matches: dict[str, _MatchRecord] = {}
+
+    async def create_match(
+        self,
+        name_a: str,
+        elemental_a: str,
+        name_b: str,
+        elemental_b: str,
+    ) -> tuple[str, str, str]:
+        """Create a match record. Returns (match_id, token_a, token_b)."""
+        (created,) = await self.create_matches([(name_a, elemental_a, name_b, elemental_b)])
+        return created
+
+    async def create_matches(
+        self,
+        players: Sequence[tuple[str, str, str, str]],
+    ) -> list[tuple[str, str, str]]:
+        """Create many match records at once. Returns (match_id, token_a, token_b) per match."""
+        created: list[tuple[str, str, str]] = []
+        for name_a, elemental_a, name_b, elemental_b in players:
+            match_id = secrets.token_urlsafe(12)
+            token_a = secrets.token_urlsafe(24)
+            token_b = secrets.token_urlsafe(24)
+            self._matches[match_id] = _MatchRecord(
+                players=(
+                    PlayerSlot(token=token_a, name=name_a, elemental=elemental_a),
+                    PlayerSlot(token=token_b, name=name_b, elemental=elemental_b),
+                ),
+            )
+            created.append((match_id, token_a, token_b))
+        return created
+
+    def get(self, match_id: str) -> _MatchRecord | None:
+        return self._matches.get(match_id)
+
+    def expire(self, now: float) -> list[str]:
+        """Drop matches with nobody connected for longer than the TTL."""
+        expired = [
+            match_id
+            for match_id, record in self._matches.items()
+            if not record.connected and now - record.last_active > self._match_ttl
+        ]
+        for match_id in expired:
+            del self._matches[match_id]
+        return expired
+
+    def __len__(self) -> int:
+        return len(self._matches)
+
+
+class BackplaneHub:
+    """Unix socket server holding the state shared by all workers."""
+
+    def __init__(
+        self,
+        path: str,
+        match_ttl: float = 300,
+        sweep_seconds: float = 5.0,
+        matchmaking: MatchmakingConfig | None = None,
+    ) -> None:
+        self._path = path
+        self._directory = MatchDirectory(match_ttl)
+        self._matchmaker = (matchmaking or MatchmakingConfig()).create_matchmaker(self._directory)
+        self._sweep_seconds = sweep_seconds
+        self._worker_ids = itertools.count(1)
+        self._links: set[_WorkerLink] = set()
+        self._server: asyncio.Server | None = None
+        self._sweep_task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        """Bind the socket (replacing a stale one) and start serving."""
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self._path)
+        self._server = await asyncio.start_unix_server(self._serve_worker, path=self._path)
+        self._sweep_task = asyncio.create_task(self._sweep_loop())
+        self._matchmaker.start()
+        logger.info("Backplane hub listening on %s", self._path)
+
+    async def stop(self) -> None:
+        await self._matchmaker.stop()
+        if self._sweep_task is not None:
+            self._sweep_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._sweep_task
+            self._sweep_task = None
+
+        if self._server is not None:
+            self._server.close()
+            for link in list(self._links):
+                link.writer.close()
+            await self._server.wait_closed()
+            self._server = None
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(self._path)
+
+    async def serve_forever(self) -> None:
+        await self.start()
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await self.stop()
+
+    def get_stats(self) -> dict[str, int]:
+        return {"workers": len(self._links), "matches": len(self._directory)}
+
+    async def _sweep_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._sweep_seconds)
+            expired = self._directory.expire(time.monotonic())
+            if expired:
+                logger.info("Backplane hub expired %d match(es)", len(expired))
+
+    async def _serve_worker(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        link = _WorkerLink(next(self._worker_ids), writer)
+        self._links.add(link)
+        logger.info("Backplane worker %d connected", link.worker_id)
+        try:
+            while (message := await read_frame(reader)) is not None:
+                try:
+                    self._dispatch(link, message)
+                except Exception as error:
+                    # One bad frame must not drop the worker's link
+                    logger.exception("Backplane worker %d sent a bad %r frame", link.worker_id, message.get("op"))
+                    if (request_id := message.get("id")) is not None:
+                        link.send({"id": request_id, "error": f"{type(error).__name__}: {error}"})
+        except (BusError, ConnectionError) as error:
+            logger.warning("Backplane worker %d dropped: %s", link.worker_id, error)
+        finally:
+            self._drop_worker(link)
+            writer.close()
+            logger.info("Backplane worker %d disconnected", link.worker_id)
+
+    def _dispatch(self, link: _WorkerLink, message: dict[str, Any]) -> None:
+        op = message.get("op")
+
+        if op == "relay":
+            self._relay(link, message["match_id"], message["token"], message["payload"])
+        elif op == "enqueue":
+            ticket = message["ticket"]
+            preferences = None
+            if (fields := message.get("preferences")) is not None:
+                preferences = MatchPreferences(
+                    rating=fields["rating"],
+                    region=fields["region"],
+                    elementals=frozenset(fields["elementals"]),
+                )
+            link.tickets[ticket] = asyncio.create_task(
+                self._wait_for_match(link, ticket, message["name"], message["elemental"], preferences)
+            )
+        elif op == "cancel":
+            task = link.tickets.pop(message["ticket"], None)
+            if task is not None:
+                task.cancel()
+        elif op == "get_match":
+            record = self._directory.get(message["match_id"])
+            players = None
+            if record is not None:
+                players = [
+                    {"token": slot.token, "name": slot.name, "elemental": slot.elemental}
+                    for slot in record.players
+                ]
+            link.send({"id": message["id"], "result": players})
+        elif op == "matchmaking_stats":
+            link.send({"id": message["id"], "result": self._matchmaker.get_stats()})
+        elif op == "claim":
+            link.send({"id": message["id"], "result": self._claim(link, message["match_id"], message["token"])})
+        elif op == "release":
+            self._release(link, message["match_id"], message["token"])
+        else:
+            raise ValueError(f"unknown op {op!r}")
+
+    async def _wait_for_match(
+        self,
+        link: _WorkerLink,
+        ticket: str,
+        name: str,
+        elemental: str,
+        preferences: MatchPreferences | None,
+    ) -> None:
+        try:
+            assignment = await self._matchmaker.wait_for_match(name, elemental, preferences)
+        except Exception as error:
+            # Tell the worker, or its enqueue future would wait forever
+            logger.exception("Backplane matchmaking failed for worker %d", link.worker_id)
+            link.tickets.pop(ticket, None)
+            link.send({"op": "match_failed", "ticket": ticket, "error": f"{type(error).__name__}: {error}"})
+            return
+
+        link.tickets.pop(ticket, None)
+        link.send({
+            "op": "matched",
+            "ticket": ticket,
+            "match_id": assignment.match_id,
+            "player_token": assignment.player_token,
+        })
+
+    def _claim(self, link: _WorkerLink, match_id: str, token: str) -> dict[str, Any]:
+        record = self._directory.get(match_id)
+        if record is None:
+            return {"connected": [token], "was_started": False}
+
+        was_started = record.started
+        previous = record.owners.get(token)
+        if previous is not None and previous is not link:
+            previous.claims.discard((match_id, token))
+
+        record.owners[token] = link
+        record.connected.add(token)
+        record.last_active = time.monotonic()
+        link.claims.add((match_id, token))
+        if len(record.connected) == 2:
+            record.started = True
+
+        self._push_presence(match_id, record, exclude=link)
+        return {"connected": sorted(record.connected), "was_started": was_started}
+
+    def _release(self, link: _WorkerLink, match_id: str, token: str) -> None:
+        record = self._directory.get(match_id)
+        # Ignore releases from a worker the player already moved away from
+        if record is None or record.owners.get(token) is not link:
+            return
+
+        link.claims.discard((match_id, token))
+        record.connected.discard(token)
+        record.last_active = time.monotonic()
+        self._push_presence(match_id, record, exclude=link)
+
+    def _relay(self, origin: _WorkerLink, match_id: str, token: str, payload: dict[str, Any]) -> None:
+        record = self._directory.get(match_id)
+        target = record.owners.get(token) if record is not None else None
+        if target is None or target not in self._links:
+            # Never connected (or its worker is gone): the sender buffers it
+            target = origin
+        if record is not None:
+            record.last_active = time.monotonic()
+        target.send({"op": "relay", "match_id": match_id, "token": token, "payload": payload})
+
+    def _push_presence(self, match_id: str, record: _MatchRecord, exclude: _WorkerLink) -> None:
+        message = {"op": "presence", "match_id": match_id, "connected": sorted(record.connected)}
+        for link in {record.owners[token] for token in record.connected} - {exclude}:
+            link.send(message)
+
+    def _drop_worker(self, link: _WorkerLink) -> None:
+        self._links.discard(link)
+        for task in link.tickets.values():
+            task.cancel()
+        link.tickets.clear()
+
+        for match_id, token in list(link.claims):
+            self._release(link, match_id, token)
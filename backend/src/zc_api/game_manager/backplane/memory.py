@@ -0,0 +1,62 @@
+"""Single-process backplane (the default)."""
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from ..session import MatchAssignment, MatchPreferences, PlayerSlot, SessionRegistry
+from .base import Backplane, MatchmakingConfig, Presence
+
+
+class InMemoryBackplane(Backplane):
+    """
+    Backplane for one worker: the local registry is the whole world.
+
+    Matchmaking uses the local Matchmaker, presence is read from the local
+    session, and relayed messages are delivered straight to the handler.
+    """
+
+    def __init__(self, registry: SessionRegistry, matchmaking: MatchmakingConfig | None = None) -> None:
+        super().__init__()
+        self._registry = registry
+        self._matchmaker = (matchmaking or MatchmakingConfig()).create_matchmaker(registry)
+
+    async def start(self) -> None:
+        self._matchmaker.start()
+
+    async def stop(self) -> None:
+        await self._matchmaker.stop()
+
+    async def enqueue(
+        self,
+        name: str,
+        elemental: str,
+        preferences: MatchPreferences | None = None,
+    ) -> asyncio.Future[MatchAssignment]:
+        return await self._matchmaker.enqueue(name, elemental, preferences)
+
+    def close_matchmaking(self) -> None:
+        self._matchmaker.close()
+
+    async def get_matchmaking_stats(self) -> dict[str, Any]:
+        return self._matchmaker.get_stats()
+
+    async def get_match(self, match_id: str) -> tuple[PlayerSlot, PlayerSlot] | None:
+        session = self._registry.get_session_nowait(match_id)
+        return session.get_players() if session is not None else None
+
+    async def claim(self, match_id: str, token: str) -> Presence:
+        session = self._registry.get_session_nowait(match_id)
+        if session is None:
+            return Presence(connected=frozenset((token,)), was_started=False)
+        return Presence(
+            connected=session.get_connected_tokens() | {token},
+            was_started=session.has_started(),
+        )
+
+    async def release(self, match_id: str, token: str) -> None:
+        pass
+
+    async def relay(self, match_id: str, token: str, payload: dict[str, Any]) -> None:
+        if self._on_relay is not None:
+            await self._on_relay(match_id, token, payload)
@@ -0,0 +1,253 @@
+"""
+Multi-process backplane over a Unix socket.
+
+Every worker connects to one BackplaneHub. The hub runs in whichever
+process first takes an exclusive lock on `<socket path>.lock`: the first
+uvicorn worker to start, or a standalone hub started beforehand
+(`python -m zc_api.game_manager.backplane`). The other workers retry
+until the socket accepts.
+
+If the process hosting the hub exits, the other workers lose the bus;
+restart the server (or run the hub standalone) to recover. A draining
+worker that hosts the hub therefore does not exit while other workers
+are still connected to it (see get_dependent_worker_count).
+"""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import fcntl
+import itertools
+import logging
+import time
+from typing import IO, Any
+
+from ..session import MatchAssignment, MatchmakingClosedError, MatchPreferences, PlayerSlot
+from .base import Backplane, MatchmakingConfig, Presence
+from .bus import BusError, read_frame, write_frame
+from .hub import BackplaneHub
+
+logger = logging.getLogger(__name__)
+
+
+def acquire_hub_lock(path: str) -> IO[str] | None:
+    """
+    Try to become the hub for a socket path.
+
+    Returns:
+        The open lock file (keep it open while hosting), or None if
+        another process holds the lock
+    """
+    # Not a context manager: the lock lasts as long as the file stays open
+    lock_file = open(f"{path}.lock", "a")  # noqa: SIM115
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        lock_file.close()
+        return None
+    return lock_file
+
+
+class UnixBackplane(Backplane):
+    """Backplane client; hosts the hub too if it wins the lock."""
+
+    def __init__(
+        self,
+        path: str,
+        match_ttl: float = 300,
+        connect_timeout: float = 10.0,
+        matchmaking: MatchmakingConfig | None = None,
+    ) -> None:
+        super().__init__()
+        self._path = path
+        self._match_ttl = match_ttl
+        # Only used if this process hosts the hub
+        self._matchmaking = matchmaking
+        self._connect_timeout = connect_timeout
+        self._hub: BackplaneHub | None = None
+        self._hub_lock: IO[str] | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._read_task: asyncio.Task[None] | None = None
+        self._dispatch_task: asyncio.Task[None] | None = None
+        # Pushes are handled in order, off the read loop (handlers may await replies)
+        self._pushes: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+        self._request_ids = itertools.count(1)
+        self._replies: dict[int, asyncio.Future[Any]] = {}
+        self._tickets: dict[str, asyncio.Future[MatchAssignment]] = {}
+        self._matchmaking_closed = False
+
+    def is_hub(self) -> bool:
+        """True if this process hosts the hub."""
+        return self._hub is not None
+
+    def get_dependent_worker_count(self) -> int:
+        if self._hub is None:
+            return 0
+        workers = self._hub.get_stats()["workers"]
+        # This process's own connection is one of the hub's links
+        if self._writer is not None and not self._writer.is_closing():
+            workers -= 1
+        return max(0, workers)
+
+    async def start(self) -> None:
+        self._hub_lock = acquire_hub_lock(self._path)
+        if self._hub_lock is not None:
+            self._hub = BackplaneHub(self._path, self._match_ttl, matchmaking=self._matchmaking)
+            await self._hub.start()
+
+        reader, self._writer = await self._connect()
+        self._read_task = asyncio.create_task(self._read_loop(reader))
+        self._dispatch_task = asyncio.create_task(self._dispatch_loop())
+        logger.info("Backplane connected to %s (hub: %s)", self._path, self.is_hub())
+
+    async def stop(self) -> None:
+        for task in (self._read_task, self._dispatch_task):
+            if task is not None:
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+        self._read_task = self._dispatch_task = None
+
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        self._fail_pending(BusError("backplane stopped"))
+
+        if self._hub is not None:
+            await self._hub.stop()
+            self._hub = None
+        if self._hub_lock is not None:
+            self._hub_lock.close()
+            self._hub_lock = None
+
+    async def enqueue(
+        self,
+        name: str,
+        elemental: str,
+        preferences: MatchPreferences | None = None,
+    ) -> asyncio.Future[MatchAssignment]:
+        if self._matchmaking_closed:
+            raise MatchmakingClosedError("matchmaking is closed")
+
+        ticket = f"{next(self._request_ids)}"
+        future: asyncio.Future[MatchAssignment] = asyncio.get_running_loop().create_future()
+        message: dict[str, Any] = {"op": "enqueue", "ticket": ticket, "name": name, "elemental": elemental}
+        if preferences is not None:
+            message["preferences"] = {
+                "rating": preferences.rating,
+                "region": preferences.region,
+                "elementals": sorted(preferences.elementals),
+            }
+        self._send(message)
+        self._tickets[ticket] = future
+        future.add_done_callback(lambda _future, ticket=ticket: self._on_ticket_done(ticket, _future))
+        return future
+
+    def close_matchmaking(self) -> None:
+        self._matchmaking_closed = True
+        for ticket, future in list(self._tickets.items()):
+            if not future.done():
+                future.set_exception(MatchmakingClosedError("matchmaking is closed"))
+            with contextlib.suppress(BusError):
+                self._send({"op": "cancel", "ticket": ticket})
+
+    async def get_matchmaking_stats(self) -> dict[str, Any]:
+        return await self._request({"op": "matchmaking_stats"})
+
+    async def get_match(self, match_id: str) -> tuple[PlayerSlot, PlayerSlot] | None:
+        players = await self._request({"op": "get_match", "match_id": match_id})
+        if players is None:
+            return None
+        slot_a, slot_b = (PlayerSlot(**slot) for slot in players)
+        return slot_a, slot_b
+
+    async def claim(self, match_id: str, token: str) -> Presence:
+        result = await self._request({"op": "claim", "match_id": match_id, "token": token})
+        return Presence(connected=frozenset(result["connected"]), was_started=result["was_started"])
+
+    async def release(self, match_id: str, token: str) -> None:
+        self._send({"op": "release", "match_id": match_id, "token": token})
+
+    async def relay(self, match_id: str, token: str, payload: dict[str, Any]) -> None:
+        self._send({"op": "relay", "match_id": match_id, "token": token, "payload": payload})
+
+    async def _connect(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        """Connect to the hub, retrying while it starts up."""
+        deadline = time.monotonic() + self._connect_timeout
+        while True:
+            try:
+                return await asyncio.open_unix_connection(self._path)
+            except (FileNotFoundError, ConnectionRefusedError):
+                if time.monotonic() >= deadline:
+                    raise BusError(f"No backplane hub listening on {self._path}") from None
+                await asyncio.sleep(0.05)
+
+    def _send(self, message: dict[str, Any]) -> None:
+        if self._writer is None or self._writer.is_closing():
+            raise BusError("backplane is not connected")
+        write_frame(self._writer, message)
+
+    async def _request(self, message: dict[str, Any]) -> Any:
+        request_id = next(self._request_ids)
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._replies[request_id] = future
+        try:
+            self._send({**message, "id": request_id})
+            return await future
+        finally:
+            self._replies.pop(request_id, None)
+
+    async def _read_loop(self, reader: asyncio.StreamReader) -> None:
+        try:
+            while (message := await read_frame(reader)) is not None:
+                request_id = message.get("id")
+                if request_id is not None:
+                    future = self._replies.get(request_id)
+                    if future is None or future.done():
+                        pass
+                    elif (error := message.get("error")) is not None:
+                        future.set_exception(BusError(f"backplane hub rejected request: {error}"))
+                    else:
+                        future.set_result(message.get("result"))
+                elif message.get("op") == "matched":
+                    future = self._tickets.get(message["ticket"])
+                    if future is not None and not future.done():
+                        future.set_result(
+                            MatchAssignment(match_id=message["match_id"], player_token=message["player_token"])
+                        )
+                elif message.get("op") == "match_failed":
+                    future = self._tickets.get(message["ticket"])
+                    if future is not None and not future.done():
+                        future.set_exception(BusError(f"backplane hub failed to match: {message['error']}"))
+                else:
+                    self._pushes.put_nowait(message)
+        except (BusError, ConnectionError) as error:
+            logger.error("Backplane connection lost: %s", error)
+        else:
+            logger.error("Backplane hub closed the connection")
+        self._fail_pending(BusError("backplane connection lost"))
+
+    async def _dispatch_loop(self) -> None:
+        while True:
+            message = await self._pushes.get()
+            try:
+                if message.get("op") == "relay" and self._on_relay is not None:
+                    await self._on_relay(message["match_id"], message["token"], message["payload"])
+                elif message.get("op") == "presence" and self._on_presence is not None:
+                    await self._on_presence(message["match_id"], frozenset(message["connected"]))
+            except Exception:
+                logger.exception("Backplane push handler failed")
+
+    def _on_ticket_done(self, ticket: str, future: asyncio.Future[MatchAssignment]) -> None:
+        """Forget the ticket; if the player gave up, take them out of the hub's queue."""
+        self._tickets.pop(ticket, None)
+        if future.cancelled():
+            with contextlib.suppress(BusError):
+                self._send({"op": "cancel", "ticket": ticket})
+
+    def _fail_pending(self, error: BusError) -> None:
+        for future in [*self._replies.values(), *self._tickets.values()]:
+            if not future.done():
+                future.set_exception(error)
+        self._replies.clear()
+        self._tickets.clear()
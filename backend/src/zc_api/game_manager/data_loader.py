@@ -1,3 +1,4 @@
+import hashlib
 import json
 import logging
 from pathlib import Path
@@ -6,16 +7,22 @@ from typing import Optional
 
 from zc_api.models.game import AbilityData, ElementalData, GameData
 from zc_api.config import settings
+from zc_api.tags import TagRegistry, TagRegistrySnapshot, TagTableError
 
 logger = logging.getLogger(__name__)
 
+GAME_DATA_DIR: Path = Path(__file__).parents[3] / "game_data"
+
+# Prebuilt binary tag table (see src/tools/build_tag_table.py)
+TAG_TABLE_PATH: Path = GAME_DATA_DIR / "tags.bin"
+
 # Cache storage for manual cache management in dev mode
 _cached_game_data: Optional[GameData] = None
 
 
 def _load_game_data_impl() -> GameData:
     """Actually load game data from disk."""
-    game_data_dir = Path(__file__).parents[3] / "game_data"
+    game_data_dir = GAME_DATA_DIR
     
     logger.info("Loading game data from %s", game_data_dir)
     
@@ -54,3 +61,98 @@ def load_game_data() -> GameData:
     if _cached_game_data is None:
         _cached_game_data = _load_game_data_impl()
     return _cached_game_data
+
+
+def _collect_tags_from_json(value: object, tags: set[str]) -> None:
+    """Recursively collect "gameplay_tag"/"gameplay_tags" values from parsed JSON."""
+    if isinstance(value, list):
+        for item in value:
+            _collect_tags_from_json(item, tags)
+        return
+    
+    if not isinstance(value, dict):
+        return
+    
+    for key, item in value.items():
+        if key == "gameplay_tag" and isinstance(item, str) and item.strip():
+            tags.add(item.strip())
+        elif key == "gameplay_tags" and isinstance(item, list):
+            tags.update(tag.strip() for tag in item if isinstance(tag, str) and tag.strip())
+        else:
+            _collect_tags_from_json(item, tags)
+
+
+def _iter_game_data_json(game_data_dir: Path) -> list[Path]:
+    return sorted(game_data_dir.rglob("*.json"))
+
+
+def hash_game_data_sources(game_data_dir: Path = GAME_DATA_DIR) -> bytes:
+    """
+    Hash the game data JSON files that gameplay tags are collected from.
+    
+    Recorded in the tag table by src/tools/build_tag_table.py so startup can
+    tell whether the table is stale by hashing file bytes instead of parsing
+    every file. Content-based, so it survives checkouts that reset mtimes.
+    
+    Returns:
+        32-byte SHA-256 digest of every file's relative path and contents
+    """
+    digest = hashlib.sha256()
+    for json_path in _iter_game_data_json(game_data_dir):
+        digest.update(json_path.relative_to(game_data_dir).as_posix().encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(json_path.read_bytes())
+        digest.update(b"\0")
+    return digest.digest()
+
+
+def collect_gameplay_tags(game_data_dir: Path = GAME_DATA_DIR) -> list[str]:
+    """
+    Collect every gameplay tag referenced by game data JSON files.
+    
+    Scans all *.json files under game_data_dir (abilities, elementals, boards
+    and any future files) for "gameplay_tag" and "gameplay_tags" fields.
+    
+    Returns:
+        Sorted, de-duplicated tag paths (sorted so tag IDs are deterministic)
+    """
+    tags: set[str] = set()
+    for json_path in _iter_game_data_json(game_data_dir):
+        with open(json_path, encoding="utf-8") as f:
+            _collect_tags_from_json(json.load(f), tags)
+    return sorted(tags)
+
+
+def build_tag_registry(tag_paths: list[str]) -> TagRegistry:
+    """Register tag paths in order and freeze the registry."""
+    registry = TagRegistry()
+    registry.register_tags_from_source(lambda: tag_paths)
+    registry.freeze()
+    return registry
+
+
+def load_tag_registry() -> TagRegistry:
+    """
+    Create the frozen tag registry for the game.
+    
+    Memory-maps the prebuilt tag table when present and built from the
+    current game data (its recorded source digest matches
+    hash_game_data_sources()); otherwise registers every tag from game data JSON.
+    """
+    if TAG_TABLE_PATH.exists():
+        try:
+            snapshot = TagRegistrySnapshot.load(TAG_TABLE_PATH)
+        except (OSError, TagTableError):
+            logger.exception("Failed to load tag table. path=%s", TAG_TABLE_PATH)
+        else:
+            if snapshot.get_source_digest() == hash_game_data_sources():
+                logger.info("Loaded tag table from %s", TAG_TABLE_PATH)
+                return TagRegistry.from_snapshot(snapshot)
+            
+            logger.warning(
+                "Tag table %s is out of date with game data; "
+                "rebuild it with src/tools/build_tag_table.py",
+                TAG_TABLE_PATH,
+            )
+    
+    return build_tag_registry(collect_gameplay_tags())
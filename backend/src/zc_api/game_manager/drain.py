@@ -0,0 +1,156 @@
+"""
+Drain mode for rolling deploys.
+
+Draining a worker:
+1. Closes matchmaking here (players still queueing are turned away and
+   reconnect through the load balancer to another worker)
+2. Tells connected players once, with bounded concurrency, that the
+   server is draining
+3. Lets in-progress matches finish: waits until no session has a
+   connected player, or the drain timeout passes
+4. If this worker hosts the backplane hub, keeps it up until no other
+   worker is connected (exiting would take down their bus)
+5. Calls on_drained (by default the app asks the process to exit)
+
+Triggered by SIGUSR1 or POST /admin/drain; progress at GET /admin/drain
+and /health (503 while draining, so load balancers stop routing here).
+"""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections.abc import Callable
+from enum import Enum
+from typing import Any
+
+from zc_api.models.session import ServerShutdown
+
+from .backplane import Backplane
+from .session import SessionRegistry
+
+logger = logging.getLogger(__name__)
+
+
+class DrainState(Enum):
+    RUNNING = "running"
+    DRAINING = "draining"
+    DRAINED = "drained"
+
+
+class DrainController:
+    """Runs one drain per process and reports its progress."""
+
+    def __init__(
+        self,
+        registry: SessionRegistry,
+        backplane: Backplane,
+        timeout: float = 600,
+        poll_interval: float = 1.0,
+        on_drained: Callable[[], None] | None = None,
+    ) -> None:
+        self._registry = registry
+        self._backplane = backplane
+        self._timeout = timeout
+        self._poll_interval = poll_interval
+        self._on_drained = on_drained
+        self._state = DrainState.RUNNING
+        self._reason: str | None = None
+        self._started_at: float | None = None
+        self._finished_at: float | None = None
+        self._initial_sessions = 0
+        self._notified: dict[str, int] | None = None
+        self._timed_out = False
+        self._task: asyncio.Task[None] | None = None
+
+    def get_state(self) -> DrainState:
+        return self._state
+
+    def is_draining(self) -> bool:
+        """True from the start of a drain onwards (also once drained)."""
+        return self._state is not DrainState.RUNNING
+
+    def start(self, reason: str) -> bool:
+        """
+        Begin draining (idempotent).
+
+        Returns:
+            True if this call started the drain
+        """
+        if self._state is not DrainState.RUNNING:
+            return False
+
+        self._state = DrainState.DRAINING
+        self._reason = reason
+        self._started_at = time.monotonic()
+        self._initial_sessions, players = self._registry.get_connected_counts()
+        logger.info(
+            "Draining (%s): %d active session(s), %d player(s)",
+            reason,
+            self._initial_sessions,
+            players,
+        )
+
+        self._backplane.close_matchmaking()
+        self._task = asyncio.create_task(self._run())
+        return True
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    def get_status(self) -> dict[str, Any]:
+        sessions, players = self._registry.get_connected_counts()
+        status: dict[str, Any] = {
+            "state": self._state.value,
+            "reason": self._reason,
+            "active_sessions": sessions,
+            "connected_players": players,
+        }
+        if self._started_at is not None:
+            end = self._finished_at or time.monotonic()
+            status.update(
+                initial_sessions=self._initial_sessions,
+                elapsed_seconds=round(end - self._started_at, 3),
+                timeout_seconds=self._timeout,
+                notified=self._notified,
+                timed_out=self._timed_out,
+                dependent_workers=self._backplane.get_dependent_worker_count(),
+            )
+        return status
+
+    async def _run(self) -> None:
+        result = await self._registry.notify_all(
+            ServerShutdown(
+                type="server_shutdown",
+                message="Server is draining; finish your match, new matches start elsewhere",
+            )
+        )
+        self._notified = result.to_dict()
+
+        assert self._started_at is not None
+        deadline = self._started_at + self._timeout
+        while self._registry.get_connected_counts()[0] > 0:
+            if time.monotonic() >= deadline:
+                self._timed_out = True
+                break
+            await asyncio.sleep(self._poll_interval)
+
+        if dependent := self._backplane.get_dependent_worker_count():
+            logger.warning(
+                "Sessions drained; still hosting the backplane hub for %d worker(s), exit deferred",
+                dependent,
+            )
+            while self._backplane.get_dependent_worker_count() > 0:
+                await asyncio.sleep(self._poll_interval)
+
+        self._state = DrainState.DRAINED
+        self._finished_at = time.monotonic()
+        logger.info("Drain complete: %s", self.get_status())
+
+        if self._on_drained is not None:
+            self._on_drained()
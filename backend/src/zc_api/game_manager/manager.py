@@ -1,17 +1,30 @@
 """GameManager - manages game content, sessions, and availability."""
+import asyncio
+import contextlib
 import logging
-from typing import Optional
+from collections.abc import Callable
+from typing import Any, Optional
 
 from fastapi import Request, WebSocket
+from pydantic import BaseModel
 
+from zc_api.common.codec import JSON_FORMAT, MessageFormat
+from .backplane import Backplane, InMemoryBackplane, MatchmakingConfig, UnixBackplane
 from .data_loader import load_game_data
-from .session import SessionRegistry, GameSession, Matchmaker, MatchAssignment
+from .drain import DrainController
+from .tickets import MatchTicket, MatchTicketStore
+from .session import (
+    SessionRegistry, SessionTtls, GameSession, MatchAssignment, MatchPreferences,
+    OutboundConfig, OverflowPolicy, HeartbeatMonitor, HEARTBEAT_CLOSE_CODE,
+)
 from zc_api.config import settings
 from zc_api.models.game import (
     ElementalData, AbilityData, DisplayData, GameData,
     AvailableElemental, AvailableAbility, DisplayDataResponse,
 )
-from zc_api.models.session import ServerGameReady, ServerOpponentDisconnected
+from zc_api.models.session import (
+    ServerGameReady, ServerOpponentDisconnected, ServerOpponentReconnected, ServerResync,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -30,22 +43,64 @@ class GameManager:
     Responsibilities:
     - Determine what content is available to players
     - Filter content based on development flags
-    - Own session registry and matchmaker
+    - Own session registry and the backplane (matchmaking, cross-worker relay)
     - Orchestrate player join/leave lifecycle
+
+    Messages for a player whose socket is not on this worker go through
+    the backplane, which relays them to the worker hosting it.
     """
 
-    def __init__(self, game_data: GameData) -> None:
+    def __init__(self, game_data: GameData, on_drained: Callable[[], None] | None = None) -> None:
         logger.info("GameManager initializing")
 
         self._game_data = game_data
-        self._registry = SessionRegistry()
-        self._matchmaker = Matchmaker(self._registry)
+        self._registry = SessionRegistry(
+            shard_count=settings.session_shard_count,
+            ttls=SessionTtls.from_settings(settings),
+            expiry_tick_seconds=settings.session_expiry_tick_seconds,
+            outbound=OutboundConfig(
+                max_queue_size=settings.outbound_queue_size,
+                overflow_policy=OverflowPolicy(settings.outbound_overflow_policy),
+                fanout_concurrency=settings.fanout_concurrency,
+                fanout_timeout=settings.fanout_send_timeout_seconds,
+                replay_buffer_size=settings.session_replay_buffer_size,
+            ),
+        )
+        self._backplane = self._create_backplane()
+        self._backplane.bind(self._on_relay, self._on_presence)
+        self._heartbeats = HeartbeatMonitor(
+            self._registry,
+            on_dead=self._reap_dead_socket,
+            interval=settings.heartbeat_interval_seconds,
+            timeout=settings.heartbeat_timeout_seconds,
+        )
+        self._tickets = MatchTicketStore(
+            self._backplane,
+            ttl=settings.matchmaking_ticket_ttl_seconds,
+            max_wait=settings.matchmaking_ticket_max_wait_seconds,
+        )
+        self._drain = DrainController(
+            self._registry,
+            self._backplane,
+            timeout=settings.drain_timeout_seconds,
+            on_drained=on_drained,
+        )
 
         logger.info(
             "GameManager initialized with %d elementals and %d abilities",
             len(self._game_data.elementals),
             len(self._game_data.abilities),
         )
+
+    def _create_backplane(self) -> Backplane:
+        matchmaking = MatchmakingConfig.from_settings(settings)
+        if settings.backplane == "unix":
+            return UnixBackplane(
+                settings.backplane_socket_path,
+                match_ttl=SessionTtls.from_settings(settings).get_longest(),
+                matchmaking=matchmaking,
+            )
+        return InMemoryBackplane(self._registry, matchmaking=matchmaking)
     
     def get_available_elementals(self) -> list[AvailableElemental]:
         """
@@ -108,16 +163,77 @@ class GameManager:
     # ========================================
 
     async def start_sessions(self) -> None:
-        """Start session cleanup task. Call on app startup."""
+        """Start session cleanup task and connect the backplane. Call on app startup."""
         await self._registry.start()
+        await self._backplane.start()
+        self._heartbeats.start()
+        self._tickets.start()
 
     async def stop_sessions(self) -> None:
-        """Stop session cleanup task. Call on app shutdown."""
+        """Stop session cleanup task and disconnect the backplane. Call on app shutdown."""
+        await self._drain.stop()
+        await self._tickets.stop()
+        await self._heartbeats.stop()
         await self._registry.stop()
+        await self._backplane.stop()
+
+    async def wait_for_match(
+        self,
+        name: str,
+        elemental: str,
+        preferences: MatchPreferences | None = None,
+    ) -> MatchAssignment:
+        """
+        Queue player for matchmaking (across all workers). Returns when matched.
+
+        Args:
+            preferences: Rating, region and accepted opponent elementals
+                (only used when MATCHMAKING_MODE is "rated")
+
+        Raises:
+            MatchmakingClosedError: If this worker is draining
+        """
+        return await self._backplane.wait_for_match(name, elemental, preferences)
+
+    async def create_match_ticket(
+        self,
+        name: str,
+        elemental: str,
+        preferences: MatchPreferences | None = None,
+    ) -> MatchTicket:
+        """
+        Queue player for matchmaking and return a ticket to poll (HTTP flow).
+
+        Raises:
+            MatchmakingClosedError: If this worker is draining
+        """
+        return await self._tickets.create(name, elemental, preferences)
+
+    async def wait_for_match_ticket(self, ticket_id: str, timeout: float) -> MatchTicket | None:
+        """Long-poll a ticket until matched or timeout. None if unknown or expired."""
+        return await self._tickets.wait(ticket_id, timeout)
 
-    async def wait_for_match(self, name: str, elemental: str) -> MatchAssignment:
-        """Queue player for matchmaking. Returns when matched."""
-        return await self._matchmaker.wait_for_match(name, elemental)
+    def cancel_match_ticket(self, ticket_id: str) -> bool:
+        """Leave the queue and forget the ticket. False if unknown."""
+        return self._tickets.cancel(ticket_id)
+
+    def get_match_ticket_ttl(self) -> float:
+        return self._tickets.get_ttl()
+
+    async def get_matchmaking_stats(self) -> dict[str, Any]:
+        """Matchmaking queue length, wait ages and counters, plus HTTP ticket counts."""
+        return {**await self._backplane.get_matchmaking_stats(), "tickets": self._tickets.get_stats()}
+
+    def start_drain(self, reason: str) -> bool:
+        """Stop matchmaking here and exit once active matches finish. False if already draining."""
+        return self._drain.start(reason)
+
+    def is_draining(self) -> bool:
+        return self._drain.is_draining()
+
+    def get_drain_status(self) -> dict[str, Any]:
+        """Drain state and progress for admin/health endpoints."""
+        return self._drain.get_status()
 
     async def get_session(self, match_id: str) -> GameSession | None:
         """Get session by match ID."""
@@ -127,31 +243,97 @@ class GameManager:
         """Get info about all active sessions for admin/debug purposes."""
         return await self._registry.get_all_sessions_info()
 
+    def get_session_shard_stats(self) -> list[dict]:
+        """Get per-shard session counters for admin/debug purposes."""
+        return self._registry.get_shard_stats()
+
     async def on_player_joined(
         self,
         match_id: str,
         token: str,
         websocket: WebSocket,
+        message_format: MessageFormat = JSON_FORMAT,
+        last_seq: int | None = None,
     ) -> GameSession:
         """
         Handle player joining a game session.
         
         Registers the WebSocket, and if both players are now connected,
         sends game_ready messages to both.
+
+        Rejoining a game in progress resumes instead: the messages after
+        last_seq are replayed, or a resync snapshot is sent when they are
+        no longer buffered (or the client sent no last_seq).
         """
-        session = await self._registry.get_session(match_id)
+        session = await self._get_or_adopt_session(match_id)
 
         if session is None:
             raise ValueError("unknown match")
 
-        player = await session.join(token, websocket)
+        if session.get_player_by_token(token) is None:
+            raise ValueError("invalid token")
+
+        presence = await self._backplane.claim(match_id, token)
+        player = await session.join(token, websocket, message_format)
+        session.set_remote_tokens(presence.connected - {token})
         logger.info("Player %s joined match %s", player.name, match_id)
 
-        if await session.are_both_connected():
-            await self._notify_game_ready(session)
+        if not presence.was_started:
+            if len(presence.connected) == 2:
+                await self._notify_game_ready(session)
+            return session
 
+        if last_seq is not None and session.replay(token, last_seq):
+            logger.info("Player %s resumed match %s after seq %d", player.name, match_id, last_seq)
+        else:
+            await self._send_resync(session, token)
+            logger.info("Player %s resynced match %s", player.name, match_id)
+
+        await self.send_to_opponent(
+            session,
+            token,
+            ServerOpponentReconnected(type="opponent_reconnected"),
+        )
         return session
 
+    async def _get_or_adopt_session(self, match_id: str) -> GameSession | None:
+        """Local session, or a replica of a match created on another worker."""
+        session = await self._registry.get_session(match_id)
+        if session is not None:
+            return session
+
+        players = await self._backplane.get_match(match_id)
+        if players is None:
+            return None
+        return self._registry.add_session(match_id, *players)
+
+    async def send_to_player(self, session: GameSession, token: str, message: BaseModel) -> None:
+        """Send to a player on this worker, or relay it to the worker hosting them."""
+        if session.has_local(token):
+            await session.send_to(token, message)
+        else:
+            await self._backplane.relay(session.match_id, token, message.model_dump(mode="json"))
+
+    async def send_to_opponent(self, session: GameSession, token: str, message: BaseModel) -> None:
+        """Send to the opponent of the given token, wherever they are connected."""
+        opponent = session.get_opponent_of(token)
+        if opponent is not None:
+            await self.send_to_player(session, opponent.token, message)
+
+    async def _on_relay(self, match_id: str, token: str, payload: dict[str, Any]) -> None:
+        """Backplane delivered a message for a player hosted (or buffered) here."""
+        session = await self._get_or_adopt_session(match_id)
+        if session is None:
+            logger.debug("Dropped relayed message for unknown match %s", match_id)
+            return
+        await session.send_to(token, payload)
+
+    async def _on_presence(self, match_id: str, connected: frozenset[str]) -> None:
+        """Backplane reported a player (dis)connecting on another worker."""
+        session = self._registry.get_session_nowait(match_id)
+        if session is not None:
+            session.set_remote_tokens(connected)
+
     async def _notify_game_ready(self, session: GameSession) -> None:
         """Send game_ready message to both players."""
         player_a, player_b = session.get_players()
@@ -162,41 +344,81 @@ class GameManager:
             you=player_a.name,
             opponent=player_b.name,
             opponent_elemental=player_b.elemental,
-        ).model_dump()
+        )
         msg_b = ServerGameReady(
             type="game_ready",
             match_id=session.match_id,
             you=player_b.name,
             opponent=player_a.name,
             opponent_elemental=player_a.elemental,
-        ).model_dump()
+        )
 
-        await session.send_to(player_a.token, msg_a)
-        await session.send_to(player_b.token, msg_b)
+        await self.send_to_player(session, player_a.token, msg_a)
+        await self.send_to_player(session, player_b.token, msg_b)
 
         logger.info("Sent game_ready to both players in match %s", session.match_id)
 
-    async def on_player_left(self, session: GameSession, token: str) -> None:
+    async def _send_resync(self, session: GameSession, token: str) -> None:
+        """Send a full snapshot to a player who cannot resume from the replay buffer."""
+        player = session.get_player_by_token(token)
+        opponent = session.get_opponent_of(token)
+        assert player is not None and opponent is not None
+
+        await session.send_to(
+            token,
+            ServerResync(
+                type="resync",
+                match_id=session.match_id,
+                you=player.name,
+                opponent=opponent.name,
+                opponent_elemental=opponent.elemental,
+                opponent_connected=await session.are_both_connected(),
+            ),
+        )
+
+    async def _reap_dead_socket(self, session: GameSession, token: str) -> None:
+        """Drop a connection that stopped answering heartbeats."""
+        websocket = session.get_socket(token)
+        if websocket is None:
+            return
+
+        await self.on_player_left(session, token, websocket)
+        # Half-open peers never answer the close handshake; don't wait for them
+        with contextlib.suppress(Exception):
+            await asyncio.wait_for(
+                websocket.close(code=HEARTBEAT_CLOSE_CODE, reason="heartbeat timeout"),
+                timeout=1.0,
+            )
+
+    async def on_player_left(
+        self,
+        session: GameSession,
+        token: str,
+        websocket: WebSocket | None = None,
+    ) -> None:
         """
         Handle player leaving a game session.
         
-        Notifies opponent and cleans up session if empty.
+        Notifies opponent. The session stays registered in the disconnected
+        state so the player can resume; the expiry wheel removes it after
+        the disconnected TTL.
         """
         player = session.get_player_by_token(token)
         player_name = player.name if player else "unknown"
 
-        await session.leave(token)
-        await session.send_to_opponent(
+        if not await session.leave(token, websocket):
+            # Socket was already replaced by a resumed connection
+            return
+
+        await self._backplane.release(session.match_id, token)
+        await self.send_to_opponent(
+            session,
             token,
-            ServerOpponentDisconnected(type="opponent_disconnected").model_dump(),
+            ServerOpponentDisconnected(type="opponent_disconnected"),
         )
 
         logger.info("Player %s left match %s", player_name, session.match_id)
 
-        if await session.get_connected_count() == 0:
-            await self._registry.remove_session(session.match_id)
-            logger.info("Removed empty session %s", session.match_id)
-
 
 def get_game_manager(request: Request = None, websocket: WebSocket = None) -> GameManager:
     """
@@ -1,12 +1,39 @@
 """Session management - WebSocket transport layer."""
 
-from .registry import SessionRegistry, GameSession, PlayerSlot
-from .matchmaker import Matchmaker, MatchAssignment
+from .registry import SessionRegistry, GameSession, PlayerSlot, SessionState, SessionTtls
+from .expiry import TimingWheel
+from .outbound import ConnectionWriter, OutboundConfig, OverflowPolicy
+from .replay import ReplayBuffer
+from .fanout import FanoutResult, fan_out
+from .heartbeat import HEARTBEAT_CLOSE_CODE, HeartbeatMonitor
+from .waiting import DEFAULT_RATING, MatchPreferences, WaitingEntry, WaitingQueue
+from .matchmaker import Matchmaker, MatchAssignment, MatchFactory, MatchmakingClosedError
+from .rating import RatedMatchmaker, RatingPool, RatingWindow
 
 __all__ = [
     "SessionRegistry",
     "GameSession",
     "PlayerSlot",
+    "SessionState",
+    "SessionTtls",
+    "TimingWheel",
+    "ConnectionWriter",
+    "OutboundConfig",
+    "OverflowPolicy",
+    "ReplayBuffer",
+    "FanoutResult",
+    "fan_out",
+    "HeartbeatMonitor",
+    "HEARTBEAT_CLOSE_CODE",
     "Matchmaker",
     "MatchAssignment",
+    "MatchFactory",
+    "MatchmakingClosedError",
+    "WaitingEntry",
+    "WaitingQueue",
+    "MatchPreferences",
+    "DEFAULT_RATING",
+    "RatedMatchmaker",
+    "RatingPool",
+    "RatingWindow",
 ]
@@ -0,0 +1,161 @@
+"""
+Hashed timing wheel for session expiry.
+
+Deadlines are bucketed into fixed-size ticks on a circular array of slots.
+advance() visits only the slots whose tick has passed, so expiry work is
+proportional to the sessions that are due, not to all sessions.
+
+Rescheduling is lazy: moving a deadline later (the common case - every
+message pushes it out) only records the new deadline. When the entry's old
+slot comes around, it is re-filed under its real deadline instead of firing.
+Moving a deadline earlier (e.g. a shorter TTL after a disconnect) moves the
+entry to its new slot immediately. Both are O(1).
+
+Example:
+    >>> wheel = TimingWheel[str](tick_seconds=1.0)
+    >>> wheel.schedule("match-1", time.monotonic() + 300)
+    >>> wheel.schedule("match-1", time.monotonic() + 310)  # touch: O(1), no move
+    >>> wheel.advance()                                    # [] until due
+"""
+from __future__ import annotations
+
+import math
+import time
+from collections.abc import Callable, Hashable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+
+class TimingWheel(Generic[K]):
+    """
+    Single-level hashed timing wheel keyed by arbitrary hashable keys.
+
+    Entries more than slot_count ticks away stay in their slot for extra
+    rotations and are re-filed each time the slot is visited, so choose
+    slot_count * tick_seconds larger than the longest TTL.
+    """
+
+    __slots__ = ('_tick_seconds', '_slots', '_deadlines', '_slot_ticks', '_current_tick', '_clock')
+
+    def __init__(
+        self,
+        tick_seconds: float = 1.0,
+        slot_count: int = 512,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Create an empty wheel.
+
+        Args:
+            tick_seconds: Slot granularity (entries fire at most one tick late)
+            slot_count: Number of slots in the wheel
+            clock: Monotonic time source (injectable for tests)
+        """
+        if tick_seconds <= 0 or slot_count < 1:
+            raise ValueError("tick_seconds and slot_count must be positive")
+
+        self._tick_seconds = tick_seconds
+        self._slots: list[dict[K, None]] = [{} for _ in range(slot_count)]
+        self._deadlines: dict[K, float] = {}
+        self._slot_ticks: dict[K, int] = {}  # Absolute tick of the slot holding each key
+        self._clock = clock
+        self._current_tick = self._tick_of(clock()) - 1
+
+    def __len__(self) -> int:
+        """Number of scheduled keys."""
+        return len(self._deadlines)
+
+    def __contains__(self, key: object) -> bool:
+        """Check if key is scheduled."""
+        return key in self._deadlines
+
+    def get_deadline(self, key: K) -> float | None:
+        """Get a key's deadline (clock time), or None if not scheduled."""
+        return self._deadlines.get(key)
+
+    def schedule(self, key: K, deadline: float) -> None:
+        """
+        Schedule (or reschedule) key to expire at deadline.
+
+        Args:
+            key: Entry key
+            deadline: Clock time at which the key expires
+        """
+        self._deadlines[key] = deadline
+
+        tick = max(math.ceil(deadline / self._tick_seconds), self._current_tick + 1)
+        slot_tick = self._slot_ticks.get(key)
+        if slot_tick is not None:
+            if slot_tick <= tick:
+                return  # Lazy: re-filed when its current slot is visited
+            del self._slots[slot_tick % len(self._slots)][key]
+
+        self._file(key, tick)
+
+    def cancel(self, key: K) -> bool:
+        """
+        Remove key from the wheel.
+
+        Returns:
+            True if key was scheduled
+        """
+        if self._deadlines.pop(key, None) is None:
+            return False
+        slot_tick = self._slot_ticks.pop(key)
+        del self._slots[slot_tick % len(self._slots)][key]
+        return True
+
+    def advance(self, now: float | None = None) -> list[K]:
+        """
+        Process every tick up to now and remove keys that are due.
+
+        Args:
+            now: Current clock time (defaults to clock())
+
+        Returns:
+            Keys whose deadline has passed, in tick order
+        """
+        now = self._clock() if now is None else now
+        target = self._tick_of(now)
+        if target <= self._current_tick:
+            return []
+
+        slot_count = len(self._slots)
+        # After a long stall, one pass over every slot is enough
+        first = max(self._current_tick + 1, target - slot_count + 1)
+        self._current_tick = target
+
+        expired: list[K] = []
+        for tick in range(first, target + 1):
+            slot = self._slots[tick % slot_count]
+            if not slot:
+                continue
+
+            for key in list(slot):
+                del slot[key]
+                del self._slot_ticks[key]
+                deadline = self._deadlines[key]
+                if deadline <= now:
+                    del self._deadlines[key]
+                    expired.append(key)
+                else:
+                    self._file(key, max(math.ceil(deadline / self._tick_seconds), target + 1))
+
+        return expired
+
+    def clear(self) -> None:
+        """Remove all keys."""
+        for slot in self._slots:
+            slot.clear()
+        self._deadlines.clear()
+        self._slot_ticks.clear()
+
+    def _file(self, key: K, tick: int) -> None:
+        """Place key in the slot for an absolute tick."""
+        self._slots[tick % len(self._slots)][key] = None
+        self._slot_ticks[key] = tick
+
+    def _tick_of(self, when: float) -> int:
+        """Absolute tick containing a clock time."""
+        return math.floor(when / self._tick_seconds)
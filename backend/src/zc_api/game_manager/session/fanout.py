@@ -0,0 +1,85 @@
+"""
+Encode-once, concurrent fan-out.
+
+A payload is serialized once (zc_api.common.codec.encode_message(), or an
+EncodedMessage when targets use different wire formats) and the result is
+handed to every target. fan_out() delivers with a fixed pool of workers
+(bounded concurrency, no task per target) and a timeout per send, and
+reports which targets failed instead of stopping at the first error.
+
+Used for broadcasts, the shutdown notice and (later) spectator streams.
+
+Example:
+    >>> message = EncodedMessage(ServerShutdown(type="server_shutdown", message="bye"))
+    >>> result = await fan_out(writers, message, ConnectionWriter.send_and_drain)
+    >>> result.sent, len(result.failed), len(result.timed_out)
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Generic, TypeVar
+
+from zc_api.common.codec import EncodedMessage
+
+from .outbound import Frame
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class FanoutResult(Generic[T]):
+    """Outcome of one fan_out() call."""
+    sent: int = 0
+    failed: list[tuple[T, BaseException]] = field(default_factory=list)
+    timed_out: list[T] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed and not self.timed_out
+
+    def to_dict(self) -> dict[str, int]:
+        return {"sent": self.sent, "failed": len(self.failed), "timed_out": len(self.timed_out)}
+
+
+async def fan_out(
+    targets: Iterable[T],
+    frame: Frame | EncodedMessage,
+    send: Callable[[T, Frame | EncodedMessage], Awaitable[object]],
+    *,
+    concurrency: int = 64,
+    timeout: float | None = 2.0,
+) -> FanoutResult[T]:
+    """
+    Send one pre-encoded frame to many targets concurrently.
+
+    Args:
+        targets: Sockets, writers, or anything `send` accepts
+        frame: Pre-encoded frame (encode once, share across targets)
+        send: Coroutine function delivering a frame to one target
+        concurrency: Maximum sends in flight
+        timeout: Seconds allowed per send (None = no limit)
+
+    Returns:
+        FanoutResult with the sent count and failed/timed-out targets
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be positive")
+
+    result: FanoutResult[T] = FanoutResult()
+    pending = iter(targets)
+
+    async def worker() -> None:
+        # Workers share one iterator; safe because it is only advanced between awaits
+        for target in pending:
+            try:
+                await asyncio.wait_for(send(target, frame), timeout)
+                result.sent += 1
+            except TimeoutError:
+                result.timed_out.append(target)
+            except Exception as error:
+                result.failed.append((target, error))
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return result
@@ -0,0 +1,145 @@
+"""
+Server-driven heartbeats.
+
+One HeartbeatMonitor task serves every session: each interval it encodes a
+single heartbeat message and queues it on every locally connected socket.
+Clients answer with heartbeat_ack, which measures round-trip time through
+the outbound queue and the network. Any inbound frame counts as a sign of
+life; a socket silent for longer than the timeout is handed to the reap
+callback, so half-open connections free their slot within seconds instead
+of lingering until the session TTL.
+"""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from zc_api.common.codec import EncodedMessage
+from zc_api.models.session import ServerHeartbeat
+
+if TYPE_CHECKING:
+    from .registry import GameSession, SessionRegistry
+
+logger = logging.getLogger(__name__)
+
+# Application close code for sockets reaped after missing heartbeats
+HEARTBEAT_CLOSE_CODE = 4000
+
+# Weight of the newest sample in the smoothed RTT
+_RTT_SMOOTHING = 0.2
+
+# (session, token) of a connection that stopped responding
+ReapCallback = Callable[["GameSession", str], Awaitable[None]]
+
+
+@dataclass(slots=True)
+class HeartbeatState:
+    """Liveness and RTT of one connection."""
+    last_seen: float = field(default_factory=time.monotonic)
+    ping_id: int = 0
+    ping_sent_at: float = 0.0
+    rtt_ms: float | None = None
+    avg_rtt_ms: float | None = None
+
+    def ack(self, heartbeat_id: int, now: float) -> None:
+        """Record an ack; only the latest heartbeat yields an RTT sample."""
+        self.last_seen = now
+        if heartbeat_id != self.ping_id or not self.ping_sent_at:
+            return
+
+        rtt_ms = (now - self.ping_sent_at) * 1000
+        self.rtt_ms = rtt_ms
+        if self.avg_rtt_ms is None:
+            self.avg_rtt_ms = rtt_ms
+        else:
+            self.avg_rtt_ms += (rtt_ms - self.avg_rtt_ms) * _RTT_SMOOTHING
+        self.ping_sent_at = 0.0
+
+    def to_dict(self, now: float) -> dict[str, Any]:
+        return {
+            "rtt_ms": None if self.rtt_ms is None else round(self.rtt_ms, 3),
+            "avg_rtt_ms": None if self.avg_rtt_ms is None else round(self.avg_rtt_ms, 3),
+            "idle_seconds": round(now - self.last_seen, 3),
+        }
+
+
+class HeartbeatMonitor:
+    """Single timer that heartbeats all sessions and reaps dead sockets."""
+
+    def __init__(
+        self,
+        registry: SessionRegistry,
+        on_dead: ReapCallback,
+        interval: float = 5.0,
+        timeout: float = 15.0,
+    ) -> None:
+        if interval <= 0 or timeout <= interval:
+            raise ValueError("need 0 < interval < timeout")
+
+        self._registry = registry
+        self._on_dead = on_dead
+        self._interval = interval
+        self._timeout = timeout
+        self._heartbeat_id = 0
+        self._reaped = 0
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """Start the heartbeat task (idempotent)."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    def get_reaped_count(self) -> int:
+        return self._reaped
+
+    async def tick(self, now: float | None = None) -> int:
+        """
+        Heartbeat every connection once and reap the silent ones.
+
+        Args:
+            now: Monotonic time (defaults to time.monotonic())
+
+        Returns:
+            Number of connections reaped
+        """
+        if now is None:
+            now = time.monotonic()
+
+        self._heartbeat_id += 1
+        heartbeat = EncodedMessage(ServerHeartbeat(type="heartbeat", id=self._heartbeat_id))
+
+        dead: list[tuple[GameSession, str]] = []
+        for session in self._registry.iter_sessions():
+            for token in session.send_heartbeats(heartbeat, self._heartbeat_id, now, self._timeout):
+                dead.append((session, token))
+
+        for session, token in dead:
+            try:
+                await self._on_dead(session, token)
+            except Exception:
+                logger.exception("Failed to reap dead socket in match %s", session.match_id)
+
+        if dead:
+            self._reaped += len(dead)
+            logger.info("Reaped %d connection(s) that missed heartbeats", len(dead))
+        return len(dead)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                await self.tick()
+            except Exception:
+                logger.exception("Heartbeat tick failed")
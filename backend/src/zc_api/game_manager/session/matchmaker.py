@@ -2,9 +2,15 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import logging
+from collections.abc import Sequence
 from dataclasses import dataclass
+from typing import Any, Protocol
 
-from .registry import SessionRegistry
+from .waiting import DEFAULT_PREFERENCES, MatchPreferences, WaitingEntry, WaitingQueue
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass(slots=True)
@@ -13,40 +19,186 @@ class MatchAssignment:
     player_token: str
 
 
-@dataclass(slots=True)
-class WaitingEntry:
-    name: str
-    elemental: str
-    future: asyncio.Future[MatchAssignment]
-
+class MatchmakingClosedError(RuntimeError):
+    """Raised to players queueing on a worker that stopped matchmaking (drain)."""
+    pass
 
-class Matchmaker:
-    def __init__(self, registry: SessionRegistry) -> None:
-        self._registry = registry
-        self._waiting: list[WaitingEntry] = []
-        self._lock = asyncio.Lock()
 
-    async def wait_for_match(self, name: str, elemental: str) -> MatchAssignment:
-        loop = asyncio.get_running_loop()
-        future: asyncio.Future[MatchAssignment] = loop.create_future()
-        entry = WaitingEntry(name=name, elemental=elemental, future=future)
+class MatchFactory(Protocol):
+    """Creates matches: the SessionRegistry, or the backplane hub's match directory."""
 
-        async with self._lock:
-            while self._waiting:
-                other = self._waiting.pop(0)
+    async def create_match(
+        self,
+        name_a: str,
+        elemental_a: str,
+        name_b: str,
+        elemental_b: str,
+    ) -> tuple[str, str, str]: ...
 
-                if other.future.cancelled():
-                    continue
+    async def create_matches(
+        self,
+        players: Sequence[tuple[str, str, str, str]],
+    ) -> list[tuple[str, str, str]]: ...
 
-                match_id, token_other, token_self = await self._registry.create_match(
-                    other.name, other.elemental, name, elemental
-                )
 
-                if not other.future.cancelled():
-                    other.future.set_result(MatchAssignment(match_id=match_id, player_token=token_other))
+class Matchmaker:
+    """
+    Pairs waiting players, oldest first.
 
-                return MatchAssignment(match_id=match_id, player_token=token_self)
+    By default a player is paired as soon as an opponent is waiting (one
+    match per call, under a lock). With a tick_interval, players only queue
+    and a background tick pairs everyone waiting at once, creating all the
+    matches with one bulk create_matches call; call start()/stop() to run it.
+    """
 
-            self._waiting.append(entry)
+    def __init__(self, registry: MatchFactory, tick_interval: float | None = None) -> None:
+        if tick_interval is not None and tick_interval <= 0:
+            raise ValueError("tick_interval must be positive")
 
+        self._registry = registry
+        self._tick_interval = tick_interval
+        self._waiting = WaitingQueue()
+        self._lock = asyncio.Lock()
+        self._closed = False
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """Start the pairing tick (idempotent; no-op when pairing immediately)."""
+        if self._tick_interval is not None and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    def is_batched(self) -> bool:
+        return self._tick_interval is not None
+
+    def close(self) -> None:
+        """Stop accepting players; those still waiting get MatchmakingClosedError."""
+        self._closed = True
+        for entry in self._waiting.drain():
+            entry.future.set_exception(MatchmakingClosedError("matchmaking is closed"))
+
+    def is_closed(self) -> bool:
+        return self._closed
+
+    def get_stats(self) -> dict[str, Any]:
+        """Queue length, wait ages and lifetime counters."""
+        return self._waiting.get_stats()
+
+    async def wait_for_match(
+        self,
+        name: str,
+        elemental: str,
+        preferences: MatchPreferences | None = None,
+    ) -> MatchAssignment:
+        """Queue a player and wait until paired. Cancelling leaves the queue."""
+        future = await self.enqueue(name, elemental, preferences)
         return await future
+
+    async def enqueue(
+        self,
+        name: str,
+        elemental: str,
+        preferences: MatchPreferences | None = None,
+    ) -> asyncio.Future[MatchAssignment]:
+        """
+        Queue a player without waiting (no task per player).
+
+        Returns:
+            Future resolved with the assignment (already done if an opponent
+            was waiting). Cancelling it leaves the queue.
+
+        Raises:
+            MatchmakingClosedError: If matchmaking is closed
+        """
+        if self._closed:
+            raise MatchmakingClosedError("matchmaking is closed")
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[MatchAssignment] = loop.create_future()
+        entry = WaitingEntry(
+            name=name,
+            elemental=elemental,
+            future=future,
+            preferences=preferences or DEFAULT_PREFERENCES,
+        )
+
+        if self._tick_interval is not None:
+            self._waiting.push(entry)
+            return future
+
+        async with self._lock:
+            other = self._waiting.pop_oldest()
+            if other is None:
+                self._waiting.push(entry)
+                return future
+
+            match_id, token_other, token_self = await self._registry.create_match(
+                other.name, other.elemental, name, elemental
+            )
+
+        _resolve(other.future, MatchAssignment(match_id=match_id, player_token=token_other))
+        future.set_result(MatchAssignment(match_id=match_id, player_token=token_self))
+        return future
+
+    async def tick(self) -> int:
+        """
+        Pair waiting players and create their matches in one bulk call.
+
+        The queue is snapshotted synchronously, so players arriving while the
+        matches are created wait for the next tick.
+
+        Returns:
+            Number of matches created
+        """
+        pairs = self._select_pairs()
+        if not pairs:
+            return 0
+
+        try:
+            created = await self._registry.create_matches(
+                [(a.name, a.elemental, b.name, b.elemental) for a, b in pairs]
+            )
+            if len(created) != len(pairs):
+                raise RuntimeError(f"create_matches returned {len(created)} match(es) for {len(pairs)} pair(s)")
+        except Exception as error:
+            for a, b in pairs:
+                _resolve(a.future, error)
+                _resolve(b.future, error)
+            raise
+
+        for (a, b), (match_id, token_a, token_b) in zip(pairs, created, strict=True):
+            _resolve(a.future, MatchAssignment(match_id=match_id, player_token=token_a))
+            _resolve(b.future, MatchAssignment(match_id=match_id, player_token=token_b))
+        return len(pairs)
+
+    def _select_pairs(self) -> list[tuple[WaitingEntry, WaitingEntry]]:
+        """Remove this tick's pairs from the queue (FIFO: everyone, oldest first)."""
+        return self._waiting.pop_pairs()
+
+    async def _run(self) -> None:
+        assert self._tick_interval is not None
+        while True:
+            await asyncio.sleep(self._tick_interval)
+            try:
+                matched = await self.tick()
+            except Exception:
+                logger.exception("Matchmaking tick failed")
+            else:
+                if matched:
+                    logger.debug("Matchmaking tick created %d match(es)", matched)
+
+
+def _resolve(future: asyncio.Future[MatchAssignment], outcome: MatchAssignment | Exception) -> None:
+    """Complete a waiting player's future unless they already left."""
+    if future.done():
+        return
+    if isinstance(outcome, Exception):
+        future.set_exception(outcome)
+    else:
+        future.set_result(outcome)
@@ -0,0 +1,273 @@
+"""
+Per-connection outbound queues.
+
+Each connected socket gets a ConnectionWriter: a bounded queue drained by
+its own writer task. Senders enqueue and return immediately, so game logic
+never waits on a peer's network. When a slow client lets its queue fill up,
+the overflow policy decides what happens:
+
+- DROP_OLDEST: discard the oldest queued message
+- COALESCE: replace the oldest queued message of the same type (state
+  updates where only the latest matters); drop the oldest if none match
+- DISCONNECT: close the socket (the client reconnects and resyncs)
+"""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+from fastapi import WebSocket
+from pydantic import BaseModel
+
+from zc_api.common.codec import JSON_FORMAT, EncodedMessage, MessageFormat, get_message_type
+
+logger = logging.getLogger(__name__)
+
+# Close code for slow consumers ("Try Again Later")
+OVERFLOW_CLOSE_CODE = 1013
+
+# dict -> send_json, str -> text frame, bytes -> binary frame
+Frame = dict[str, Any] | str | bytes
+
+
+class OverflowPolicy(Enum):
+    DROP_OLDEST = "drop_oldest"
+    COALESCE = "coalesce"
+    DISCONNECT = "disconnect"
+
+
+@dataclass(frozen=True, slots=True)
+class OutboundConfig:
+    """Queue settings applied to every ConnectionWriter of a registry."""
+    max_queue_size: int = 256
+    overflow_policy: OverflowPolicy = OverflowPolicy.DISCONNECT
+    # Bulk notices (shutdown): sends in flight and seconds allowed per send
+    fanout_concurrency: int = 64
+    fanout_timeout: float = 2.0
+    # Sequenced messages kept per player for resume (see replay.py)
+    replay_buffer_size: int = 128
+
+
+@dataclass(slots=True)
+class OutboundMetrics:
+    """Counters for one connection's outbound queue."""
+    enqueued: int = 0
+    sent: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+    max_depth: int = 0
+    last_latency_ms: float = 0.0
+    total_latency_ms: float = 0.0
+
+    def to_dict(self, depth: int) -> dict[str, Any]:
+        return {
+            "depth": depth,
+            "max_depth": self.max_depth,
+            "enqueued": self.enqueued,
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "last_latency_ms": round(self.last_latency_ms, 3),
+            "avg_latency_ms": round(self.total_latency_ms / self.sent, 3) if self.sent else 0.0,
+        }
+
+
+@dataclass(slots=True)
+class _QueuedFrame:
+    frame: Frame
+    message_type: str | None
+    enqueued_at: float
+
+
+class ConnectionWriter:
+    """
+    Bounded outbound queue plus writer task for one WebSocket.
+
+    send() never blocks; latency metrics measure enqueue -> send complete.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        max_queue_size: int = 256,
+        overflow_policy: OverflowPolicy = OverflowPolicy.DISCONNECT,
+        message_format: MessageFormat = JSON_FORMAT,
+    ) -> None:
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be positive")
+
+        self._websocket = websocket
+        self._message_format = message_format
+        self._max_queue_size = max_queue_size
+        self._overflow_policy = overflow_policy
+        self._queue: deque[_QueuedFrame] = deque()
+        self._wakeup = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._closed = False
+        self._overflowed = False
+        self._metrics = OutboundMetrics()
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """Start the writer task (idempotent)."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    def get_message_format(self) -> MessageFormat:
+        return self._message_format
+
+    def send_message(self, message: BaseModel | dict[str, Any]) -> bool:
+        """Encode a message in this connection's format and queue it."""
+        if self._closed:
+            return False
+        return self.send(self._message_format.encode(message), get_message_type(message))
+
+    def send(self, frame: Frame | EncodedMessage, message_type: str | None = None) -> bool:
+        """
+        Queue a frame for sending.
+
+        Args:
+            frame: dict (sent as JSON), str (text frame), bytes (binary frame),
+                or an EncodedMessage (resolved to this connection's format)
+            message_type: Key for COALESCE (defaults to the message "type")
+
+        Returns:
+            False if the writer is closed or the frame was rejected
+        """
+        if self._closed:
+            return False
+
+        if isinstance(frame, EncodedMessage):
+            message_type = message_type or frame.message_type
+            frame = frame.frame_for(self._message_format)
+        elif message_type is None and isinstance(frame, dict):
+            message_type = frame.get("type")
+
+        queue = self._queue
+        if len(queue) >= self._max_queue_size and not self._make_room(message_type):
+            return False
+
+        queue.append(_QueuedFrame(frame, message_type, time.perf_counter()))
+        self._metrics.enqueued += 1
+        if len(queue) > self._metrics.max_depth:
+            self._metrics.max_depth = len(queue)
+        self._idle.clear()
+        self._wakeup.set()
+        return True
+
+    async def send_and_drain(self, frame: Frame | EncodedMessage, message_type: str | None = None) -> None:
+        """
+        Queue a frame and wait until the queue is flushed (for fan_out()).
+
+        Raises:
+            ConnectionError: If the writer is closed or rejected the frame
+        """
+        if not self.send(frame, message_type):
+            raise ConnectionError("connection writer is closed")
+        await self._idle.wait()
+        if self._closed:
+            raise ConnectionError("connection closed before the frame was sent")
+
+    async def drain(self, timeout: float | None = None) -> bool:
+        """
+        Wait until every queued frame has been sent.
+
+        Returns:
+            True if the queue drained, False on timeout
+        """
+        if self._task is None:
+            return not self._queue
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+        except TimeoutError:
+            return False
+        return True
+
+    async def close(self) -> None:
+        """Stop the writer task, discarding anything still queued."""
+        self._closed = True
+        self._queue.clear()
+        self._idle.set()
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    def is_closed(self) -> bool:
+        return self._closed
+
+    def get_depth(self) -> int:
+        return len(self._queue)
+
+    def get_metrics(self) -> dict[str, Any]:
+        return self._metrics.to_dict(len(self._queue))
+
+    def _make_room(self, message_type: str | None) -> bool:
+        """Apply the overflow policy to a full queue. Returns True if there is room."""
+        queue = self._queue
+        policy = self._overflow_policy
+
+        if policy is OverflowPolicy.DISCONNECT:
+            logger.warning("Outbound queue full (%d); disconnecting slow client", len(queue))
+            self._closed = True
+            self._overflowed = True
+            queue.clear()
+            self._wakeup.set()
+            return False
+
+        if policy is OverflowPolicy.COALESCE and message_type is not None:
+            for index, queued in enumerate(queue):
+                if queued.message_type == message_type:
+                    del queue[index]
+                    self._metrics.coalesced += 1
+                    return True
+
+        queue.popleft()
+        self._metrics.dropped += 1
+        return True
+
+    async def _run(self) -> None:
+        """Writer task: send queued frames in order until closed."""
+        queue = self._queue
+        metrics = self._metrics
+        websocket = self._websocket
+        try:
+            while True:
+                if not queue:
+                    self._idle.set()
+                    if self._overflowed:
+                        await websocket.close(code=OVERFLOW_CLOSE_CODE, reason="send queue overflow")
+                        return
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                    continue
+
+                queued = queue.popleft()
+                frame = queued.frame
+                if isinstance(frame, dict):
+                    await websocket.send_json(frame)
+                elif isinstance(frame, str):
+                    await websocket.send_text(frame)
+                else:
+                    await websocket.send_bytes(frame)
+
+                latency_ms = (time.perf_counter() - queued.enqueued_at) * 1000
+                metrics.sent += 1
+                metrics.last_latency_ms = latency_ms
+                metrics.total_latency_ms += latency_ms
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Socket is gone; the receive loop handles the disconnect
+            logger.debug("Outbound writer stopped after send failure", exc_info=True)
+            self._closed = True
+            queue.clear()
+            self._idle.set()
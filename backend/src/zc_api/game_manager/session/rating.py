@@ -0,0 +1,141 @@
+"""
+Skill-aware matchmaking.
+
+Waiting players are indexed per region in a list of (rating, ticket) keys
+kept sorted by rating. Each tick walks the queue oldest first and pairs
+every player with their nearest-rated acceptable opponent: a bisect finds
+the player's position in O(log n), and the search walks outwards only as
+far as the player's rating window allows. The window starts narrow and
+widens the longer the player waits, so nobody waits forever for a perfect
+match.
+
+Elemental preferences must hold both ways. They filter candidates during
+the walk, so a pool full of rejected opponents costs more than log n.
+"""
+from __future__ import annotations
+
+import math
+import time
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from typing import Any
+
+from .matchmaker import MatchFactory, Matchmaker
+from .waiting import WaitingEntry, WaitingQueue
+
+
+@dataclass(frozen=True, slots=True)
+class RatingWindow:
+    """Allowed rating gap as a function of time waited."""
+    initial: float = 100.0
+    widen_per_second: float = 25.0
+    maximum: float = 1000.0
+
+    def get_width(self, waited_seconds: float) -> float:
+        return min(self.initial + self.widen_per_second * max(waited_seconds, 0.0), self.maximum)
+
+
+class RatingPool(WaitingQueue):
+    """Waiting queue with a per-region rating index for nearest-neighbour pairing."""
+
+    __slots__ = ('_window', '_ratings')
+
+    def __init__(self, window: RatingWindow) -> None:
+        super().__init__()
+        self._window = window
+        # Region -> (rating, ticket), sorted
+        self._ratings: dict[str | None, list[tuple[float, int]]] = {}
+
+    def pop_matches(self, now: float | None = None) -> list[tuple[WaitingEntry, WaitingEntry]]:
+        """
+        Pair every player who has an acceptable opponent, longest-waiting first.
+
+        Args:
+            now: Monotonic time (defaults to time.monotonic())
+
+        Returns:
+            (older, opponent) pairs, removed from the pool
+        """
+        if now is None:
+            now = time.monotonic()
+
+        pairs: list[tuple[WaitingEntry, WaitingEntry]] = []
+        for entry in list(self._entries.values()):
+            if entry.ticket not in self._entries or entry.future.done():
+                continue
+
+            opponent = self._find_opponent(entry, self._window.get_width(now - entry.enqueued_at))
+            if opponent is not None:
+                self._take(entry.ticket)
+                self._take(opponent.ticket)
+                pairs.append((entry, opponent))
+
+        self._matched += 2 * len(pairs)
+        return pairs
+
+    def get_stats(self, now: float | None = None) -> dict[str, Any]:
+        stats = super().get_stats(now)
+        stats["regions"] = {region or "": len(keys) for region, keys in self._ratings.items()}
+        return stats
+
+    def _find_opponent(self, entry: WaitingEntry, width: float) -> WaitingEntry | None:
+        """Nearest-rated live opponent within width that both sides accept."""
+        preferences = entry.preferences
+        keys = self._ratings[preferences.region]
+        position = bisect_left(keys, (preferences.rating, entry.ticket))
+        left, right = position - 1, position + 1
+
+        while True:
+            left_gap = preferences.rating - keys[left][0] if left >= 0 else math.inf
+            right_gap = keys[right][0] - preferences.rating if right < len(keys) else math.inf
+            if min(left_gap, right_gap) > width:
+                return None
+
+            if left_gap <= right_gap:
+                candidate = self._entries[keys[left][1]]
+                left -= 1
+            else:
+                candidate = self._entries[keys[right][1]]
+                right += 1
+
+            if (
+                not candidate.future.done()
+                and preferences.accepts(candidate.elemental)
+                and candidate.preferences.accepts(entry.elemental)
+            ):
+                return candidate
+
+    def _index(self, entry: WaitingEntry) -> None:
+        insort(self._ratings.setdefault(entry.preferences.region, []), (entry.preferences.rating, entry.ticket))
+
+    def _discard(self, entry: WaitingEntry) -> None:
+        region = entry.preferences.region
+        keys = self._ratings[region]
+        key = (entry.preferences.rating, entry.ticket)
+        position = bisect_left(keys, key)
+        if position < len(keys) and keys[position] == key:
+            del keys[position]
+        if not keys:
+            del self._ratings[region]
+
+
+class RatedMatchmaker(Matchmaker):
+    """
+    Matchmaker that pairs by rating, region and elemental preferences.
+
+    Always batched: players queue, and each tick pairs everyone who has an
+    acceptable opponent (see RatingPool); the rest wait with a wider window.
+    """
+
+    def __init__(
+        self,
+        registry: MatchFactory,
+        tick_interval: float = 0.5,
+        window: RatingWindow | None = None,
+    ) -> None:
+        super().__init__(registry, tick_interval=tick_interval)
+        self._pool = RatingPool(window or RatingWindow())
+        self._waiting = self._pool
+
+    def _select_pairs(self) -> list[tuple[WaitingEntry, WaitingEntry]]:
+        return self._pool.pop_matches()
@@ -7,12 +7,27 @@ GameManager orchestrates when to send messages and what they contain.
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
 import secrets
 import time
-from dataclasses import dataclass
+import zlib
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+from enum import Enum
 
 from fastapi import WebSocket
+from pydantic import BaseModel
+
+from zc_api.common.codec import JSON_FORMAT, EncodedMessage, MessageFormat
+from zc_api.config import Settings
+from zc_api.models.session import ServerShutdown
+
+from .expiry import TimingWheel
+from .fanout import FanoutResult, fan_out
+from .heartbeat import HeartbeatState
+from .outbound import ConnectionWriter, Frame, OutboundConfig
+from .replay import ReplayBuffer, stamp_sequence
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +35,39 @@ logger = logging.getLogger(__name__)
 SESSION_TTL_SECONDS = 300  # 5 minutes
 
 
+class SessionState(Enum):
+    WAITING_FOR_JOIN = "waiting_for_join"
+    IN_GAME = "in_game"
+    DISCONNECTED = "disconnected"
+
+
+@dataclass(frozen=True, slots=True)
+class SessionTtls:
+    """Inactivity TTL (seconds) per session state."""
+    waiting_for_join: float = 120
+    in_game: float = SESSION_TTL_SECONDS
+    disconnected: float = 60
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> SessionTtls:
+        return cls(
+            waiting_for_join=settings.session_ttl_waiting_seconds,
+            in_game=settings.session_ttl_in_game_seconds,
+            disconnected=settings.session_ttl_disconnected_seconds,
+        )
+
+    def get_longest(self) -> float:
+        """Longest TTL of any state (how long a match can outlive its last activity)."""
+        return max(self.waiting_for_join, self.in_game, self.disconnected)
+
+    def for_state(self, state: SessionState) -> float:
+        if state is SessionState.IN_GAME:
+            return self.in_game
+        if state is SessionState.WAITING_FOR_JOIN:
+            return self.waiting_for_join
+        return self.disconnected
+
+
 @dataclass(frozen=True, slots=True)
 class PlayerSlot:
     token: str
@@ -37,22 +85,91 @@ class GameSession:
     - Track connection state
     
     Does NOT contain game logic or message construction.
+
+    Activity and state changes push the session's expiry deadline
+    (last activity + TTL for the current state) into the registry's
+    timing wheel, if one is attached.
+
+    Each socket has a ConnectionWriter; send_to/broadcast only enqueue,
+    so callers never wait on a peer's network.
+
+    send_to/broadcast number messages with a session-wide seq and keep
+    them in a per-player ReplayBuffer, also while that player is away,
+    so a reconnecting client can replay() what it missed.
+
+    Local connections also carry heartbeat state (liveness, RTT) driven
+    by the HeartbeatMonitor.
     """
 
-    def __init__(self, match_id: str, player_a: PlayerSlot, player_b: PlayerSlot) -> None:
+    def __init__(
+        self,
+        match_id: str,
+        player_a: PlayerSlot,
+        player_b: PlayerSlot,
+        ttls: SessionTtls | None = None,
+        expiry: TimingWheel[str] | None = None,
+        outbound: OutboundConfig | None = None,
+    ) -> None:
         self.match_id = match_id
         self._players = (player_a, player_b)
         self._sockets_by_token: dict[str, WebSocket] = {}
+        # Players connected on other workers (see zc_api.game_manager.backplane)
+        self._remote_tokens: frozenset[str] = frozenset()
+        self._writers_by_token: dict[str, ConnectionWriter] = {}
+        self._heartbeats: dict[str, HeartbeatState] = {}
+        self._outbound = outbound or OutboundConfig()
         self._lock = asyncio.Lock()
-        self._last_activity = time.monotonic()
+        self._ttls = ttls or SessionTtls()
+        self._expiry = expiry
+        self._state = SessionState.WAITING_FOR_JOIN
+        self._started = False
+        self._seq = 0
+        self._replay = {
+            player.token: ReplayBuffer(self._outbound.replay_buffer_size)
+            for player in self._players
+        }
+        self._touch()
 
     def get_players(self) -> tuple[PlayerSlot, PlayerSlot]:
         return self._players
 
+    def get_state(self) -> SessionState:
+        return self._state
+
+    def has_started(self) -> bool:
+        """True once both players have been connected at the same time."""
+        return self._started
+
+    def get_last_seq(self) -> int:
+        """Seq of the most recent sequenced message (0 if none yet)."""
+        return self._seq
+
+    def get_deadline(self) -> float:
+        """Monotonic time at which the session expires without further activity."""
+        return self._last_activity + self._ttls.for_state(self._state)
+
     def _touch(self) -> None:
         self._last_activity = time.monotonic()
+        if self._expiry is not None:
+            self._expiry.schedule(self.match_id, self.get_deadline())
+
+    def _set_state(self, state: SessionState) -> None:
+        self._state = state
+        self._touch()
 
-    def is_stale(self, ttl_seconds: float = SESSION_TTL_SECONDS) -> bool:
+    def _update_state(self) -> None:
+        """Derive the state from local and remote connections."""
+        if len(self.get_connected_tokens()) == 2:
+            self._started = True
+            self._set_state(SessionState.IN_GAME)
+        elif self._state is SessionState.IN_GAME:
+            self._set_state(SessionState.DISCONNECTED)
+        else:
+            self._touch()
+
+    def is_stale(self, ttl_seconds: float | None = None) -> bool:
+        if ttl_seconds is None:
+            ttl_seconds = self._ttls.for_state(self._state)
         return (time.monotonic() - self._last_activity) > ttl_seconds
 
     def get_player_by_token(self, token: str) -> PlayerSlot | None:
@@ -79,7 +196,12 @@ class GameSession:
 
         return None
 
-    async def join(self, token: str, websocket: WebSocket) -> PlayerSlot:
+    async def join(
+        self,
+        token: str,
+        websocket: WebSocket,
+        message_format: MessageFormat = JSON_FORMAT,
+    ) -> PlayerSlot:
         """Register a WebSocket for the given token. Returns the player slot."""
         async with self._lock:
             player = self.get_player_by_token(token)
@@ -87,39 +209,195 @@ class GameSession:
             if player is None:
                 raise ValueError("invalid token")
 
+            previous = self._writers_by_token.pop(token, None)
+            if previous is not None:
+                await previous.close()
+
+            writer = ConnectionWriter(
+                websocket,
+                max_queue_size=self._outbound.max_queue_size,
+                overflow_policy=self._outbound.overflow_policy,
+                message_format=message_format,
+            )
+            writer.start()
+            self._writers_by_token[token] = writer
             self._sockets_by_token[token] = websocket
-            self._touch()
+            self._heartbeats[token] = HeartbeatState()
+            self._update_state()
 
             return player
 
-    async def leave(self, token: str) -> None:
-        """Remove WebSocket for the given token."""
+    async def leave(self, token: str, websocket: WebSocket | None = None) -> bool:
+        """
+        Remove WebSocket for the given token.
+
+        Args:
+            websocket: Only remove it if it is still the registered socket
+                (a resumed connection may have replaced it already)
+
+        Returns:
+            True if a connection was removed
+        """
         async with self._lock:
-            self._sockets_by_token.pop(token, None)
+            current = self._sockets_by_token.get(token)
+            if current is None or (websocket is not None and current is not websocket):
+                return False
+
+            del self._sockets_by_token[token]
+            self._heartbeats.pop(token, None)
+            writer = self._writers_by_token.pop(token, None)
+            if writer is not None:
+                await writer.close()
+            self._update_state()
+            return True
+
+    async def close(self, code: int = 1000, reason: str = "") -> None:
+        """Disconnect every local player (stop writers, close sockets); the session is being discarded."""
+        async with self._lock:
+            writers = list(self._writers_by_token.values())
+            sockets = list(self._sockets_by_token.values())
+            self._writers_by_token.clear()
+            self._sockets_by_token.clear()
+            # No _update_state(): that would schedule the removed session again
+            self._heartbeats.clear()
+
+        for writer in writers:
+            await writer.close()
+        for websocket in sockets:
+            # The peer may already be gone
+            with contextlib.suppress(Exception):
+                await websocket.close(code=code, reason=reason)
+
+    def set_remote_tokens(self, tokens: frozenset[str]) -> None:
+        """Set which players are connected on other workers."""
+        self._remote_tokens = tokens - self._sockets_by_token.keys()
+        self._update_state()
+
+    def get_socket(self, token: str) -> WebSocket | None:
+        """WebSocket of a player connected to this worker."""
+        return self._sockets_by_token.get(token)
+
+    def record_inbound(self, token: str) -> None:
+        """Note a frame from the player (proof the socket is alive)."""
+        state = self._heartbeats.get(token)
+        if state is not None:
+            state.last_seen = time.monotonic()
+        self._touch()
+
+    def ack_heartbeat(self, token: str, heartbeat_id: int) -> None:
+        """Record a heartbeat_ack and update the player's RTT."""
+        state = self._heartbeats.get(token)
+        if state is not None:
+            state.ack(heartbeat_id, time.monotonic())
+
+    def send_heartbeats(
+        self,
+        heartbeat: EncodedMessage,
+        heartbeat_id: int,
+        now: float,
+        timeout: float,
+    ) -> list[str]:
+        """
+        Queue a heartbeat on every live local connection (HeartbeatMonitor).
+
+        Returns:
+            Tokens whose connection has been silent for longer than timeout
+        """
+        dead: list[str] = []
+        for token, state in self._heartbeats.items():
+            if now - state.last_seen > timeout:
+                dead.append(token)
+                continue
+
+            writer = self._writers_by_token.get(token)
+            if writer is not None and writer.send(heartbeat):
+                state.ping_id = heartbeat_id
+                state.ping_sent_at = now
+        return dead
+
+    def get_heartbeat_metrics(self) -> dict[int, dict]:
+        """
+        RTT and idle time keyed by player slot (local connections only).
+
+        Slots index get_players(); names are not unique, and tokens are
+        credentials, so neither is used as the key.
+        """
+        now = time.monotonic()
+        metrics = {}
+        for slot, player in enumerate(self._players):
+            state = self._heartbeats.get(player.token)
+            if state is not None:
+                metrics[slot] = state.to_dict(now)
+        return metrics
+
+    def has_local(self, token: str) -> bool:
+        """True if the player's socket is connected to this worker."""
+        return token in self._writers_by_token
+
+    def get_connected_tokens(self) -> frozenset[str]:
+        """Tokens connected here or (per the backplane) on another worker."""
+        return self._remote_tokens | self._sockets_by_token.keys()
 
     async def get_connected_count(self) -> int:
-        """Return number of connected WebSockets."""
+        """Return number of connected players (on any worker)."""
         async with self._lock:
-            return len(self._sockets_by_token)
+            return len(self.get_connected_tokens())
 
     async def are_both_connected(self) -> bool:
         """Return True if both players are connected."""
         return await self.get_connected_count() == 2
 
-    async def send_to(self, token: str, payload: dict) -> bool:
-        """Send payload to specific player by token. Returns True if sent."""
+    def _sequence(self, payload: BaseModel | dict, tokens: tuple[str, ...]) -> EncodedMessage:
+        """Number a payload and record it for replay to the given players."""
+        stamped = stamp_sequence(payload, self._seq + 1)
+        if stamped is None:
+            return EncodedMessage(payload)
+
+        self._seq += 1
+        message = EncodedMessage(stamped)
+        for token in tokens:
+            self._replay[token].append(self._seq, message)
+        return message
+
+    async def send_to(self, token: str, payload: BaseModel | dict) -> bool:
+        """
+        Queue payload for a specific player by token.
+
+        The message is buffered for replay even if the player is not connected.
+
+        Returns:
+            True if queued on a live connection
+        """
         self._touch()
 
-        async with self._lock:
-            ws = self._sockets_by_token.get(token)
+        if token not in self._replay:
+            return False
 
-        if ws is None:
+        message = self._sequence(payload, (token,))
+        writer = self._writers_by_token.get(token)
+
+        if writer is None:
             return False
 
-        await ws.send_json(payload)
-        return True
+        return writer.send(message)
+
+    async def send_frame_to(
+        self,
+        token: str,
+        frame: Frame | EncodedMessage,
+        message_type: str | None = None,
+    ) -> bool:
+        """Queue a pre-encoded frame for a specific player, unsequenced. Returns True if queued."""
+        self._touch()
 
-    async def send_to_opponent(self, token: str, payload: dict) -> bool:
+        writer = self._writers_by_token.get(token)
+
+        if writer is None:
+            return False
+
+        return writer.send(frame, message_type)
+
+    async def send_to_opponent(self, token: str, payload: BaseModel | dict) -> bool:
         """Send payload to opponent of given token. Returns True if sent."""
         opponent = self.get_opponent_of(token)
 
@@ -128,27 +406,125 @@ class GameSession:
 
         return await self.send_to(opponent.token, payload)
 
-    async def broadcast(self, payload: dict) -> None:
-        """Send payload to all connected players."""
+    async def broadcast(self, payload: BaseModel | dict) -> None:
+        """
+        Queue payload for all connected players (serialized once per wire format).
+
+        Both players' replay buffers record it under a single seq.
+        """
+        await self.broadcast_frame(self._sequence(payload, tuple(self._replay)))
+
+    async def broadcast_frame(self, frame: Frame | EncodedMessage, message_type: str | None = None) -> None:
+        """Queue a pre-encoded frame (or EncodedMessage) for all connected players, unsequenced."""
         self._touch()
 
-        async with self._lock:
-            sockets = list(self._sockets_by_token.values())
+        for writer in list(self._writers_by_token.values()):
+            writer.send(frame, message_type)
+
+    def replay(self, token: str, last_seq: int) -> bool:
+        """
+        Re-queue the sequenced messages a reconnected player missed.
 
-        for ws in sockets:
-            await ws.send_json(payload)
+        Call right after join(), before anything else is sent to the player.
+
+        Args:
+            last_seq: Last seq the client received (0 = none)
+
+        Returns:
+            True if every missed message was queued; False if some were
+            evicted (or last_seq is ahead of the session) and the caller
+            must send a snapshot instead
+        """
+        buffer = self._replay.get(token)
+        writer = self._writers_by_token.get(token)
+        if buffer is None or writer is None or last_seq > self._seq:
+            return False
+
+        missed = buffer.since(last_seq)
+        if missed is None:
+            return False
+
+        for _, message in missed:
+            if not writer.send(message):
+                return False
+        return True
+
+    def get_writers(self) -> list[ConnectionWriter]:
+        """Outbound writers of currently connected players."""
+        return list(self._writers_by_token.values())
+
+    async def drain(self, timeout: float | None = None) -> bool:
+        """Wait until all queued messages are sent. Returns False on timeout."""
+        writers = list(self._writers_by_token.values())
+        results = await asyncio.gather(*(writer.drain(timeout) for writer in writers))
+        return all(results)
+
+    def get_outbound_metrics(self) -> dict[int, dict]:
+        """Outbound queue depth/latency metrics keyed by player slot (see get_heartbeat_metrics)."""
+        metrics = {}
+        for slot, player in enumerate(self._players):
+            writer = self._writers_by_token.get(player.token)
+            if writer is not None:
+                metrics[slot] = writer.get_metrics()
+        return metrics
+
+
+@dataclass(slots=True)
+class SessionShard:
+    """One partition of the session registry, with its own counters."""
+    index: int
+    sessions: dict[str, GameSession] = field(default_factory=dict)
+    created: int = 0
+    removed: int = 0
+    expired: int = 0
+
+
+def shard_index(match_id: str, shard_count: int) -> int:
+    """
+    Map a match ID to a shard (stable across processes, unlike hash()).
+
+    shard_count must be a power of two.
+    """
+    return zlib.crc32(match_id.encode()) & (shard_count - 1)
 
 
 class SessionRegistry:
-    """Registry of active game sessions."""
+    """
+    Registry of active game sessions, sharded by match ID hash.
 
-    def __init__(self) -> None:
-        self._sessions: dict[str, GameSession] = {}
-        self._lock = asyncio.Lock()
+    All methods run on the event loop thread. Reads and writes are plain
+    dict operations with no await in between, so they are atomic without
+    a lock; joins and admin listings never queue behind each other.
+    Bulk iteration takes a per-shard snapshot, so sessions may be added or
+    removed while a caller awaits between items.
+
+    Expiry uses a timing wheel: sessions reschedule themselves on activity
+    and the cleanup task only visits sessions whose deadline has passed.
+    """
+
+    def __init__(
+        self,
+        shard_count: int = 16,
+        ttls: SessionTtls | None = None,
+        expiry_tick_seconds: float = 1.0,
+        outbound: OutboundConfig | None = None,
+    ) -> None:
+        if shard_count < 1 or shard_count & (shard_count - 1):
+            raise ValueError("shard_count must be a power of two")
+
+        self._shards = tuple(SessionShard(index=i) for i in range(shard_count))
+        self._ttls = ttls or SessionTtls()
+        self._outbound = outbound or OutboundConfig()
+        self._expiry_tick_seconds = expiry_tick_seconds
+        # Wheel spans the longest TTL so entries never need extra rotations
+        self._expiry = TimingWheel[str](
+            tick_seconds=expiry_tick_seconds,
+            slot_count=int(self._ttls.get_longest() / expiry_tick_seconds) + 2,
+        )
         self._cleanup_task: asyncio.Task[None] | None = None
 
     async def start(self) -> None:
-        """Start background cleanup task. Call on app startup."""
+        """Start background expiry task. Call on app startup."""
         if self._cleanup_task is None:
             self._cleanup_task = asyncio.create_task(self._cleanup_loop())
 
@@ -168,33 +544,57 @@ class SessionRegistry:
 
     async def _notify_shutdown(self) -> None:
         """Send shutdown notification to all connected players."""
-        async with self._lock:
-            sessions = list(self._sessions.values())
+        shutdown_msg = ServerShutdown(type="server_shutdown", message="Server is shutting down")
+        result = await self.notify_all(shutdown_msg)
+
+        logger.info("Sent shutdown notification: %s", result.to_dict())
+
+    async def notify_all(self, message: BaseModel) -> FanoutResult[ConnectionWriter]:
+        """
+        Send one unsequenced message to every connected player and wait for delivery.
+
+        Serialized once per format; sends run with the configured fan-out
+        concurrency and per-send timeout, and failures (connection may
+        already be closed) are only counted.
+        """
+        writers = [writer for session in self.iter_sessions() for writer in session.get_writers()]
+        return await fan_out(
+            writers,
+            EncodedMessage(message),
+            ConnectionWriter.send_and_drain,
+            concurrency=self._outbound.fanout_concurrency,
+            timeout=self._outbound.fanout_timeout,
+        )
 
-        shutdown_msg = {"type": "server_shutdown", "message": "Server is shutting down"}
-        for session in sessions:
+    async def _cleanup_loop(self) -> None:
+        """Remove expired sessions once per wheel tick."""
+        while True:
+            await asyncio.sleep(self._expiry_tick_seconds)
             try:
-                await session.broadcast(shutdown_msg)
+                await self.expire_sessions()
             except Exception:
-                # Ignore errors during shutdown - connection may already be closed
-                pass
+                logger.exception("Session cleanup failed")
 
-        logger.info("Sent shutdown notification to %d session(s)", len(sessions))
+    async def expire_sessions(self, now: float | None = None) -> list[str]:
+        """
+        Remove sessions whose deadline has passed, disconnecting any player still attached.
 
-    async def _cleanup_loop(self) -> None:
-        """Periodically remove stale sessions."""
-        while True:
-            await asyncio.sleep(60)
-            await self._remove_stale_sessions()
+        Args:
+            now: Monotonic time (defaults to time.monotonic())
 
-    async def _remove_stale_sessions(self) -> None:
-        async with self._lock:
-            stale_ids = [mid for mid, session in self._sessions.items() if session.is_stale()]
-            for mid in stale_ids:
-                self._sessions.pop(mid, None)
+        Returns:
+            Match IDs of removed sessions
+        """
+        stale_ids = self._expiry.advance(now)
+        for mid in stale_ids:
+            shard = self._shard_for(mid)
+            if (session := shard.sessions.pop(mid, None)) is not None:
+                shard.expired += 1
+                await session.close(reason="session expired")
 
         if stale_ids:
             logger.info("Removed %d stale session(s): %s", len(stale_ids), stale_ids)
+        return stale_ids
 
     async def create_match(
         self,
@@ -204,37 +604,104 @@ class SessionRegistry:
         elemental_b: str,
     ) -> tuple[str, str, str]:
         """Create a new match session. Returns (match_id, token_a, token_b)."""
-        match_id = secrets.token_urlsafe(12)
-        token_a = secrets.token_urlsafe(24)
-        token_b = secrets.token_urlsafe(24)
+        (created,) = await self.create_matches([(name_a, elemental_a, name_b, elemental_b)])
+        return created
+
+    async def create_matches(
+        self,
+        players: Sequence[tuple[str, str, str, str]],
+    ) -> list[tuple[str, str, str]]:
+        """
+        Create many match sessions at once (batched matchmaking).
+
+        Args:
+            players: (name_a, elemental_a, name_b, elemental_b) per match
+
+        Returns:
+            (match_id, token_a, token_b) per match, in the same order
+        """
+        created: list[tuple[str, str, str]] = []
+        for name_a, elemental_a, name_b, elemental_b in players:
+            match_id = secrets.token_urlsafe(12)
+            token_a = secrets.token_urlsafe(24)
+            token_b = secrets.token_urlsafe(24)
+            self.add_session(
+                match_id,
+                PlayerSlot(token=token_a, name=name_a, elemental=elemental_a),
+                PlayerSlot(token=token_b, name=name_b, elemental=elemental_b),
+            )
+            created.append((match_id, token_a, token_b))
+        return created
+
+    def add_session(self, match_id: str, player_a: PlayerSlot, player_b: PlayerSlot) -> GameSession:
+        """Register a session for a match created elsewhere (e.g. on another worker)."""
+        shard = self._shard_for(match_id)
+        session = shard.sessions.get(match_id)
+        if session is not None:
+            return session
 
         session = GameSession(
             match_id=match_id,
-            player_a=PlayerSlot(token=token_a, name=name_a, elemental=elemental_a),
-            player_b=PlayerSlot(token=token_b, name=name_b, elemental=elemental_b),
+            player_a=player_a,
+            player_b=player_b,
+            ttls=self._ttls,
+            expiry=self._expiry,
+            outbound=self._outbound,
         )
-
-        async with self._lock:
-            self._sessions[match_id] = session
-
-        return match_id, token_a, token_b
+        shard.sessions[match_id] = session
+        shard.created += 1
+        return session
 
     async def get_session(self, match_id: str) -> GameSession | None:
-        async with self._lock:
-            return self._sessions.get(match_id)
+        return self.get_session_nowait(match_id)
+
+    def get_session_nowait(self, match_id: str) -> GameSession | None:
+        """Synchronous lookup for callers that are not coroutines."""
+        return self._shard_for(match_id).sessions.get(match_id)
 
     async def remove_session(self, match_id: str) -> None:
-        async with self._lock:
-            self._sessions.pop(match_id, None)
+        shard = self._shard_for(match_id)
+        if shard.sessions.pop(match_id, None) is not None:
+            shard.removed += 1
+        self._expiry.cancel(match_id)
+
+    def iter_sessions(self) -> Iterator[GameSession]:
+        """Iterate all sessions, one shard snapshot at a time."""
+        for shard in self._shards:
+            yield from list(shard.sessions.values())
+
+    def get_session_count(self) -> int:
+        """Total number of active sessions."""
+        return sum(len(shard.sessions) for shard in self._shards)
+
+    def get_connected_counts(self) -> tuple[int, int]:
+        """(sessions with at least one connected player, connected players) on any worker."""
+        sessions = players = 0
+        for shard in self._shards:
+            for session in shard.sessions.values():
+                connected = len(session.get_connected_tokens())
+                if connected:
+                    sessions += 1
+                    players += connected
+        return sessions, players
+
+    def get_shard_stats(self) -> list[dict]:
+        """Per-shard session counts and lifetime counters (admin/debug)."""
+        return [
+            {
+                "shard": shard.index,
+                "sessions": len(shard.sessions),
+                "created": shard.created,
+                "removed": shard.removed,
+                "expired": shard.expired,
+            }
+            for shard in self._shards
+        ]
 
     async def get_all_sessions_info(self) -> list[dict]:
         """Get info about all active sessions for admin/debug purposes."""
-        # Collect sessions under lock, then query each outside to avoid holding lock during await
-        async with self._lock:
-            sessions = list(self._sessions.values())
-
         result = []
-        for session in sessions:
+        for session in self.iter_sessions():
             result.append({
                 "match_id": session.match_id,
                 "players": [
@@ -242,6 +709,13 @@ class SessionRegistry:
                     for p in session.get_players()
                 ],
                 "connected_count": await session.get_connected_count(),
+                "state": session.get_state().value,
+                "seq": session.get_last_seq(),
+                "outbound": session.get_outbound_metrics(),
+                "heartbeat": session.get_heartbeat_metrics(),
                 "is_stale": session.is_stale(),
             })
         return result
+
+    def _shard_for(self, match_id: str) -> SessionShard:
+        return self._shards[shard_index(match_id, len(self._shards))]
@@ -0,0 +1,91 @@
+"""
+Sequence-numbered replay buffers for session resume.
+
+Every sequenced message a session sends carries a session-wide `seq`
+(1, 2, 3, ...). Each player keeps a bounded ring of the messages addressed
+to them, whether or not they were connected at the time. A client that
+reconnects with the last seq it saw gets exactly the messages it missed;
+if some of them were already evicted from the ring, the caller falls back
+to a full snapshot instead.
+
+Example:
+    >>> buffer = ReplayBuffer(capacity=2)
+    >>> for seq in (1, 2, 3):
+    ...     buffer.append(seq, EncodedMessage({"type": "pinged", "seq": seq}))
+    >>> [seq for seq, _ in buffer.since(1)]   # [2, 3]
+    >>> buffer.since(0)                        # None: seq 1 was evicted
+"""
+from __future__ import annotations
+
+from collections import deque
+from typing import Any
+
+from pydantic import BaseModel
+
+from zc_api.common.codec import EncodedMessage
+
+
+def stamp_sequence(message: BaseModel | dict[str, Any], seq: int) -> BaseModel | dict[str, Any] | None:
+    """
+    Copy a message with its `seq` set.
+
+    Returns:
+        The stamped copy, or None if the message model has no `seq` field
+        (such messages are sent unsequenced and are not replayed)
+    """
+    if isinstance(message, BaseModel):
+        if "seq" not in type(message).model_fields:
+            return None
+        return message.model_copy(update={"seq": seq})
+    return {**message, "seq": seq}
+
+
+class ReplayBuffer:
+    """Ring of the most recent (seq, message) pairs sent to one player."""
+
+    __slots__ = ('_entries', '_evicted_through')
+
+    def __init__(self, capacity: int = 128) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+
+        self._entries: deque[tuple[int, EncodedMessage]] = deque(maxlen=capacity)
+        # Highest seq that fell out of the ring (0 = nothing lost yet)
+        self._evicted_through = 0
+
+    def append(self, seq: int, message: EncodedMessage) -> None:
+        """Record a message; seq must be greater than any recorded so far."""
+        entries = self._entries
+        if len(entries) == entries.maxlen:
+            self._evicted_through = entries[0][0]
+        entries.append((seq, message))
+
+    def since(self, last_seq: int) -> list[tuple[int, EncodedMessage]] | None:
+        """
+        Messages with seq > last_seq, oldest first.
+
+        Returns:
+            The missed messages (possibly empty), or None if some were
+            already evicted and the client needs a snapshot
+        """
+        if last_seq < self._evicted_through:
+            return None
+
+        entries = self._entries
+        if not entries or entries[-1][0] <= last_seq:
+            return []
+
+        # Walk back from the newest entry; resumes usually miss only a few
+        missed: list[tuple[int, EncodedMessage]] = []
+        for entry in reversed(entries):
+            if entry[0] <= last_seq:
+                break
+            missed.append(entry)
+        missed.reverse()
+        return missed
+
+    def get_last_seq(self) -> int:
+        return self._entries[-1][0] if self._entries else self._evicted_through
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,163 @@
+"""
+Matchmaking wait queue.
+
+FIFO of waiting players backed by an OrderedDict keyed by ticket: push,
+pop-oldest and removal of any entry are O(1). Each entry's future removes
+it through a done-callback, so players who disconnect (their future is
+cancelled) leave the queue immediately instead of being skipped later.
+"""
+from __future__ import annotations
+
+import asyncio
+import itertools
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .matchmaker import MatchAssignment
+
+
+DEFAULT_RATING = 1500.0
+
+
+@dataclass(frozen=True, slots=True)
+class MatchPreferences:
+    """
+    What a player brings to matchmaking beyond name and elemental.
+
+    Only the rated matchmaker reads these; FIFO matchmaking ignores them.
+    """
+    rating: float = DEFAULT_RATING
+    # Players only meet others from the same region (None is its own pool)
+    region: str | None = None
+    # Opponent elementals this player accepts (empty: any)
+    elementals: frozenset[str] = frozenset()
+
+    def accepts(self, elemental: str) -> bool:
+        return not self.elementals or elemental in self.elementals
+
+
+DEFAULT_PREFERENCES = MatchPreferences()
+
+
+@dataclass(slots=True)
+class WaitingEntry:
+    name: str
+    elemental: str
+    future: asyncio.Future[MatchAssignment]
+    enqueued_at: float = field(default_factory=time.monotonic)
+    ticket: int = 0
+    preferences: MatchPreferences = DEFAULT_PREFERENCES
+
+
+class WaitingQueue:
+    """
+    O(1) FIFO with eager removal of abandoned entries and wait statistics.
+
+    Subclasses that index entries (e.g. by rating) override _index and
+    _discard, which run whenever an entry joins or leaves the queue.
+    """
+
+    __slots__ = ('_entries', '_tickets', '_enqueued_at_sum', '_enqueued', '_matched', '_abandoned')
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[int, WaitingEntry] = OrderedDict()
+        self._tickets = itertools.count(1)
+        # Sum of enqueued_at over waiting entries: mean wait in O(1)
+        self._enqueued_at_sum = 0.0
+        self._enqueued = 0
+        self._matched = 0
+        self._abandoned = 0
+
+    def push(self, entry: WaitingEntry) -> None:
+        """Append an entry; it leaves the queue as soon as its future is done."""
+        entry.ticket = next(self._tickets)
+        self._entries[entry.ticket] = entry
+        self._enqueued_at_sum += entry.enqueued_at
+        self._enqueued += 1
+        self._index(entry)
+        entry.future.add_done_callback(lambda _future, ticket=entry.ticket: self._abandon(ticket))
+
+    def pop_oldest(self) -> WaitingEntry | None:
+        """Remove and return the longest-waiting entry, or None if empty."""
+        entry = self._pop()
+        if entry is not None:
+            self._matched += 1
+        return entry
+
+    def pop_pairs(self) -> list[tuple[WaitingEntry, WaitingEntry]]:
+        """
+        Pair off every waiting entry, oldest first.
+
+        An odd entry out stays at the front of the queue.
+        """
+        pairs: list[tuple[WaitingEntry, WaitingEntry]] = []
+        while (first := self._pop()) is not None:
+            second = self._pop()
+            if second is None:
+                self._entries[first.ticket] = first
+                self._entries.move_to_end(first.ticket, last=False)
+                self._enqueued_at_sum += first.enqueued_at
+                self._index(first)
+                break
+            pairs.append((first, second))
+        self._matched += 2 * len(pairs)
+        return pairs
+
+    def drain(self) -> list[WaitingEntry]:
+        """Remove and return every waiting entry, oldest first."""
+        entries = [entry for entry in self._entries.values() if not entry.future.done()]
+        for ticket in list(self._entries):
+            self._take(ticket)
+        return entries
+
+    def get_stats(self, now: float | None = None) -> dict[str, Any]:
+        if now is None:
+            now = time.monotonic()
+
+        waiting = len(self._entries)
+        oldest = next(iter(self._entries.values()), None)
+        return {
+            "waiting": waiting,
+            "oldest_wait_seconds": round(now - oldest.enqueued_at, 3) if oldest is not None else 0.0,
+            "mean_wait_seconds": round(now - self._enqueued_at_sum / waiting, 3) if waiting else 0.0,
+            "enqueued": self._enqueued,
+            "matched": self._matched,
+            "abandoned": self._abandoned,
+        }
+
+    def _index(self, entry: WaitingEntry) -> None:
+        """Hook: entry joined the queue."""
+        pass
+
+    def _discard(self, entry: WaitingEntry) -> None:
+        """Hook: entry left the queue."""
+        pass
+
+    def _take(self, ticket: int) -> WaitingEntry | None:
+        """Remove an entry by ticket, whatever its state."""
+        entry = self._entries.pop(ticket, None)
+        if entry is not None:
+            self._enqueued_at_sum -= entry.enqueued_at
+            if not self._entries:
+                self._enqueued_at_sum = 0.0  # Drop float drift
+            self._discard(entry)
+        return entry
+
+    def _pop(self) -> WaitingEntry | None:
+        """Remove the oldest live entry, dropping finished ones on the way."""
+        while self._entries:
+            entry = self._take(next(iter(self._entries)))
+            if entry is not None and not entry.future.done():
+                return entry
+        return None
+
+    def _abandon(self, ticket: int) -> None:
+        """Done-callback: drop the entry if it is still queued (cancelled or failed)."""
+        if self._take(ticket) is not None:
+            self._abandoned += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,187 @@
+"""
+HTTP matchmaking tickets.
+
+The WebSocket queue holds a socket and two tasks per waiting player just to
+deliver one match_found. A ticket holds only the player's matchmaking future:
+POST /api/matchmaking/tickets enqueues, and GET long-polls until the match
+is found or the poll times out (the client polls again).
+
+Tickets expire explicitly: one not polled for `ttl` seconds is cancelled
+(leaving the queue if still waiting) and forgotten. Matched tickets are kept
+until then, so a client that lost a response can poll again.
+"""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import secrets
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+from .backplane import Backplane
+from .session import MatchAssignment, MatchPreferences, TimingWheel
+
+logger = logging.getLogger(__name__)
+
+
+class TicketStatus(Enum):
+    QUEUED = "queued"
+    MATCHED = "matched"
+    # Matchmaking closed (drain) or the backplane failed; create a new ticket
+    FAILED = "failed"
+
+
+@dataclass(slots=True)
+class MatchTicket:
+    ticket_id: str
+    future: asyncio.Future[MatchAssignment]
+    # Long-polls in progress (a ticket being polled never expires)
+    pollers: int = 0
+
+    def get_status(self) -> TicketStatus:
+        if not self.future.done():
+            return TicketStatus.QUEUED
+        if self.future.cancelled() or self.future.exception() is not None:
+            return TicketStatus.FAILED
+        return TicketStatus.MATCHED
+
+    def get_assignment(self) -> MatchAssignment | None:
+        if self.get_status() is not TicketStatus.MATCHED:
+            return None
+        return self.future.result()
+
+
+class MatchTicketStore:
+    """Tickets by ID, with timing-wheel expiry."""
+
+    def __init__(
+        self,
+        backplane: Backplane,
+        ttl: float = 30.0,
+        max_wait: float = 25.0,
+        tick_seconds: float = 1.0,
+    ) -> None:
+        self._backplane = backplane
+        self._ttl = ttl
+        self._max_wait = max_wait
+        self._tick_seconds = tick_seconds
+        self._tickets: dict[str, MatchTicket] = {}
+        self._expiry = TimingWheel[str](tick_seconds=tick_seconds, slot_count=int(ttl / tick_seconds) + 2)
+        self._created = 0
+        self._expired = 0
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """Start the expiry task (idempotent)."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        for ticket_id in list(self._tickets):
+            self.cancel(ticket_id)
+
+    def get_ttl(self) -> float:
+        return self._ttl
+
+    async def create(self, name: str, elemental: str, preferences: MatchPreferences | None = None) -> MatchTicket:
+        """
+        Queue a player and issue their ticket.
+
+        Raises:
+            MatchmakingClosedError: If matchmaking is closed (drain)
+        """
+        future = await self._backplane.enqueue(name, elemental, preferences)
+        ticket = MatchTicket(ticket_id=secrets.token_urlsafe(16), future=future)
+        self._tickets[ticket.ticket_id] = ticket
+        self._created += 1
+        self._touch(ticket.ticket_id)
+        return ticket
+
+    async def wait(self, ticket_id: str, timeout: float) -> MatchTicket | None:
+        """
+        Long-poll a ticket: return once it is matched or failed, or after timeout.
+
+        Args:
+            timeout: Seconds to wait (capped at max_wait)
+
+        Returns:
+            The ticket, or None if unknown, expired or cancelled
+        """
+        ticket = self._tickets.get(ticket_id)
+        if ticket is None:
+            return None
+
+        ticket.pollers += 1
+        try:
+            if not ticket.future.done():
+                await asyncio.wait((ticket.future,), timeout=max(0.0, min(timeout, self._max_wait)))
+        finally:
+            ticket.pollers -= 1
+
+        if ticket_id not in self._tickets:
+            return None  # Cancelled while polling
+        self._touch(ticket_id)
+        return ticket
+
+    def cancel(self, ticket_id: str) -> bool:
+        """Forget a ticket, leaving the queue if still waiting. False if unknown."""
+        ticket = self._tickets.pop(ticket_id, None)
+        if ticket is None:
+            return False
+        self._expiry.cancel(ticket_id)
+        ticket.future.cancel()
+        return True
+
+    def expire_tickets(self, now: float | None = None) -> list[str]:
+        """
+        Cancel tickets not polled within the TTL.
+
+        Args:
+            now: Monotonic time (defaults to time.monotonic())
+
+        Returns:
+            IDs of expired tickets
+        """
+        if now is None:
+            now = time.monotonic()
+
+        expired: list[str] = []
+        for ticket_id in self._expiry.advance(now):
+            ticket = self._tickets.get(ticket_id)
+            if ticket is None:
+                continue
+            if ticket.pollers:
+                self._expiry.schedule(ticket_id, now + self._ttl)
+                continue
+            self.cancel(ticket_id)
+            expired.append(ticket_id)
+
+        if expired:
+            self._expired += len(expired)
+            logger.info("Expired %d matchmaking ticket(s)", len(expired))
+        return expired
+
+    def get_stats(self) -> dict[str, Any]:
+        queued = sum(1 for ticket in self._tickets.values() if not ticket.future.done())
+        return {
+            "tickets": len(self._tickets),
+            "queued": queued,
+            "created": self._created,
+            "expired": self._expired,
+        }
+
+    def _touch(self, ticket_id: str) -> None:
+        self._expiry.schedule(ticket_id, time.monotonic() + self._ttl)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._tick_seconds)
+            self.expire_tickets()
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
+import os
+import signal
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import AsyncIterator
@@ -13,12 +17,20 @@ from zc_api.common.logging import setup_logging
 from zc_api.config import settings
 from zc_api.routers import admin, health, catalog, game, matchmaking
 from zc_api.game_manager import GameManager
-from zc_api.game_manager.data_loader import load_game_data
-from zc_api.tags import TagRegistry
+from zc_api.game_manager.data_loader import load_game_data, load_tag_registry
 
 setup_logging(log_level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Rolling deploys send this to start a drain; SIGTERM still shuts down immediately
+DRAIN_SIGNAL = signal.SIGUSR1
+
+
+def _exit_after_drain() -> None:
+    """Ask the server (uvicorn) for a graceful shutdown once draining is done."""
+    logger.info("Drained; shutting down")
+    os.kill(os.getpid(), signal.SIGTERM)
+
 
 def create_app() -> FastAPI:
     @asynccontextmanager
@@ -27,23 +39,35 @@ def create_app() -> FastAPI:
 
         # Create instances and store in app.state for DI
         game_data = load_game_data()
-        app.state.game_manager = GameManager(game_data)
-        app.state.tag_registry = TagRegistry()
+        app.state.game_manager = GameManager(
+            game_data,
+            on_drained=_exit_after_drain if settings.drain_exit_when_done else None,
+        )
 
         # Register gameplay tags
         logger.info("Registering gameplay tags")
-        for ability in game_data.abilities:
-            app.state.tag_registry.request_tag(ability.gameplay_tag)
-        for elemental in game_data.elementals:
-            app.state.tag_registry.request_tag(elemental.gameplay_tag)
-
-        app.state.tag_registry.set_strict_mode(True)
-        logger.info("Tag registry locked with %d tags", app.state.tag_registry.get_tag_count())
+        app.state.tag_registry = load_tag_registry()
+        app.state.tag_registry.activate()
+        logger.info(
+            "Tag registry frozen with %d tags (checksum %s)",
+            app.state.tag_registry.get_tag_count(),
+            app.state.tag_registry.get_checksum(),
+        )
 
         await app.state.game_manager.start_sessions()
         logger.info("Session cleanup task started")
+
+        # Signal handlers need the main thread (not available under the test client)
+        loop = asyncio.get_running_loop()
+        drain_signal_installed = False
+        with contextlib.suppress(NotImplementedError, RuntimeError, ValueError):
+            loop.add_signal_handler(DRAIN_SIGNAL, app.state.game_manager.start_drain, "signal")
+            drain_signal_installed = True
+
         logger.info("Application startup complete")
         yield
+        if drain_signal_installed:
+            loop.remove_signal_handler(DRAIN_SIGNAL)
         await app.state.game_manager.stop_sessions()
         logger.info("Application shutdown")
 
@@ -1,4 +1,4 @@
 """Pydantic models organized by domain."""
-__all__ = ["common", "game", "matchmaking", "session"]
+__all__ = ["common", "game", "matchmaking", "session", "protocol"]
 
-from zc_api.models import common, game, matchmaking, session
+from zc_api.models import common, game, matchmaking, session, protocol
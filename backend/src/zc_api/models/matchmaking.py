@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from typing import Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 # === Server -> Client ===
@@ -23,3 +23,25 @@ class ServerMatchFound(BaseModel):
 
 
 MatchmakingServerMessage = ServerStatus | ServerMatchFound
+
+
+# === HTTP tickets ===
+
+class MatchTicketRequest(BaseModel):
+    """Queue for a match without holding a WebSocket."""
+    name: str | None = None
+    elemental: str | None = None
+    # Rated matchmaking only
+    rating: int | None = Field(default=None, ge=0, le=10_000)
+    region: str | None = None
+    opponent_elementals: list[str] = []
+
+
+class MatchTicketResponse(BaseModel):
+    """Ticket state; match_id and player_token are set once matched."""
+    ticket_id: str
+    status: Literal["queued", "matched"]
+    match_id: str | None = None
+    player_token: str | None = None
+    # The ticket expires if not polled within this long
+    expires_in_seconds: float
@@ -0,0 +1,56 @@
+"""
+Binary WebSocket protocol generated from the message models.
+
+Type IDs follow the order of the unions below; append new messages at the
+end of a union to keep existing IDs stable.
+"""
+from __future__ import annotations
+
+from pydantic import TypeAdapter
+
+from zc_api.common.binary_protocol import BINARY_SUBPROTOCOL, BinaryProtocol, BinaryProtocolError
+from zc_api.common.codec import JSON_FORMAT, MessageFormat
+from zc_api.models.common import ServerError
+from zc_api.models.matchmaking import MatchmakingServerMessage
+from zc_api.models.session import ClientHeartbeatAck, ClientPing, SessionClientMessage, SessionServerMessage
+
+WIRE_PROTOCOL = BinaryProtocol.from_unions(
+    SessionServerMessage,
+    MatchmakingServerMessage,
+    ServerError,
+    SessionClientMessage,
+)
+
+BINARY_FORMAT = MessageFormat(name=BINARY_SUBPROTOCOL, binary=True, encode=WIRE_PROTOCOL.encode)
+
+_CLIENT_MODELS = (ClientPing, ClientHeartbeatAck)
+_client_adapter = TypeAdapter(SessionClientMessage)
+
+
+def select_format(offered: list[str]) -> tuple[MessageFormat, str | None]:
+    """
+    Pick the wire format from the client's Sec-WebSocket-Protocol offers.
+
+    Returns:
+        (format, subprotocol to echo in accept(), or None for plain JSON)
+    """
+    if BINARY_SUBPROTOCOL in offered:
+        return BINARY_FORMAT, BINARY_SUBPROTOCOL
+    return JSON_FORMAT, None
+
+
+def decode_session_client_message(data: str | bytes) -> SessionClientMessage:
+    """
+    Decode a client frame on /ws/game in either format.
+
+    Raises:
+        BinaryProtocolError: Malformed binary frame or a non-client message
+        pydantic.ValidationError: Invalid JSON message
+    """
+    if isinstance(data, str):
+        return _client_adapter.validate_json(data)
+
+    message = WIRE_PROTOCOL.decode(data)
+    if not isinstance(message, _CLIENT_MODELS):
+        raise BinaryProtocolError(f"Not a client message: {type(message).__name__}")
+    return message
@@ -8,7 +8,17 @@ from pydantic import BaseModel
 
 # === Server -> Client ===
 
-class ServerGameReady(BaseModel):
+class SequencedServerMessage(BaseModel):
+    """
+    Session message numbered by the session (seq 1, 2, 3, ...).
+
+    Clients remember the last seq they received and pass it as `last_seq`
+    when reconnecting to resume without a full resync.
+    """
+    seq: int = 0
+
+
+class ServerGameReady(SequencedServerMessage):
     """Both players connected, game can begin."""
     type: Literal["game_ready"]
     match_id: str
@@ -17,17 +27,50 @@ class ServerGameReady(BaseModel):
     opponent_elemental: str
 
 
-class ServerPinged(BaseModel):
+class ServerPinged(SequencedServerMessage):
     """Opponent sent a ping."""
     type: Literal["pinged"]
 
 
-class ServerOpponentDisconnected(BaseModel):
+class ServerOpponentDisconnected(SequencedServerMessage):
     """Opponent left the game."""
     type: Literal["opponent_disconnected"]
 
 
-SessionServerMessage = ServerGameReady | ServerPinged | ServerOpponentDisconnected
+class ServerShutdown(BaseModel):
+    """Server is shutting down or draining."""
+    type: Literal["server_shutdown"]
+    message: str
+
+
+class ServerOpponentReconnected(SequencedServerMessage):
+    """Opponent reconnected to a game in progress."""
+    type: Literal["opponent_reconnected"]
+
+
+class ServerResync(SequencedServerMessage):
+    """
+    Snapshot for a reconnecting player whose missed messages are no longer
+    buffered. seq is the session's latest seq; resume counting from it.
+    """
+    type: Literal["resync"]
+    match_id: str
+    you: str
+    opponent: str
+    opponent_elemental: str
+    opponent_connected: bool
+
+
+class ServerHeartbeat(BaseModel):
+    """Liveness probe; answer with heartbeat_ack carrying the same id. Not sequenced."""
+    type: Literal["heartbeat"]
+    id: int
+
+
+SessionServerMessage = (
+    ServerGameReady | ServerPinged | ServerOpponentDisconnected | ServerShutdown | ServerResync
+    | ServerOpponentReconnected | ServerHeartbeat
+)
 
 
 # === Client -> Server ===
@@ -37,4 +80,10 @@ class ClientPing(BaseModel):
     type: Literal["ping"]
 
 
-SessionClientMessage = ClientPing
+class ClientHeartbeatAck(BaseModel):
+    """Answer to a server heartbeat."""
+    type: Literal["heartbeat_ack"]
+    id: int
+
+
+SessionClientMessage = ClientPing | ClientHeartbeatAck
@@ -22,3 +22,53 @@ async def list_sessions(
         "count": len(sessions),
         "sessions": sessions,
     }
+
+
+@router.get("/matchmaking")
+async def get_matchmaking_stats(
+    game_manager: GameManager = Depends(get_game_manager),
+) -> dict[str, object]:
+    """Matchmaking queue length, wait ages and counters. Disabled in production."""
+    if settings.environment == "prod":
+        raise HTTPException(status_code=403, detail="Admin endpoints disabled in production")
+
+    return await game_manager.get_matchmaking_stats()
+
+
+@router.get("/drain")
+async def get_drain_status(
+    game_manager: GameManager = Depends(get_game_manager),
+) -> dict[str, object]:
+    """Drain state and progress. Disabled in production (use /health there)."""
+    if settings.environment == "prod":
+        raise HTTPException(status_code=403, detail="Admin endpoints disabled in production")
+
+    return game_manager.get_drain_status()
+
+
+@router.post("/drain")
+async def start_drain(
+    game_manager: GameManager = Depends(get_game_manager),
+) -> dict[str, object]:
+    """Start draining this worker. Disabled in production (send SIGUSR1 there)."""
+    if settings.environment == "prod":
+        raise HTTPException(status_code=403, detail="Admin endpoints disabled in production")
+
+    started = game_manager.start_drain("admin")
+    return {"started": started, **game_manager.get_drain_status()}
+
+
+@router.get("/sessions/shards")
+async def list_session_shards(
+    game_manager: GameManager = Depends(get_game_manager),
+) -> dict[str, object]:
+    """Per-shard session counts and lifetime counters. Disabled in production."""
+    if settings.environment == "prod":
+        raise HTTPException(status_code=403, detail="Admin endpoints disabled in production")
+
+    shards = game_manager.get_session_shard_stats()
+
+    return {
+        "count": sum(shard["sessions"] for shard in shards),
+        "shards": shards,
+    }
@@ -4,19 +4,28 @@ from __future__ import annotations
 import logging
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends
-from pydantic import TypeAdapter
 
+from zc_api.common.binary_protocol import BINARY_SUBPROTOCOL
+from zc_api.common.codec import send_message
 from zc_api.game_manager import GameManager
 from zc_api.game_manager.manager import get_game_manager
-from zc_api.models.session import SessionClientMessage, ServerPinged
+from zc_api.models.protocol import WIRE_PROTOCOL, decode_session_client_message
+from zc_api.models.session import ServerPinged
 from zc_api.models.common import ServerError
-from zc_api.routers.utils import RejectIfOriginNotAllowed
+from zc_api.routers.utils import AcceptWithNegotiatedFormat, RejectIfOriginNotAllowed
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["game"])
 
-_client_adapter = TypeAdapter(SessionClientMessage)
+
+@router.get("/protocol/binary")
+async def get_binary_protocol() -> dict[str, object]:
+    """Generated schema of the binary WebSocket subprotocol (type IDs and field layouts)."""
+    return {
+        "subprotocol": BINARY_SUBPROTOCOL,
+        "messages": WIRE_PROTOCOL.describe(),
+    }
 
 
 @router.websocket("/ws/game/{match_id}")
@@ -25,7 +34,12 @@ async def ws_game_session(
     match_id: str,
     game_manager: GameManager = Depends(get_game_manager),
 ) -> None:
-    """WebSocket endpoint for active gameplay session."""
+    """
+    WebSocket endpoint for active gameplay session.
+
+    Query params: token, and last_seq (the last message seq received) when
+    reconnecting, to replay only the missed messages.
+    """
     if await RejectIfOriginNotAllowed(websocket):
         return
 
@@ -34,27 +48,41 @@ async def ws_game_session(
         await websocket.close(code=1008, reason="missing token")
         return
 
-    await websocket.accept()
+    last_seq: int | None = None
+    raw_last_seq = (websocket.query_params.get("last_seq") or "").strip()
+    if raw_last_seq:
+        if not raw_last_seq.isdigit():
+            await websocket.close(code=1008, reason="invalid last_seq")
+            return
+        last_seq = int(raw_last_seq)
+
+    message_format = await AcceptWithNegotiatedFormat(websocket)
 
     try:
-        session = await game_manager.on_player_joined(match_id, token, websocket)
+        session = await game_manager.on_player_joined(match_id, token, websocket, message_format, last_seq)
     except ValueError as e:
         await websocket.close(code=1008, reason=str(e))
         return
 
     try:
         while True:
-            raw = await websocket.receive_text()
-            msg = _client_adapter.validate_json(raw)
+            if message_format.binary:
+                raw = await websocket.receive_bytes()
+            else:
+                raw = await websocket.receive_text()
+            msg = decode_session_client_message(raw)
+            session.record_inbound(token)
 
-            if msg.type == "ping":
-                await session.send_to_opponent(token, ServerPinged(type="pinged").model_dump())
+            if msg.type == "heartbeat_ack":
+                session.ack_heartbeat(token, msg.id)
+            elif msg.type == "ping":
+                await game_manager.send_to_opponent(session, token, ServerPinged(type="pinged"))
 
     except WebSocketDisconnect:
-        await game_manager.on_player_left(session, token)
+        await game_manager.on_player_left(session, token, websocket)
     except Exception:
         logger.exception("Unhandled error in ws_game_session")
         try:
-            await websocket.send_json(ServerError(type="error", message="server error").model_dump())
+            await send_message(websocket, ServerError(type="error", message="server error"), message_format)
         finally:
             await websocket.close()
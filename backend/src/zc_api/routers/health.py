@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse
 
 router = APIRouter()
 
@@ -14,6 +15,10 @@ def root() -> dict[str, object]:
     }
 
 
-@router.get("/health")
-def health() -> dict[str, str]:
+@router.get("/health", response_model=None)
+def health(request: Request) -> dict[str, object] | JSONResponse:
+    # 503 while draining so load balancers stop sending new players here
+    game_manager = getattr(request.app.state, "game_manager", None)
+    if game_manager is not None and game_manager.is_draining():
+        return JSONResponse(status_code=503, content={"status": "draining", "drain": game_manager.get_drain_status()})
     return {"status": "ok"}
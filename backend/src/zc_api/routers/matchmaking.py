@@ -4,38 +4,110 @@ from __future__ import annotations
 import asyncio
 import secrets
 
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends, HTTPException, Response
+from starlette.datastructures import QueryParams
 
+from zc_api.common.codec import MessageFormat, send_message
 from zc_api.game_manager import GameManager
 from zc_api.game_manager.manager import get_game_manager
-from zc_api.models.matchmaking import ServerStatus, ServerMatchFound
-from zc_api.routers.utils import RejectIfOriginNotAllowed
+from zc_api.game_manager.session import DEFAULT_RATING, MatchmakingClosedError, MatchPreferences
+from zc_api.game_manager.tickets import MatchTicket, TicketStatus
+from zc_api.models.common import ServerError
+from zc_api.models.matchmaking import MatchTicketRequest, MatchTicketResponse, ServerStatus, ServerMatchFound
+from zc_api.routers.utils import AcceptWithNegotiatedFormat, RejectIfOriginNotAllowed
 
 router = APIRouter(tags=["matchmaking"])
 
+# "Try Again Later": this worker is draining, reconnect to reach another one
+_DRAINING_CLOSE_CODE = 1013
+
+_MAX_RATING = 10_000
+
+_DRAINING_DETAIL = "server is draining; retry to find a match"
+
 
 def _default_name() -> str:
     return f"Player-{secrets.randbelow(10_000):04d}"
 
 
+def _parse_preferences(query_params: QueryParams) -> MatchPreferences | None:
+    """
+    Rating matchmaking preferences from the query string.
+
+    Returns:
+        None if the client sent none of rating, region or opponent_elementals
+
+    Raises:
+        ValueError: If rating is not an integer between 0 and _MAX_RATING
+    """
+    raw_rating = (query_params.get("rating") or "").strip()
+    if raw_rating and (not raw_rating.isdigit() or int(raw_rating) > _MAX_RATING):
+        raise ValueError("invalid rating")
+
+    raw_elementals = query_params.get("opponent_elementals") or ""
+    return _make_preferences(
+        int(raw_rating) if raw_rating else None,
+        query_params.get("region"),
+        raw_elementals.split(","),
+    )
+
+
+def _make_preferences(rating: int | None, region: str | None, elementals: list[str]) -> MatchPreferences | None:
+    """MatchPreferences from validated fields; None if none were given."""
+    region = (region or "").strip() or None
+    accepted = frozenset(elemental.strip() for elemental in elementals if elemental.strip())
+    if rating is None and region is None and not accepted:
+        return None
+    return MatchPreferences(
+        rating=DEFAULT_RATING if rating is None else float(rating),
+        region=region,
+        elementals=accepted,
+    )
+
+
+async def _reject_draining(websocket: WebSocket, message_format: MessageFormat) -> None:
+    await send_message(
+        websocket,
+        ServerError(type="error", message="server is draining; reconnect to find a match"),
+        message_format,
+    )
+    await websocket.close(code=_DRAINING_CLOSE_CODE, reason="draining")
+
+
 @router.websocket("/ws/matchmaking")
 async def ws_matchmaking(
     websocket: WebSocket,
     game_manager: GameManager = Depends(get_game_manager),
 ) -> None:
-    """WebSocket endpoint for matchmaking queue."""
+    """
+    WebSocket endpoint for matchmaking queue.
+
+    Query params: name, elemental, and for rated matchmaking optionally
+    rating, region and opponent_elementals (comma-separated).
+    """
     if await RejectIfOriginNotAllowed(websocket):
         return
 
     name = (websocket.query_params.get("name") or "").strip() or _default_name()
     elemental = (websocket.query_params.get("elemental") or "").strip() or "unknown"
+    try:
+        preferences = _parse_preferences(websocket.query_params)
+    except ValueError as e:
+        await websocket.close(code=1008, reason=str(e))
+        return
+
+    message_format = await AcceptWithNegotiatedFormat(websocket)
+    if game_manager.is_draining():
+        await _reject_draining(websocket, message_format)
+        return
 
-    await websocket.accept()
-    await websocket.send_json(
-        ServerStatus(type="status", status="queueing", detail="waiting for opponent").model_dump()
+    await send_message(
+        websocket,
+        ServerStatus(type="status", status="queueing", detail="waiting for opponent"),
+        message_format,
     )
 
-    match_task = asyncio.create_task(game_manager.wait_for_match(name, elemental))
+    match_task = asyncio.create_task(game_manager.wait_for_match(name, elemental, preferences))
     disconnect_task = asyncio.create_task(websocket.receive_text())
 
     done, pending = await asyncio.wait(
@@ -47,13 +119,19 @@ async def ws_matchmaking(
         task.cancel()
 
     if match_task in done and not match_task.cancelled():
+        if isinstance(match_task.exception(), MatchmakingClosedError):
+            await _reject_draining(websocket, message_format)
+            return
+
         assignment = match_task.result()
-        await websocket.send_json(
+        await send_message(
+            websocket,
             ServerMatchFound(
                 type="match_found",
                 match_id=assignment.match_id,
                 player_token=assignment.player_token,
-            ).model_dump()
+            ),
+            message_format,
         )
         await websocket.close()
         return
@@ -64,3 +142,71 @@ async def ws_matchmaking(
         await disconnect_task
     except WebSocketDisconnect:
         return
+
+
+def _ticket_response(ticket: MatchTicket, game_manager: GameManager) -> MatchTicketResponse:
+    """Response for a live ticket; raises 503 (and forgets the ticket) if it failed."""
+    status = ticket.get_status()
+    if status is TicketStatus.FAILED:
+        game_manager.cancel_match_ticket(ticket.ticket_id)
+        raise HTTPException(status_code=503, detail=_DRAINING_DETAIL)
+
+    assignment = ticket.get_assignment()
+    return MatchTicketResponse(
+        ticket_id=ticket.ticket_id,
+        status=status.value,
+        match_id=assignment.match_id if assignment else None,
+        player_token=assignment.player_token if assignment else None,
+        expires_in_seconds=game_manager.get_match_ticket_ttl(),
+    )
+
+
+@router.post("/api/matchmaking/tickets", status_code=202, response_model=MatchTicketResponse)
+async def create_match_ticket(
+    request: MatchTicketRequest,
+    game_manager: GameManager = Depends(get_game_manager),
+) -> MatchTicketResponse:
+    """
+    Queue for a match without holding a WebSocket.
+
+    Poll GET /api/matchmaking/tickets/{ticket_id} until matched, then join
+    /ws/game/{match_id}?token={player_token}.
+    """
+    if game_manager.is_draining():
+        raise HTTPException(status_code=503, detail=_DRAINING_DETAIL)
+
+    name = (request.name or "").strip() or _default_name()
+    elemental = (request.elemental or "").strip() or "unknown"
+    preferences = _make_preferences(request.rating, request.region, request.opponent_elementals)
+    try:
+        ticket = await game_manager.create_match_ticket(name, elemental, preferences)
+    except MatchmakingClosedError:
+        raise HTTPException(status_code=503, detail=_DRAINING_DETAIL) from None
+    return _ticket_response(ticket, game_manager)
+
+
+@router.get("/api/matchmaking/tickets/{ticket_id}", response_model=MatchTicketResponse)
+async def poll_match_ticket(
+    ticket_id: str,
+    wait: float = 20.0,
+    game_manager: GameManager = Depends(get_game_manager),
+) -> MatchTicketResponse:
+    """
+    Long-poll a ticket: returns once matched, or with status "queued" after
+    `wait` seconds (capped server-side). Polling keeps the ticket alive.
+    """
+    ticket = await game_manager.wait_for_match_ticket(ticket_id, wait)
+    if ticket is None:
+        raise HTTPException(status_code=404, detail="unknown or expired ticket")
+    return _ticket_response(ticket, game_manager)
+
+
+@router.delete("/api/matchmaking/tickets/{ticket_id}", status_code=204)
+async def cancel_match_ticket(
+    ticket_id: str,
+    game_manager: GameManager = Depends(get_game_manager),
+) -> Response:
+    """Leave the queue."""
+    if not game_manager.cancel_match_ticket(ticket_id):
+        raise HTTPException(status_code=404, detail="unknown or expired ticket")
+    return Response(status_code=204)
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from fastapi import WebSocket
 
+from zc_api.common.codec import MessageFormat
 from zc_api.config import settings
+from zc_api.models.protocol import select_format
 
 
 def IsAllowedWsOrigin(origin: str | None) -> bool:
@@ -19,3 +21,10 @@ async def RejectIfOriginNotAllowed(websocket: WebSocket) -> bool:
 
     await websocket.close(code=1008, reason="origin not allowed")
     return True
+
+
+async def AcceptWithNegotiatedFormat(websocket: WebSocket) -> MessageFormat:
+    """Accept the socket, echoing the binary subprotocol if the client offered it. JSON otherwise."""
+    message_format, subprotocol = select_format(list(websocket.scope.get("subprotocols", [])))
+    await websocket.accept(subprotocol=subprotocol)
+    return message_format
@@ -7,15 +7,40 @@ Ported from custom C++ implementation at e:\\source\\GameplayTags.
 Public API:
 - GameplayTag: Immutable tag handle
 - GameplayTagContainer: Set-based container with parent matching
+- GameplayTagBitmaskContainer: Bitset-backed container for hot-path queries
+- GameplayTagCountContainer: Reference-counted tags with per-tag change events
 - TagRegistry: Singleton for tag registration and lookup
+- TagRegistrySnapshot: Immutable compiled registry (TagRegistry.freeze())
+- TagQuery: Boolean tag expressions compiled to mask predicates
+- encode_tags/decode_tags: Compact binary wire format for containers
+
+Optional (requires NumPy, import from the submodule):
+- tag_container_array.TagContainerArray: Batch containers for whole-board queries
 """
 
 from .gameplay_tag import GameplayTag
 from .tag_registry import TagRegistry
+from .tag_registry_snapshot import TagRegistrySnapshot, TagTableError
 from .gameplay_tag_container import GameplayTagContainer
+from .gameplay_tag_bitmask_container import GameplayTagBitmaskContainer
+from .gameplay_tag_count_container import GameplayTagCountContainer, TagEventHandle, TagEventType
+from .tag_query import CompiledTagQuery, TagQuery
+from .tag_wire_format import TagWireError, decode_tags, encode_tags, get_registry_version
 
 __all__ = [
     "GameplayTag",
     "TagRegistry",
+    "TagRegistrySnapshot",
+    "TagTableError",
     "GameplayTagContainer",
+    "GameplayTagBitmaskContainer",
+    "GameplayTagCountContainer",
+    "TagEventType",
+    "TagEventHandle",
+    "TagQuery",
+    "CompiledTagQuery",
+    "encode_tags",
+    "decode_tags",
+    "get_registry_version",
+    "TagWireError",
 ]
@@ -4,6 +4,10 @@ GameplayTag - Lightweight handle to an interned tag path.
 A GameplayTag is an immutable identifier backed by an integer ID.
 Tags support hierarchical matching via parent relationships.
 
+Tags are flyweights: the registry interns exactly one handle per ID and
+each handle is bound to the registry that issued it, so name lookups and
+parent walks never allocate or import.
+
 Example:
     >>> tag = TagRegistry.get().request_tag("Player.Owner.P1")
     >>> tag.get_name()
@@ -18,6 +22,22 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from .tag_registry import TagRegistry
 
+# Registry used by handles not bound to one (e.g. NONE); see TagRegistry.activate()
+_active_registry: TagRegistry | None = None
+
+
+def set_active_registry(registry: TagRegistry | None) -> None:
+    """
+    Internal: Set the registry used by unbound tag handles.
+    
+    Called by TagRegistry.activate(); use that instead.
+    
+    Args:
+        registry: Registry to bind (None to unbind)
+    """
+    global _active_registry
+    _active_registry = registry
+
 
 class GameplayTag:
     """
@@ -27,24 +47,45 @@ class GameplayTag:
     Use TagRegistry.request_tag() to create tags, not the constructor directly.
     """
     
-    __slots__ = ('_id',)
+    __slots__ = ('_id', '_registry')
     
     # Singleton for invalid/none tag
     NONE: GameplayTag
     
-    def __init__(self, _id: int) -> None:
+    def __init__(self, _id: int, _registry: TagRegistry | None = None) -> None:
         """
         Private constructor. Use TagRegistry.request_tag() instead.
         
         Args:
             _id: Internal tag ID (0 = invalid/none)
+            _registry: Registry that issued the ID (None = active registry)
         """
         object.__setattr__(self, '_id', _id)
+        object.__setattr__(self, '_registry', _registry)
     
     def is_valid(self) -> bool:
         """Check if this tag is valid (not NONE)."""
         return self._id != 0
     
+    def get_id(self) -> int:
+        """
+        Internal: Get the registry ID backing this tag.
+        
+        IDs are only meaningful within the registry that issued them.
+        Used by bitmask containers (bit N represents tag ID N).
+        """
+        return self._id
+    
+    def get_registry(self) -> TagRegistry | None:
+        """
+        Internal: Get the registry this handle is bound to.
+        
+        Returns:
+            Issuing registry, or None for unbound handles (e.g. NONE),
+            which resolve against the active registry
+        """
+        return self._registry
+    
     def get_name(self) -> str:
         """
         Return the full tag path (e.g., "Gameplay.Character.Status.Stunned").
@@ -55,8 +96,10 @@ class GameplayTag:
         if self._id == 0:
             return ""
         
-        from .tag_registry import TagRegistry
-        return TagRegistry.get().get_tag_name(self._id)
+        registry = self._registry if self._registry is not None else _active_registry
+        if registry is None:
+            return ""
+        return registry.get_tag_name(self._id)
     
     def get_parent(self) -> GameplayTag:
         """
@@ -70,9 +113,10 @@ class GameplayTag:
         if self._id == 0:
             return GameplayTag.NONE
         
-        from .tag_registry import TagRegistry
-        parent_id = TagRegistry.get().get_parent_id(self._id)
-        return GameplayTag(parent_id)
+        registry = self._registry if self._registry is not None else _active_registry
+        if registry is None:
+            return GameplayTag.NONE
+        return registry.get_tag_by_id(registry.get_parent_id(self._id))
     
     def __eq__(self, other: object) -> bool:
         """Tag equality based on ID."""
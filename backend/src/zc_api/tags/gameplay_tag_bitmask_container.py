@@ -0,0 +1,351 @@
+"""
+GameplayTagBitmaskContainer - Bitset-backed container with hierarchical matching.
+
+Stores tags as integer bitsets keyed by tag ID instead of lists.
+Parent matching uses ancestor masks precomputed by the TagRegistry, so
+queries are a handful of big-int AND/OR operations regardless of size.
+
+Example:
+    >>> container = GameplayTagBitmaskContainer(registry)
+    >>> container.add_tag("Player.Owner.P1")
+    >>> container.has_tag("Player.Owner")        # True (parent matching)
+    >>> container.has_tag_exact("Player.Owner")  # False (exact match only)
+"""
+
+from __future__ import annotations
+from collections.abc import Iterable, Iterator
+from .gameplay_tag import GameplayTag
+from .gameplay_tag_container import GameplayTagContainer
+from .tag_registry import TagRegistry
+
+
+def iter_mask_ids(mask: int) -> Iterator[int]:
+    """
+    Iterate set bit positions (tag IDs) of a mask in ascending order.
+
+    Args:
+        mask: Tag bitmask
+
+    Yields:
+        Tag IDs present in the mask
+    """
+    while mask:
+        low_bit = mask & -mask
+        yield low_bit.bit_length() - 1
+        mask ^= low_bit
+
+
+class GameplayTagBitmaskContainer(GameplayTagContainer):
+    """
+    Tag container storing explicit and implied tags as bitsets.
+
+    Drop-in replacement for GameplayTagContainer in hot paths:
+    - _explicit_mask: Bit per explicitly added tag
+    - _tag_mask: Explicit tags OR'd with their ancestor masks
+    - _implied_counts: Explicit descendants per implied parent ID, so
+      remove_tag() clears only the parent bits no other tag still implies
+    - has_tag()/has_any()/has_all(): Single mask test, no hierarchy walk
+
+    Explicit tags are reported in ID order, not insertion order.
+    Containers must only be compared with containers from the same registry.
+
+    The base class's set storage is never initialized: every method of
+    GameplayTagContainer, public or internal, is overridden here.
+    """
+
+    __slots__ = ('_registry', '_explicit_mask', '_tag_mask', '_implied_counts')
+
+    def __init__(self, registry: TagRegistry | None = None) -> None:
+        """
+        Create an empty bitmask container.
+
+        Args:
+            registry: Registry providing tag IDs and ancestor masks
+                (defaults to TagRegistry.get())
+        """
+        self._registry = registry if registry is not None else TagRegistry.get()
+        self._explicit_mask = 0
+        self._tag_mask = 0
+        self._implied_counts: dict[int, int] = {}
+
+    def add_tag(self, tag: GameplayTag | str) -> None:
+        """
+        Add a tag to the container.
+
+        Parent bits are OR'd in from the registry's ancestor mask.
+        Duplicate tags are ignored.
+
+        Args:
+            tag: GameplayTag handle or tag path string
+        """
+        self._add_mask(1 << self._resolve(tag).get_id())
+
+    def add_tags(self, tags: Iterable[GameplayTag | str]) -> None:
+        """
+        Add several tags in a single pass.
+
+        Args:
+            tags: GameplayTag handles and/or tag path strings
+        """
+        self._add_mask(self._collect_mask(tags))
+
+    def update(self, other: GameplayTagContainer) -> None:
+        """
+        Add every explicit tag of another container.
+
+        Args:
+            other: Container to merge in (from the same registry)
+        """
+        self._add_mask(other.get_explicit_mask())
+
+    def remove_tag(self, tag: GameplayTag | str) -> bool:
+        """
+        Remove an explicit tag from the container.
+
+        Only the removed tag's ancestors are updated.
+
+        Args:
+            tag: GameplayTag handle or tag path string
+
+        Returns:
+            True if tag was removed, False if not found
+        """
+        return self._remove_mask(1 << self._resolve(tag).get_id()) == 1
+
+    def remove_tags(self, tags: Iterable[GameplayTag | str]) -> int:
+        """
+        Remove several explicit tags in a single pass.
+
+        Args:
+            tags: GameplayTag handles and/or tag path strings
+
+        Returns:
+            Number of tags that were removed
+        """
+        return self._remove_mask(self._collect_mask(tags))
+
+    def has_tag(self, tag: GameplayTag | str) -> bool:
+        """
+        Check if tag is present (matches explicit OR parent tags).
+
+        Args:
+            tag: GameplayTag handle or tag path string
+
+        Returns:
+            True if tag matches (including parent matching)
+        """
+        tag_id = self._resolve(tag).get_id()
+        return tag_id != 0 and (self._tag_mask >> tag_id) & 1 == 1
+
+    def has_tag_exact(self, tag: GameplayTag | str) -> bool:
+        """
+        Check if tag is explicitly present (exact match only, no parent matching).
+
+        Args:
+            tag: GameplayTag handle or tag path string
+
+        Returns:
+            True if tag is explicitly in container
+        """
+        tag_id = self._resolve(tag).get_id()
+        return tag_id != 0 and (self._explicit_mask >> tag_id) & 1 == 1
+
+    def has_any(self, other: GameplayTagContainer) -> bool:
+        """Check if this container has ANY of the other container's tags (parent matching)."""
+        return self._tag_mask & other.get_explicit_mask() != 0
+
+    def has_all(self, other: GameplayTagContainer) -> bool:
+        """Check if this container has ALL of the other container's tags (parent matching)."""
+        return other.get_explicit_mask() & ~self._tag_mask == 0
+
+    def has_any_exact(self, other: GameplayTagContainer) -> bool:
+        """Check if this container has ANY of the other container's tags (exact match)."""
+        return self._explicit_mask & other.get_explicit_mask() != 0
+
+    def has_all_exact(self, other: GameplayTagContainer) -> bool:
+        """Check if this container has ALL of the other container's tags (exact match)."""
+        return other.get_explicit_mask() & ~self._explicit_mask == 0
+
+    def clear(self) -> None:
+        """Remove all tags from the container."""
+        self._explicit_mask = 0
+        self._tag_mask = 0
+        self._implied_counts.clear()
+
+    def is_empty(self) -> bool:
+        """Check if container has no explicit tags."""
+        return self._explicit_mask == 0
+
+    def num(self) -> int:
+        """Get count of explicit tags (not including computed parents)."""
+        return self._explicit_mask.bit_count()
+
+    def get_explicit_tags(self) -> list[GameplayTag]:
+        """
+        Get list of explicit tags in ID order.
+
+        Returns:
+            List of explicit GameplayTag handles
+        """
+        return list(self._iter_explicit_tags())
+
+    def get_explicit_mask(self) -> int:
+        """Get bitmask of explicit tags (bit N set for tag ID N)."""
+        return self._explicit_mask
+
+    def get_tag_mask(self) -> int:
+        """Get bitmask of explicit tags AND their parents."""
+        return self._tag_mask
+
+    def to_string(self) -> str:
+        """
+        Serialize to CSV string (tags in ID order).
+
+        Returns:
+            Comma-separated tag paths (e.g., "A.B,C.D.E")
+        """
+        get_tag_name = self._registry.get_tag_name
+        return ','.join(get_tag_name(tag_id) for tag_id in iter_mask_ids(self._explicit_mask))
+
+    @staticmethod
+    def from_string(s: str, registry: TagRegistry | None = None) -> GameplayTagBitmaskContainer:
+        """
+        Deserialize from CSV string.
+
+        Args:
+            s: Comma-separated tag paths
+            registry: Registry to resolve paths against (defaults to TagRegistry.get())
+
+        Returns:
+            New GameplayTagBitmaskContainer with parsed tags
+        """
+        container = GameplayTagBitmaskContainer(registry)
+        container.add_tags(s.split(','))
+        return container
+
+    @staticmethod
+    def from_iterable(
+        tags: Iterable[GameplayTag | str],
+        registry: TagRegistry | None = None,
+    ) -> GameplayTagBitmaskContainer:
+        """
+        Build a container from tags in a single pass.
+
+        Args:
+            tags: GameplayTag handles and/or tag path strings
+            registry: Registry to resolve paths against (defaults to TagRegistry.get())
+
+        Returns:
+            New GameplayTagBitmaskContainer with the given tags
+        """
+        container = GameplayTagBitmaskContainer(registry)
+        container.add_tags(tags)
+        return container
+
+    @staticmethod
+    def from_mask(explicit_mask: int, registry: TagRegistry | None = None) -> GameplayTagBitmaskContainer:
+        """
+        Build a container from an explicit tag bitmask in one pass.
+
+        Args:
+            explicit_mask: Bit N set for each explicit tag ID N
+            registry: Registry that issued the IDs (defaults to TagRegistry.get())
+
+        Returns:
+            New GameplayTagBitmaskContainer
+        """
+        container = GameplayTagBitmaskContainer(registry)
+        container._add_mask(explicit_mask)
+        return container
+
+    def _resolve(self, tag: GameplayTag | str) -> GameplayTag:
+        """Resolve a tag path string against this container's registry."""
+        if isinstance(tag, str):
+            return self._registry.request_tag(tag)
+        return tag
+
+    def _add_resolved(self, tag: GameplayTag) -> None:
+        """Add a resolved tag (invalid tags are ignored)."""
+        self._add_mask(1 << tag.get_id())
+
+    def _remove_resolved(self, tag: GameplayTag) -> bool:
+        """Remove a resolved tag."""
+        return self._remove_mask(1 << tag.get_id()) == 1
+
+    def _contains_in_either(self, tag: GameplayTag) -> bool:
+        """Check if tag is explicit or implied by an explicit descendant."""
+        tag_id = tag.get_id()
+        return tag_id != 0 and (self._tag_mask >> tag_id) & 1 == 1
+
+    def _iter_explicit_tags(self) -> Iterable[GameplayTag]:
+        """Iterate explicit tags in ID order."""
+        get_tag_by_id = self._registry.get_tag_by_id
+        return (get_tag_by_id(tag_id) for tag_id in iter_mask_ids(self._explicit_mask))
+
+    def _collect_mask(self, tags: Iterable[GameplayTag | str]) -> int:
+        """Resolve tags into one explicit mask (invalid tags are skipped)."""
+        request_tag = self._registry.request_tag
+        mask = 0
+        for tag in tags:
+            if isinstance(tag, str):
+                tag = request_tag(tag)
+            mask |= 1 << tag.get_id()
+        return mask & ~1
+
+    def _add_mask(self, mask: int) -> None:
+        """Add explicit tags, incrementing counts of their implied parents."""
+        mask &= ~self._explicit_mask & ~1
+        if not mask:
+            return
+
+        registry = self._registry
+        counts = self._implied_counts
+        tag_mask = self._tag_mask
+        for tag_id in iter_mask_ids(mask):
+            tag_mask |= registry.get_ancestor_mask(tag_id)
+            parent_id = registry.get_parent_id(tag_id)
+            while parent_id:
+                counts[parent_id] = counts.get(parent_id, 0) + 1
+                parent_id = registry.get_parent_id(parent_id)
+
+        self._explicit_mask |= mask
+        self._tag_mask = tag_mask
+
+    def _remove_mask(self, mask: int) -> int:
+        """Remove explicit tags, clearing parent bits whose count drops to zero."""
+        mask &= self._explicit_mask
+        if not mask:
+            return 0
+
+        self._explicit_mask &= ~mask
+        registry = self._registry
+        counts = self._implied_counts
+        cleared = 0
+        for tag_id in iter_mask_ids(mask):
+            if tag_id not in counts:
+                cleared |= 1 << tag_id  # No explicit descendants keep it implied
+            parent_id = registry.get_parent_id(tag_id)
+            while parent_id:
+                count = counts[parent_id] - 1
+                if count:
+                    counts[parent_id] = count
+                else:
+                    del counts[parent_id]
+                    if not (self._explicit_mask >> parent_id) & 1:
+                        cleared |= 1 << parent_id
+                parent_id = registry.get_parent_id(parent_id)
+
+        self._tag_mask &= ~cleared
+        return mask.bit_count()
+
+    def _rebuild_parent_tags(self) -> None:
+        """Recompute the implied mask and parent counts from explicit tags."""
+        mask = self._explicit_mask
+        self._explicit_mask = 0
+        self._tag_mask = 0
+        self._implied_counts.clear()
+        self._add_mask(mask)
+
+    def __repr__(self) -> str:
+        """Debug representation."""
+        return f"GameplayTagBitmaskContainer([{self.to_string()}])"
@@ -12,6 +12,7 @@ Example:
 """
 
 from __future__ import annotations
+from collections.abc import Iterable
 from .gameplay_tag import GameplayTag
 from .tag_registry import TagRegistry
 
@@ -21,25 +22,26 @@ class GameplayTagContainer:
     Container holding a set of gameplay tags with parent matching support.
     
     Features:
-    - Explicit tags: Tags explicitly added by user
-    - Parent tags: Automatically computed from explicit tags
+    - Explicit tags: Tags explicitly added by user (insertion ordered)
+    - Parent tags: Reference counted, one count per explicit descendant,
+      so add/remove only touch the changed tag's ancestors
     - has_tag(): Matches explicit OR parent tags
     - has_tag_exact(): Matches explicit tags only
     - Set operations: has_any(), has_all()
     """
     
-    __slots__ = ('_explicit_tags', '_parent_tags')
+    __slots__ = ('_explicit_tags', '_parent_counts')
     
     def __init__(self) -> None:
         """Create an empty tag container."""
-        self._explicit_tags: list[GameplayTag] = []
-        self._parent_tags: list[GameplayTag] = []
+        self._explicit_tags: dict[GameplayTag, None] = {}
+        self._parent_counts: dict[GameplayTag, int] = {}
     
     def add_tag(self, tag: GameplayTag | str) -> None:
         """
         Add a tag to the container.
         
-        Parent tags are automatically recomputed.
+        Parent tag counts are incremented.
         Duplicate tags are ignored.
         
         Args:
@@ -52,21 +54,39 @@ class GameplayTagContainer:
         if isinstance(tag, str):
             tag = TagRegistry.get().request_tag(tag)
         
-        if not tag.is_valid():
-            return
+        self._add_resolved(tag)
+    
+    def add_tags(self, tags: Iterable[GameplayTag | str]) -> None:
+        """
+        Add several tags in a single pass.
         
-        # Check if already present
-        if tag in self._explicit_tags:
-            return
+        Args:
+            tags: GameplayTag handles and/or tag path strings
+        
+        Example:
+            >>> container.add_tags(["Status.Frozen", "Status.Burning"])
+        """
+        registry = TagRegistry.get()
+        for tag in tags:
+            if isinstance(tag, str):
+                tag = registry.request_tag(tag)
+            self._add_resolved(tag)
+    
+    def update(self, other: GameplayTagContainer) -> None:
+        """
+        Add every explicit tag of another container.
         
-        self._explicit_tags.append(tag)
-        self._rebuild_parent_tags()
+        Args:
+            other: Container to merge in
+        """
+        for tag in other._iter_explicit_tags():
+            self._add_resolved(tag)
     
     def remove_tag(self, tag: GameplayTag | str) -> bool:
         """
         Remove an explicit tag from the container.
         
-        Parent tags are automatically recomputed.
+        Parent tag counts are decremented.
         
         Args:
             tag: GameplayTag handle or tag path string
@@ -77,12 +97,25 @@ class GameplayTagContainer:
         if isinstance(tag, str):
             tag = TagRegistry.get().request_tag(tag)
         
-        try:
-            self._explicit_tags.remove(tag)
-            self._rebuild_parent_tags()
-            return True
-        except ValueError:
-            return False
+        return self._remove_resolved(tag)
+    
+    def remove_tags(self, tags: Iterable[GameplayTag | str]) -> int:
+        """
+        Remove several explicit tags in a single pass.
+        
+        Args:
+            tags: GameplayTag handles and/or tag path strings
+        
+        Returns:
+            Number of tags that were removed
+        """
+        registry = TagRegistry.get()
+        removed = 0
+        for tag in tags:
+            if isinstance(tag, str):
+                tag = registry.request_tag(tag)
+            removed += self._remove_resolved(tag)
+        return removed
     
     def has_tag(self, tag: GameplayTag | str) -> bool:
         """
@@ -142,7 +175,7 @@ class GameplayTagContainer:
         Returns:
             True if at least one tag matches
         """
-        for tag in other._explicit_tags:
+        for tag in other._iter_explicit_tags():
             if self.has_tag(tag):
                 return True
         return False
@@ -159,7 +192,7 @@ class GameplayTagContainer:
         Returns:
             True if all tags match
         """
-        for tag in other._explicit_tags:
+        for tag in other._iter_explicit_tags():
             if not self.has_tag(tag):
                 return False
         return True
@@ -176,7 +209,7 @@ class GameplayTagContainer:
         Returns:
             True if at least one tag matches exactly
         """
-        for tag in other._explicit_tags:
+        for tag in other._iter_explicit_tags():
             if self.has_tag_exact(tag):
                 return True
         return False
@@ -193,7 +226,7 @@ class GameplayTagContainer:
         Returns:
             True if all tags match exactly
         """
-        for tag in other._explicit_tags:
+        for tag in other._iter_explicit_tags():
             if not self.has_tag_exact(tag):
                 return False
         return True
@@ -201,7 +234,7 @@ class GameplayTagContainer:
     def clear(self) -> None:
         """Remove all tags from the container."""
         self._explicit_tags.clear()
-        self._parent_tags.clear()
+        self._parent_counts.clear()
     
     def is_empty(self) -> bool:
         """Check if container has no explicit tags."""
@@ -220,7 +253,45 @@ class GameplayTagContainer:
         Returns:
             List of explicit GameplayTag handles
         """
-        return self._explicit_tags.copy()
+        return list(self._explicit_tags)
+    
+    def get_explicit_mask(self) -> int:
+        """
+        Get bitmask of explicit tags (bit N set for tag ID N).
+        
+        Lets list-backed containers be compared against bitmask containers.
+        
+        Returns:
+            Explicit tag bitmask
+        """
+        mask = 0
+        for tag in self._explicit_tags:
+            mask |= 1 << tag.get_id()
+        return mask
+    
+    def get_tag_mask(self) -> int:
+        """
+        Get bitmask of explicit tags AND their parents.
+        
+        Masks come from the registry the tags are bound to (unbound
+        handles use TagRegistry.get()).
+        
+        Returns:
+            Bitmask used for parent matching
+        
+        Raises:
+            ValueError: If the container holds tags from different registries
+        """
+        registry: TagRegistry | None = None
+        mask = 0
+        for tag in self._explicit_tags:
+            owner = tag.get_registry() or TagRegistry.get()
+            if registry is None:
+                registry = owner
+            elif owner is not registry:
+                raise ValueError("Container mixes tags from different registries")
+            mask |= registry.get_ancestor_mask(tag.get_id())
+        return mask
     
     def to_string(self) -> str:
         """
@@ -254,27 +325,99 @@ class GameplayTagContainer:
         if not s or not s.strip():
             return container
         
-        for tag_path in s.split(','):
-            tag_path = tag_path.strip()
-            if tag_path:
-                container.add_tag(tag_path)
+        container.add_tags(s.split(','))
+        return container
+    
+    @staticmethod
+    def from_iterable(tags: Iterable[GameplayTag | str]) -> GameplayTagContainer:
+        """
+        Build a container from tags in a single pass.
+        
+        Args:
+            tags: GameplayTag handles and/or tag path strings
+        
+        Returns:
+            New GameplayTagContainer with the given tags
         
+        Example:
+            >>> container = GameplayTagContainer.from_iterable(["A.B", "C.D"])
+        """
+        container = GameplayTagContainer()
+        container.add_tags(tags)
         return container
     
+    @staticmethod
+    def from_mask(explicit_mask: int, registry: TagRegistry | None = None) -> GameplayTagContainer:
+        """
+        Build a container from an explicit tag bitmask in one pass.
+        
+        Args:
+            explicit_mask: Bit N set for each explicit tag ID N
+            registry: Registry that issued the IDs (defaults to TagRegistry.get())
+        
+        Returns:
+            New GameplayTagContainer (tags in ID order)
+        """
+        registry = registry if registry is not None else TagRegistry.get()
+        container = GameplayTagContainer()
+        
+        while explicit_mask:
+            low_bit = explicit_mask & -explicit_mask
+            container._add_resolved(registry.get_tag_by_id(low_bit.bit_length() - 1))
+            explicit_mask ^= low_bit
+        
+        return container
+    
+    def _iter_explicit_tags(self) -> Iterable[GameplayTag]:
+        """
+        Iterate explicit tags without copying (for cross-container queries).
+        
+        Subclasses with different storage override this.
+        """
+        return self._explicit_tags
+    
+    def _add_resolved(self, tag: GameplayTag) -> None:
+        """Add a resolved tag and increment its ancestors' counts."""
+        if not tag.is_valid() or tag in self._explicit_tags:
+            return
+        
+        self._explicit_tags[tag] = None
+        parent_counts = self._parent_counts
+        parent = tag.get_parent()
+        while parent.is_valid():
+            parent_counts[parent] = parent_counts.get(parent, 0) + 1
+            parent = parent.get_parent()
+    
+    def _remove_resolved(self, tag: GameplayTag) -> bool:
+        """Remove a resolved tag and decrement its ancestors' counts."""
+        if tag not in self._explicit_tags:
+            return False
+        
+        del self._explicit_tags[tag]
+        parent_counts = self._parent_counts
+        parent = tag.get_parent()
+        while parent.is_valid():
+            count = parent_counts[parent] - 1
+            if count:
+                parent_counts[parent] = count
+            else:
+                del parent_counts[parent]
+            parent = parent.get_parent()
+        return True
+    
     def _rebuild_parent_tags(self) -> None:
         """
-        Recompute parent tags from explicit tags.
+        Recompute parent tag counts from explicit tags.
         
-        Walks up the hierarchy for each explicit tag and collects all parents.
+        Only needed if explicit tags are replaced wholesale; add/remove
+        maintain the counts incrementally.
         """
-        self._parent_tags.clear()
+        self._parent_counts.clear()
         
         for tag in self._explicit_tags:
             parent = tag.get_parent()
             while parent.is_valid():
-                # Add if not already present (in either collection)
-                if not self._contains_in_either(parent):
-                    self._parent_tags.append(parent)
+                self._parent_counts[parent] = self._parent_counts.get(parent, 0) + 1
                 parent = parent.get_parent()
     
     def _contains_in_either(self, tag: GameplayTag) -> bool:
@@ -285,9 +428,9 @@ class GameplayTagContainer:
             tag: Tag to check
         
         Returns:
-            True if found in either list
+            True if found in either collection
         """
-        return tag in self._explicit_tags or tag in self._parent_tags
+        return tag in self._explicit_tags or tag in self._parent_counts
     
     def __repr__(self) -> str:
         """Debug representation."""
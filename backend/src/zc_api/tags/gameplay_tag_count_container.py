@@ -0,0 +1,287 @@
+"""
+GameplayTagCountContainer - reference-counted tags with change events.
+
+Modeled on Unreal's FGameplayTagCountContainer. Each explicit tag carries a
+count (e.g., stacks of Status.Frozen from separate effects), and every
+parent tag carries the sum of its explicit descendants' counts. Systems
+subscribe to changes for specific tags; listeners are indexed by tag ID,
+so a change only notifies listeners of the tag and its parents.
+
+Example:
+    >>> counts = GameplayTagCountContainer(registry)
+    >>> counts.register_tag_event("Status.Frozen", TagEventType.NEW_OR_REMOVED, on_frozen)
+    >>> counts.update_tag_count("Status.Frozen", 1)   # on_frozen(tag, 1)
+    >>> counts.update_tag_count("Status.Frozen", 1)   # no event (count 1 -> 2)
+    >>> counts.update_tag_count("Status.Frozen", -2)  # on_frozen(tag, 0)
+"""
+
+from __future__ import annotations
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import Enum
+from .gameplay_tag import GameplayTag
+from .gameplay_tag_bitmask_container import GameplayTagBitmaskContainer
+from .tag_registry import TagRegistry
+
+# Listener signature: (tag, new_count)
+TagEventCallback = Callable[[GameplayTag, int], None]
+
+
+class TagEventType(Enum):
+    """When a tag listener fires."""
+
+    NEW_OR_REMOVED = "new_or_removed"
+    """Count went from 0 to positive, or from positive to 0."""
+
+    ANY_COUNT_CHANGE = "any_count_change"
+    """Count changed in any way."""
+
+
+@dataclass(frozen=True, slots=True)
+class TagEventHandle:
+    """Returned by register_tag_event(); pass to unregister_tag_event()."""
+    tag_id: int
+    event_type: TagEventType
+    callback: TagEventCallback
+
+
+class _TagListeners:
+    """Listeners for one tag ID."""
+
+    __slots__ = ('new_or_removed', 'any_count_change')
+
+    def __init__(self) -> None:
+        self.new_or_removed: list[TagEventCallback] = []
+        self.any_count_change: list[TagEventCallback] = []
+
+    def for_type(self, event_type: TagEventType) -> list[TagEventCallback]:
+        if event_type is TagEventType.NEW_OR_REMOVED:
+            return self.new_or_removed
+        return self.any_count_change
+
+
+class GameplayTagCountContainer:
+    """
+    Counted tag container with per-tag change subscriptions.
+
+    - _explicit_counts: Count per explicitly added tag ID
+    - _tag_counts: Count per tag ID including implied parents
+    - _explicit_tags: Bitmask container of tags with explicit count > 0,
+      used for has_tag()/has_any()/TagQuery evaluation
+    - _listeners: Listeners indexed by tag ID
+    """
+
+    __slots__ = ('_registry', '_explicit_counts', '_tag_counts', '_explicit_tags', '_listeners')
+
+    def __init__(self, registry: TagRegistry | None = None) -> None:
+        """
+        Create an empty count container.
+
+        Args:
+            registry: Registry providing tag IDs (defaults to TagRegistry.get())
+        """
+        self._registry = registry if registry is not None else TagRegistry.get()
+        self._explicit_counts: dict[int, int] = {}
+        self._tag_counts: dict[int, int] = {}
+        self._explicit_tags = GameplayTagBitmaskContainer(self._registry)
+        self._listeners: dict[int, _TagListeners] = {}
+
+    def update_tag_count(self, tag: GameplayTag | str, delta: int) -> bool:
+        """
+        Add delta to a tag's explicit count (and to all of its parents).
+
+        Counts never drop below zero. Listeners run after all counts are
+        updated, so callbacks observe a consistent container.
+
+        Args:
+            tag: GameplayTag handle or tag path string
+            delta: Count change (positive to add stacks, negative to remove)
+
+        Returns:
+            True if the tag was added to or removed from the explicit tags
+        """
+        tag = self._resolve(tag)
+        tag_id = tag.get_id()
+        if tag_id == 0 or delta == 0:
+            return False
+
+        old_count = self._explicit_counts.get(tag_id, 0)
+        new_count = max(0, old_count + delta)
+        if new_count == old_count:
+            return False
+        return self._apply_explicit_change(tag, old_count, new_count)
+
+    def set_tag_count(self, tag: GameplayTag | str, count: int) -> bool:
+        """
+        Set a tag's explicit count directly.
+
+        Args:
+            tag: GameplayTag handle or tag path string
+            count: New explicit count (clamped to >= 0)
+
+        Returns:
+            True if the tag was added to or removed from the explicit tags
+        """
+        tag = self._resolve(tag)
+        tag_id = tag.get_id()
+        if tag_id == 0:
+            return False
+
+        old_count = self._explicit_counts.get(tag_id, 0)
+        new_count = max(0, count)
+        if new_count == old_count:
+            return False
+        return self._apply_explicit_change(tag, old_count, new_count)
+
+    def get_tag_count(self, tag: GameplayTag | str) -> int:
+        """
+        Get a tag's count including counts implied by child tags.
+
+        Example:
+            >>> counts.update_tag_count("Status.Frozen", 2)
+            >>> counts.update_tag_count("Status.Burning", 1)
+            >>> counts.get_tag_count("Status")  # 3
+        """
+        return self._tag_counts.get(self._resolve(tag).get_id(), 0)
+
+    def get_explicit_tag_count(self, tag: GameplayTag | str) -> int:
+        """Get a tag's explicit count (0 if not explicitly present)."""
+        return self._explicit_counts.get(self._resolve(tag).get_id(), 0)
+
+    def has_matching_tag(self, tag: GameplayTag | str) -> bool:
+        """Check if tag is present (explicit OR parent matching)."""
+        return self._explicit_tags.has_tag(self._resolve(tag))
+
+    def get_explicit_tags(self) -> GameplayTagBitmaskContainer:
+        """
+        Get the container of tags with a positive explicit count.
+
+        Returned container is live; do not modify it directly.
+        """
+        return self._explicit_tags
+
+    def register_tag_event(
+        self,
+        tag: GameplayTag | str,
+        event_type: TagEventType,
+        callback: TagEventCallback,
+    ) -> TagEventHandle:
+        """
+        Subscribe to count changes of one tag.
+
+        Parent tags receive events for changes to any child tag, with the
+        parent's aggregated count.
+
+        Args:
+            tag: Tag to watch
+            event_type: NEW_OR_REMOVED or ANY_COUNT_CHANGE
+            callback: Called as callback(tag, new_count)
+
+        Returns:
+            Handle for unregister_tag_event()
+
+        Raises:
+            ValueError: If tag is invalid
+        """
+        tag = self._resolve(tag)
+        tag_id = tag.get_id()
+        if tag_id == 0:
+            raise ValueError("Cannot register a tag event for an invalid tag")
+
+        listeners = self._listeners.get(tag_id)
+        if listeners is None:
+            listeners = self._listeners[tag_id] = _TagListeners()
+        listeners.for_type(event_type).append(callback)
+        return TagEventHandle(tag_id=tag_id, event_type=event_type, callback=callback)
+
+    def unregister_tag_event(self, handle: TagEventHandle) -> bool:
+        """
+        Remove a subscription.
+
+        Args:
+            handle: Handle returned by register_tag_event()
+
+        Returns:
+            True if the subscription was found and removed
+        """
+        listeners = self._listeners.get(handle.tag_id)
+        if listeners is None:
+            return False
+
+        callbacks = listeners.for_type(handle.event_type)
+        try:
+            callbacks.remove(handle.callback)
+        except ValueError:
+            return False
+
+        if not listeners.new_or_removed and not listeners.any_count_change:
+            del self._listeners[handle.tag_id]
+        return True
+
+    def clear(self) -> None:
+        """
+        Remove all tags without notifying listeners.
+
+        Subscriptions are kept.
+        """
+        self._explicit_counts.clear()
+        self._tag_counts.clear()
+        self._explicit_tags.clear()
+
+    def _apply_explicit_change(self, tag: GameplayTag, old_count: int, new_count: int) -> bool:
+        """Update explicit/implied counts for a tag and its parents, then dispatch events."""
+        tag_id = tag.get_id()
+        delta = new_count - old_count
+
+        if new_count:
+            self._explicit_counts[tag_id] = new_count
+        else:
+            del self._explicit_counts[tag_id]
+
+        presence_changed = old_count == 0 or new_count == 0
+        if old_count == 0:
+            self._explicit_tags.add_tag(tag)
+        elif new_count == 0:
+            self._explicit_tags.remove_tag(tag)
+
+        # Update every count first, collecting listeners to call afterwards
+        pending: list[tuple[list[TagEventCallback], GameplayTag, int]] = []
+        registry = self._registry
+        current_id = tag_id
+        while current_id:
+            previous = self._tag_counts.get(current_id, 0)
+            count = previous + delta
+            if count > 0:
+                self._tag_counts[current_id] = count
+            else:
+                self._tag_counts.pop(current_id, None)
+
+            listeners = self._listeners.get(current_id)
+            if listeners is not None:
+                current_tag = registry.get_tag_by_id(current_id)
+                if listeners.any_count_change:
+                    pending.append((listeners.any_count_change, current_tag, count))
+                if listeners.new_or_removed and (previous == 0 or count == 0):
+                    pending.append((listeners.new_or_removed, current_tag, count))
+
+            current_id = registry.get_parent_id(current_id)
+
+        for callbacks, event_tag, count in pending:
+            for callback in list(callbacks):
+                callback(event_tag, count)
+
+        return presence_changed
+
+    def _resolve(self, tag: GameplayTag | str) -> GameplayTag:
+        """Resolve a tag path string against this container's registry."""
+        if isinstance(tag, str):
+            return self._registry.request_tag(tag)
+        return tag
+
+    def __repr__(self) -> str:
+        """Debug representation."""
+        get_tag_name = self._registry.get_tag_name
+        counts = ', '.join(
+            f"{get_tag_name(tag_id)}={count}" for tag_id, count in sorted(self._explicit_counts.items())
+        )
+        return f"GameplayTagCountContainer([{counts}])"
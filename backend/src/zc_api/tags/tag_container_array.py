@@ -0,0 +1,301 @@
+"""
+TagContainerArray - columnar tag containers for batch evaluation (NumPy).
+
+Stores N containers (e.g., one per tile or block on a board) as 2-D uint64
+bitmask matrices: row = container, bit N of a row = tag ID N. Queries run
+across every row at once and return boolean masks, so bot simulations can
+score whole boards without per-container Python loops.
+
+Requires the optional NumPy dependency (pip install -e ".[sim]"). Not
+re-exported from zc_api.tags so the server does not depend on NumPy.
+
+Example:
+    >>> board = TagContainerArray(16, registry)
+    >>> board.add_tag("Status.Frozen", rows=[0, 5])
+    >>> board.has_tag("Status")          # array([ True, False, ..., True, ...])
+"""
+
+from __future__ import annotations
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from .gameplay_tag import GameplayTag
+from .gameplay_tag_bitmask_container import GameplayTagBitmaskContainer, iter_mask_ids
+from .gameplay_tag_container import GameplayTagContainer
+from .tag_registry import TagRegistry
+
+# Row selector: None (all rows), slice, index array or boolean mask
+RowSelector = slice | Sequence[int] | npt.NDArray[Any] | None
+
+BoolArray = npt.NDArray[np.bool_]
+WordArray = npt.NDArray[np.uint64]
+
+_WORD_BITS = 64
+
+
+class TagContainerArray:
+    """
+    Fixed-size batch of tag containers backed by uint64 matrices.
+
+    - _explicit: (N, W) explicit tag bits
+    - _implied: (N, W) explicit tags OR'd with their ancestor masks
+    - W = words needed to hold the highest tag ID at construction time
+
+    Create arrays after the registry is frozen; tags registered later may
+    not fit in the array width. Queries treat such tags as absent from
+    every row; adding or removing them raises ValueError.
+    """
+
+    __slots__ = ('_registry', '_word_count', '_explicit', '_implied', '_ancestor_words')
+
+    def __init__(self, num_containers: int, registry: TagRegistry | None = None) -> None:
+        """
+        Create N empty containers.
+
+        Args:
+            num_containers: Number of rows (containers)
+            registry: Registry providing tag IDs and ancestor masks
+                (defaults to TagRegistry.get())
+        """
+        self._registry = registry if registry is not None else TagRegistry.get()
+        self._word_count = max(1, (self._registry.get_tag_count() + _WORD_BITS) // _WORD_BITS)
+        self._explicit: WordArray = np.zeros((num_containers, self._word_count), dtype=np.uint64)
+        self._implied: WordArray = np.zeros((num_containers, self._word_count), dtype=np.uint64)
+        self._ancestor_words: dict[int, WordArray] = {}
+
+    @classmethod
+    def from_containers(
+        cls,
+        containers: Sequence[GameplayTagContainer],
+        registry: TagRegistry | None = None,
+    ) -> TagContainerArray:
+        """
+        Pack existing containers into an array (one row each).
+
+        Args:
+            containers: Containers to copy
+            registry: Registry the containers belong to
+
+        Returns:
+            New TagContainerArray
+        """
+        array = cls(len(containers), registry)
+        for index, container in enumerate(containers):
+            array.set_container(index, container)
+        return array
+
+    def __len__(self) -> int:
+        """Number of containers (rows)."""
+        return self._explicit.shape[0]
+
+    def get_container(self, index: int) -> GameplayTagBitmaskContainer:
+        """
+        Unpack one row into a standalone container.
+
+        Args:
+            index: Row index
+
+        Returns:
+            GameplayTagBitmaskContainer with the row's explicit tags
+        """
+        container = GameplayTagBitmaskContainer(self._registry)
+        for tag_id in iter_mask_ids(self._words_to_mask(self._explicit[index])):
+            container.add_tag(self._registry.get_tag_by_id(tag_id))
+        return container
+
+    def set_container(self, index: int, container: GameplayTagContainer) -> None:
+        """
+        Overwrite one row with a container's tags.
+
+        Args:
+            index: Row index
+            container: Source container
+        """
+        self._explicit[index] = self._mask_to_words(container.get_explicit_mask())
+        self._implied[index] = self._mask_to_words(container.get_tag_mask())
+
+    def add_tag(self, tag: GameplayTag | str, rows: RowSelector = None) -> None:
+        """
+        Add a tag to the selected rows.
+
+        Args:
+            tag: GameplayTag handle or tag path string
+            rows: Rows to update (default: all rows)
+        """
+        tag_id = self._resolve_id(tag)
+        if tag_id == 0:
+            return
+
+        word, bit = self._word_bit(tag_id)
+        selector = self._selector(rows)
+        self._explicit[selector, word] |= bit
+        self._implied[selector] |= self._get_ancestor_words(tag_id)
+
+    def remove_tag(self, tag: GameplayTag | str, rows: RowSelector = None) -> None:
+        """
+        Remove an explicit tag from the selected rows.
+
+        Implied parent bits are recomputed only for rows that held the tag.
+
+        Args:
+            tag: GameplayTag handle or tag path string
+            rows: Rows to update (default: all rows)
+        """
+        # Unknown tags (and tags beyond the array width) are in no row
+        tag_id = self._lookup_id(tag)
+        if tag_id == 0 or tag_id >= self._word_count * _WORD_BITS:
+            return
+
+        word, bit = self._word_bit(tag_id)
+        indices = np.arange(len(self))[self._selector(rows)]
+        indices = indices[(self._explicit[indices, word] & bit) != 0]
+        if indices.size == 0:
+            return
+
+        self._explicit[indices, word] &= ~bit
+        self._rebuild_implied(indices)
+
+    def clear(self, rows: RowSelector = None) -> None:
+        """Remove all tags from the selected rows (default: all rows)."""
+        selector = self._selector(rows)
+        self._explicit[selector] = 0
+        self._implied[selector] = 0
+
+    def has_tag(self, tag: GameplayTag | str) -> BoolArray:
+        """
+        Per-row has_tag() (explicit OR parent matching).
+
+        Args:
+            tag: GameplayTag handle or tag path string
+
+        Returns:
+            Boolean array of length N
+        """
+        return self._test_bit(self._implied, tag)
+
+    def has_tag_exact(self, tag: GameplayTag | str) -> BoolArray:
+        """Per-row has_tag_exact() (explicit tags only)."""
+        return self._test_bit(self._explicit, tag)
+
+    def has_any(self, other: GameplayTagContainer) -> BoolArray:
+        """Per-row has_any() (parent matching)."""
+        return self._test_any(self._implied, other.get_explicit_mask())
+
+    def has_all(self, other: GameplayTagContainer) -> BoolArray:
+        """Per-row has_all() (parent matching)."""
+        return self._test_all(self._implied, other.get_explicit_mask())
+
+    def has_any_exact(self, other: GameplayTagContainer) -> BoolArray:
+        """Per-row has_any_exact() (explicit tags only)."""
+        return self._test_any(self._explicit, other.get_explicit_mask())
+
+    def has_all_exact(self, other: GameplayTagContainer) -> BoolArray:
+        """Per-row has_all_exact() (explicit tags only)."""
+        return self._test_all(self._explicit, other.get_explicit_mask())
+
+    def get_explicit_words(self) -> WordArray:
+        """Get a read-only view of the (N, W) explicit tag matrix."""
+        view = self._explicit.view()
+        view.flags.writeable = False
+        return view
+
+    def get_tag_words(self) -> WordArray:
+        """Get a read-only view of the (N, W) explicit + parent tag matrix."""
+        view = self._implied.view()
+        view.flags.writeable = False
+        return view
+
+    def _test_bit(self, matrix: WordArray, tag: GameplayTag | str) -> BoolArray:
+        """Test one tag's bit in every row (all False for tags beyond the array width)."""
+        tag_id = self._lookup_id(tag)
+        if tag_id == 0 or tag_id >= self._word_count * _WORD_BITS:
+            return np.zeros(len(self), dtype=np.bool_)
+        word, bit = self._word_bit(tag_id)
+        return (matrix[:, word] & bit) != 0
+
+    def _test_any(self, matrix: WordArray, mask: int) -> BoolArray:
+        """Rows sharing at least one bit with mask (only non-zero words are read)."""
+        # Tags beyond the array width are in no row
+        query = self._mask_to_words(mask & ((1 << (self._word_count * _WORD_BITS)) - 1))
+        columns = np.flatnonzero(query)
+        return (matrix[:, columns] & query[columns]).any(axis=1)
+
+    def _test_all(self, matrix: WordArray, mask: int) -> BoolArray:
+        """Rows containing every bit of mask (only non-zero words are read)."""
+        if mask.bit_length() > self._word_count * _WORD_BITS:
+            return np.zeros(len(self), dtype=np.bool_)  # Requires a tag no row can hold
+        query = self._mask_to_words(mask)
+        columns = np.flatnonzero(query)
+        return ((matrix[:, columns] & query[columns]) == query[columns]).all(axis=1)
+
+    def _rebuild_implied(self, indices: npt.NDArray[np.intp]) -> None:
+        """Recompute implied bits for rows by OR'ing ancestor words of present tags."""
+        explicit = self._explicit[indices]
+        implied = explicit.copy()
+        present = self._words_to_mask(np.bitwise_or.reduce(explicit, axis=0))
+
+        for tag_id in iter_mask_ids(present):
+            if self._registry.get_parent_id(tag_id) == 0:
+                continue  # Root tags imply nothing beyond their own bit
+            word, bit = self._word_bit(tag_id)
+            holders = (explicit[:, word] & bit) != 0
+            implied[holders] |= self._get_ancestor_words(tag_id)
+
+        self._implied[indices] = implied
+
+    def _get_ancestor_words(self, tag_id: int) -> WordArray:
+        """Get (and cache) a tag's ancestor mask as a word vector."""
+        words = self._ancestor_words.get(tag_id)
+        if words is None:
+            words = self._mask_to_words(self._registry.get_ancestor_mask(tag_id))
+            self._ancestor_words[tag_id] = words
+        return words
+
+    def _lookup_id(self, tag: GameplayTag | str) -> int:
+        """Look up a tag or path without registering it (0 if unknown; may exceed the array width)."""
+        if isinstance(tag, str):
+            tag = self._registry.find_tag(tag)
+        return tag.get_id()
+
+    def _resolve_id(self, tag: GameplayTag | str) -> int:
+        """Resolve (registering if needed) a tag or path to an ID that fits the array width."""
+        if isinstance(tag, str):
+            tag = self._registry.request_tag(tag)
+        tag_id = tag.get_id()
+        if tag_id >= self._word_count * _WORD_BITS:
+            raise ValueError(
+                f"Tag ID {tag_id} exceeds TagContainerArray capacity; "
+                "create arrays after all tags are registered"
+            )
+        return tag_id
+
+    def _mask_to_words(self, mask: int) -> WordArray:
+        """Convert a Python int mask to a word vector."""
+        if mask.bit_length() > self._word_count * _WORD_BITS:
+            raise ValueError("Tag mask exceeds TagContainerArray capacity")
+        raw = mask.to_bytes(self._word_count * 8, 'little')
+        return np.frombuffer(raw, dtype='<u8').astype(np.uint64)
+
+    @staticmethod
+    def _words_to_mask(words: WordArray) -> int:
+        """Convert a word vector back to a Python int mask."""
+        return int.from_bytes(words.astype('<u8').tobytes(), 'little')
+
+    @staticmethod
+    def _word_bit(tag_id: int) -> tuple[int, np.uint64]:
+        """Split a tag ID into (word index, bit value)."""
+        word, offset = divmod(tag_id, _WORD_BITS)
+        return word, np.uint64(1 << offset)
+
+    @staticmethod
+    def _selector(rows: RowSelector) -> Any:
+        """Normalize a row selector for NumPy indexing."""
+        if rows is None:
+            return slice(None)
+        if isinstance(rows, slice):
+            return rows
+        return np.asarray(rows)
+
@@ -0,0 +1,440 @@
+"""
+TagQuery - boolean expressions over gameplay tags.
+
+Queries are parsed once, compiled against a TagRegistry into mask
+predicates, then evaluated many times against containers without any
+string lookups.
+
+Expression language (keywords are case-insensitive):
+    query    := or_expr
+    or_expr  := and_expr ("OR" and_expr)*
+    and_expr := not_expr ("AND" not_expr)*
+    not_expr := "NOT" not_expr | "(" query ")" | match
+    match    := MATCH_FN "(" tag ("," tag)* ")"
+    MATCH_FN := ANY | ALL | NONE | ANY_EXACT | ALL_EXACT | NONE_EXACT
+
+ANY/ALL/NONE use parent matching (like has_tag()); the *_EXACT variants
+only match explicit tags (like has_tag_exact()). A trailing ".*" on a tag
+forces parent matching inside an *_EXACT function.
+
+Compiling only looks tags up; it never registers them. A tag the registry
+does not know yet cannot be in any container, so ANY/NONE ignore it and
+ALL never matches.
+
+Example:
+    >>> query = TagQuery.parse("ANY(Ability.Elemental.Fire) AND NONE(Status.Frozen)")
+    >>> compiled = query.compile(registry)
+    >>> compiled.matches(tile_tags)
+    True
+"""
+
+from __future__ import annotations
+import re
+from collections.abc import Callable, Iterable
+from typing import Literal, NoReturn
+from .gameplay_tag_container import GameplayTagContainer
+from .tag_registry import TagRegistry
+
+# Predicate over (explicit_mask, tag_mask) of a container
+MaskPredicate = Callable[[int, int], bool]
+
+QueryOp = Literal["any", "all", "none", "and", "or", "not"]
+
+_MATCH_FUNCTIONS: dict[str, tuple[QueryOp, bool]] = {
+    "ANY": ("any", False),
+    "ALL": ("all", False),
+    "NONE": ("none", False),
+    "ANY_EXACT": ("any", True),
+    "ALL_EXACT": ("all", True),
+    "NONE_EXACT": ("none", True),
+}
+
+_TOKEN_PATTERN = re.compile(r"\s*(?:(?P<punct>[(),])|(?P<word>[A-Za-z0-9_.*]+))")
+
+_HIERARCHY_SUFFIX = ".*"
+
+
+class TagQuery:
+    """
+    Immutable tag query expression tree.
+
+    Leaves match a list of tags (any/all/none, exact or hierarchical);
+    inner nodes combine queries with and/or/not. Build with parse(), the
+    *_tags_match() factories, or the &, |, ~ operators.
+    """
+
+    __slots__ = ('_op', '_tags', '_exact', '_children')
+
+    def __init__(
+        self,
+        op: QueryOp,
+        tags: tuple[str, ...] = (),
+        exact: bool = False,
+        children: tuple[TagQuery, ...] = (),
+    ) -> None:
+        """
+        Private constructor. Use parse() or the factory methods instead.
+
+        Args:
+            op: Node operation
+            tags: Tag paths (leaf nodes only)
+            exact: Exact matching for leaf tags without a ".*" suffix
+            children: Sub-queries (and/or/not nodes only)
+        """
+        self._op = op
+        self._tags = tags
+        self._exact = exact
+        self._children = children
+
+    @staticmethod
+    def any_tags_match(tags: Iterable[str], exact: bool = False) -> TagQuery:
+        """Match if the container has ANY of the tags (empty list never matches)."""
+        return TagQuery("any", tuple(tags), exact)
+
+    @staticmethod
+    def all_tags_match(tags: Iterable[str], exact: bool = False) -> TagQuery:
+        """Match if the container has ALL of the tags (empty list always matches)."""
+        return TagQuery("all", tuple(tags), exact)
+
+    @staticmethod
+    def no_tags_match(tags: Iterable[str], exact: bool = False) -> TagQuery:
+        """Match if the container has NONE of the tags (empty list always matches)."""
+        return TagQuery("none", tuple(tags), exact)
+
+    @staticmethod
+    def parse(text: str) -> TagQuery:
+        """
+        Parse a query expression.
+
+        Args:
+            text: Query in the expression language (see module docstring)
+
+        Returns:
+            Parsed TagQuery
+
+        Raises:
+            ValueError: If the expression is malformed
+
+        Example:
+            >>> TagQuery.parse("ALL(Player.Owner) AND NOT ANY_EXACT(Status.Frozen)")
+        """
+        return _QueryParser(text).parse()
+
+    def compile(self, registry: TagRegistry | None = None) -> CompiledTagQuery:
+        """
+        Resolve tags and build a mask predicate.
+
+        Args:
+            registry: Registry to resolve tags against (defaults to TagRegistry.get())
+
+        Returns:
+            CompiledTagQuery ready for repeated evaluation
+        """
+        registry = registry if registry is not None else TagRegistry.get()
+        return CompiledTagQuery(self, self._compile_node(registry))
+
+    def __and__(self, other: TagQuery) -> TagQuery:
+        return TagQuery("and", children=(self, other))
+
+    def __or__(self, other: TagQuery) -> TagQuery:
+        return TagQuery("or", children=(self, other))
+
+    def __invert__(self) -> TagQuery:
+        return TagQuery("not", children=(self,))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TagQuery):
+            return NotImplemented
+        return str(self) == str(other)
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+    def __repr__(self) -> str:
+        """Debug representation."""
+        return f"TagQuery('{self}')"
+
+    def __str__(self) -> str:
+        """Expression-language form (round-trips through parse())."""
+        if self._op == "not":
+            return f"NOT {self._children[0]._str_operand()}"
+        if self._op in ("and", "or"):
+            return f" {self._op.upper()} ".join(child._str_operand() for child in self._children)
+        name = self._op.upper() + ("_EXACT" if self._exact else "")
+        return f"{name}({', '.join(self._tags)})"
+
+    def _str_operand(self) -> str:
+        """Render as an operand, parenthesizing boolean combinations."""
+        if self._op in ("and", "or"):
+            return f"({self})"
+        return str(self)
+
+    def _compile_node(self, registry: TagRegistry) -> MaskPredicate:
+        """Compile this node into a predicate over (explicit_mask, tag_mask)."""
+        if self._op == "not":
+            inner = self._children[0]._compile_node(registry)
+            return lambda explicit, implied: not inner(explicit, implied)
+
+        if self._op == "or":
+            return _fold(
+                [child._compile_node(registry) for child in self._children],
+                lambda a, b: lambda explicit, implied: a(explicit, implied) or b(explicit, implied),
+            )
+
+        if self._op == "and":
+            return self._compile_and(registry)
+
+        exact_mask, hierarchy_mask = self._resolve_masks(registry)
+        return _leaf_predicate(self._op, exact_mask, hierarchy_mask)
+
+    def _compile_and(self, registry: TagRegistry) -> MaskPredicate:
+        """
+        Compile an AND node.
+
+        ALL and NONE leaves are merged into one required/forbidden mask pair
+        so that chains like "ALL(a) AND ALL(b) AND NONE(c)" cost a single test.
+        """
+        required_exact = required_hierarchy = 0
+        forbidden_exact = forbidden_hierarchy = 0
+        predicates: list[MaskPredicate] = []
+
+        for child in self._flatten("and"):
+            if child._op == "all":
+                exact_mask, hierarchy_mask = child._resolve_masks(registry)
+                required_exact |= exact_mask
+                required_hierarchy |= hierarchy_mask
+            elif child._op == "none":
+                exact_mask, hierarchy_mask = child._resolve_masks(registry)
+                forbidden_exact |= exact_mask
+                forbidden_hierarchy |= hierarchy_mask
+            else:
+                predicates.append(child._compile_node(registry))
+
+        if required_exact or required_hierarchy:
+            predicates.insert(0, _leaf_predicate("all", required_exact, required_hierarchy))
+        if forbidden_exact or forbidden_hierarchy:
+            predicates.insert(0, _leaf_predicate("none", forbidden_exact, forbidden_hierarchy))
+        if not predicates:
+            return lambda explicit, implied: True
+
+        return _fold(
+            predicates,
+            lambda a, b: lambda explicit, implied: a(explicit, implied) and b(explicit, implied),
+        )
+
+    def _flatten(self, op: QueryOp) -> list[TagQuery]:
+        """Collect operands of nested nodes with the same associative op."""
+        if self._op != op:
+            return [self]
+        result: list[TagQuery] = []
+        for child in self._children:
+            result.extend(child._flatten(op))
+        return result
+
+    def _resolve_masks(self, registry: TagRegistry) -> tuple[int, int]:
+        """
+        Resolve leaf tags into (exact_mask, hierarchy_mask).
+
+        Unknown tags resolve to NONE (bit 0), which no container ever holds:
+        ANY/NONE are unaffected by it and ALL can never be satisfied.
+        """
+        exact_mask = 0
+        hierarchy_mask = 0
+        for tag_path in self._tags:
+            hierarchical = not self._exact
+            if tag_path.endswith(_HIERARCHY_SUFFIX):
+                tag_path = tag_path[:-len(_HIERARCHY_SUFFIX)]
+                hierarchical = True
+
+            tag = registry.find_tag(tag_path)
+            if hierarchical:
+                hierarchy_mask |= 1 << tag.get_id()
+            else:
+                exact_mask |= 1 << tag.get_id()
+        return exact_mask, hierarchy_mask
+
+
+class CompiledTagQuery:
+    """
+    TagQuery bound to a registry's tag IDs.
+
+    Evaluation reads two masks from the container and runs precomputed
+    integer tests. Only valid for containers from the same registry.
+    """
+
+    __slots__ = ('_query', '_predicate')
+
+    def __init__(self, query: TagQuery, predicate: MaskPredicate) -> None:
+        """Private constructor. Use TagQuery.compile() instead."""
+        self._query = query
+        self._predicate = predicate
+
+    def get_query(self) -> TagQuery:
+        """Get the source query."""
+        return self._query
+
+    def matches(self, container: GameplayTagContainer) -> bool:
+        """
+        Evaluate the query against a container.
+
+        Args:
+            container: Tag container (bitmask containers avoid mask rebuilds)
+
+        Returns:
+            True if the container satisfies the query
+        """
+        return self._predicate(container.get_explicit_mask(), container.get_tag_mask())
+
+    def matches_masks(self, explicit_mask: int, tag_mask: int) -> bool:
+        """
+        Evaluate the query against raw container masks.
+
+        Args:
+            explicit_mask: Explicit tag bitmask
+            tag_mask: Explicit + parent tag bitmask
+
+        Returns:
+            True if the masks satisfy the query
+        """
+        return self._predicate(explicit_mask, tag_mask)
+
+    def __call__(self, container: GameplayTagContainer) -> bool:
+        return self.matches(container)
+
+    def __repr__(self) -> str:
+        """Debug representation."""
+        return f"CompiledTagQuery('{self._query}')"
+
+
+def _leaf_predicate(op: QueryOp, exact_mask: int, hierarchy_mask: int) -> MaskPredicate:
+    """Build the predicate for an any/all/none leaf from resolved masks."""
+    if op == "any":
+        if not exact_mask:
+            return lambda explicit, implied: implied & hierarchy_mask != 0
+        if not hierarchy_mask:
+            return lambda explicit, implied: explicit & exact_mask != 0
+        return lambda explicit, implied: (explicit & exact_mask) | (implied & hierarchy_mask) != 0
+
+    if op == "all":
+        if not exact_mask:
+            return lambda explicit, implied: implied & hierarchy_mask == hierarchy_mask
+        if not hierarchy_mask:
+            return lambda explicit, implied: explicit & exact_mask == exact_mask
+        return lambda explicit, implied: (
+            explicit & exact_mask == exact_mask and implied & hierarchy_mask == hierarchy_mask
+        )
+
+    if not exact_mask:
+        return lambda explicit, implied: implied & hierarchy_mask == 0
+    if not hierarchy_mask:
+        return lambda explicit, implied: explicit & exact_mask == 0
+    return lambda explicit, implied: (explicit & exact_mask) | (implied & hierarchy_mask) == 0
+
+
+def _fold(
+    predicates: list[MaskPredicate],
+    combine: Callable[[MaskPredicate, MaskPredicate], MaskPredicate],
+) -> MaskPredicate:
+    """Right-fold predicates into nested short-circuiting closures."""
+    result = predicates[-1]
+    for predicate in reversed(predicates[:-1]):
+        result = combine(predicate, result)
+    return result
+
+
+class _QueryParser:
+    """Recursive-descent parser for the TagQuery expression language."""
+
+    def __init__(self, text: str) -> None:
+        self._text = text
+        self._tokens = self._tokenize(text)
+        self._pos = 0
+
+    def parse(self) -> TagQuery:
+        if not self._tokens:
+            raise ValueError("Empty tag query")
+        query = self._parse_or()
+        if self._pos < len(self._tokens):
+            self._error(f"unexpected '{self._tokens[self._pos]}'")
+        return query
+
+    def _tokenize(self, text: str) -> list[str]:
+        tokens: list[str] = []
+        pos = 0
+        while pos < len(text):
+            if text[pos:].isspace():
+                break
+            match = _TOKEN_PATTERN.match(text, pos)
+            if match is None:
+                raise ValueError(f"Invalid character {text[pos]!r} in tag query '{text}'")
+            tokens.append(match.group("punct") or match.group("word"))
+            pos = match.end()
+        return tokens
+
+    def _peek_keyword(self) -> str | None:
+        if self._pos < len(self._tokens):
+            return self._tokens[self._pos].upper()
+        return None
+
+    def _next(self) -> str:
+        if self._pos >= len(self._tokens):
+            self._error("unexpected end of query")
+        token = self._tokens[self._pos]
+        self._pos += 1
+        return token
+
+    def _expect(self, expected: str) -> None:
+        token = self._next()
+        if token != expected:
+            self._error(f"expected '{expected}' but found '{token}'")
+
+    def _parse_or(self) -> TagQuery:
+        operands = [self._parse_and()]
+        while self._peek_keyword() == "OR":
+            self._pos += 1
+            operands.append(self._parse_and())
+        return operands[0] if len(operands) == 1 else TagQuery("or", children=tuple(operands))
+
+    def _parse_and(self) -> TagQuery:
+        operands = [self._parse_not()]
+        while self._peek_keyword() == "AND":
+            self._pos += 1
+            operands.append(self._parse_not())
+        return operands[0] if len(operands) == 1 else TagQuery("and", children=tuple(operands))
+
+    def _parse_not(self) -> TagQuery:
+        keyword = self._peek_keyword()
+        if keyword == "NOT":
+            self._pos += 1
+            return TagQuery("not", children=(self._parse_not(),))
+
+        if keyword == "(":
+            self._pos += 1
+            query = self._parse_or()
+            self._expect(")")
+            return query
+
+        token = self._next()
+        function = _MATCH_FUNCTIONS.get(token.upper())
+        if function is None:
+            self._error(f"expected ANY/ALL/NONE(...) but found '{token}'")
+        op, exact = function
+
+        self._expect("(")
+        tags = [self._parse_tag()]
+        while self._peek_keyword() == ",":
+            self._pos += 1
+            tags.append(self._parse_tag())
+        self._expect(")")
+        return TagQuery(op, tuple(tags), exact)
+
+    def _parse_tag(self) -> str:
+        token = self._next()
+        if token in ("(", ")", ","):
+            self._error(f"expected tag path but found '{token}'")
+        if "*" in token.removesuffix(_HIERARCHY_SUFFIX) or token.startswith("."):
+            self._error(f"invalid tag path '{token}'")
+        return token
+
+    def _error(self, message: str) -> NoReturn:
+        raise ValueError(f"Invalid tag query '{self._text}': {message}")
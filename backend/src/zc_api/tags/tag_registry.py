@@ -11,8 +11,11 @@ Example:
 """
 
 from __future__ import annotations
-from typing import Callable
-from .gameplay_tag import GameplayTag
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Callable, ClassVar
+from .gameplay_tag import GameplayTag, set_active_registry
+from .tag_registry_snapshot import TagRegistrySnapshot
 
 
 class TagRegistry:
@@ -24,16 +27,33 @@ class TagRegistry:
     - Assign unique IDs to tags
     - Track parent-child relationships
     - Enforce strict mode (reject unknown tags)
+    - Compile an immutable snapshot once registration is done (freeze)
+    - Intern one flyweight GameplayTag handle per ID
     
-    Instance should be stored in app.state during FastAPI lifespan.
+    Instance should be stored in app.state during FastAPI lifespan and
+    activated so that TagRegistry.get() and unbound handles resolve to it.
     """
 
+    # Registry returned by TagRegistry.get()
+    _active: ClassVar[TagRegistry | None] = None
+
     def __init__(self) -> None:
         # Index 0 is reserved for invalid/none tag
+        self._tags: list[GameplayTag] = [GameplayTag.NONE]
         self._strings: list[str] = [""]
         self._lookup: dict[str, int] = {"": 0}
         self._parent_ids: list[int] = [0]
+        # Bit i set for tag i and every ancestor of tag i (see get_ancestor_mask)
+        self._ancestor_masks: list[int] = [0]
         self._strict_mode: bool = False
+        self._snapshot: TagRegistrySnapshot | None = None
+        # (tag count, checksum) for unfrozen registries; tags are append-only
+        self._checksum_cache: tuple[int, str] | None = None
+        # Set by from_snapshot(): names and parents are read from the snapshot
+        # tables, and handles/ancestor masks are built on first use
+        self._table: TagRegistrySnapshot | None = None
+        self._handles: dict[int, GameplayTag] = {}
+        self._mask_cache: dict[int, int] = {}
 
     def request_tag(self, tag_path: str) -> GameplayTag:
         """
@@ -60,7 +80,7 @@ class TagRegistry:
         # Check if already registered
         tag_id = self._find_tag(tag_path)
         if tag_id != 0:
-            return GameplayTag(tag_id)
+            return self.get_tag_by_id(tag_id)
         
         # In strict mode, don't create new tags
         if self._strict_mode:
@@ -68,7 +88,117 @@ class TagRegistry:
         
         # Create the tag (and any missing parent tags)
         tag_id = self._intern_tag(tag_path)
-        return GameplayTag(tag_id)
+        return self._tags[tag_id]
+    
+    def find_tag(self, tag_path: str) -> GameplayTag:
+        """
+        Look up a tag by path without registering it.
+        
+        Args:
+            tag_path: Hierarchical path (e.g., "Player.Owner.P1")
+        
+        Returns:
+            GameplayTag handle (or NONE if not registered)
+        """
+        return self.get_tag_by_id(self._find_tag(tag_path.strip()))
+    
+    @classmethod
+    def from_snapshot(cls, snapshot: TagRegistrySnapshot) -> TagRegistry:
+        """
+        Create a frozen registry from a compiled snapshot.
+        
+        Used with TagRegistrySnapshot.load() to start from a prebuilt binary
+        tag table. Nothing is copied: lookups read the snapshot tables in
+        place, and a tag's handle and ancestor mask are built the first
+        time it is used. IDs match the snapshot.
+        
+        Args:
+            snapshot: Snapshot to adopt (kept as this registry's snapshot)
+        
+        Returns:
+            Frozen TagRegistry
+        
+        Example:
+            >>> registry = TagRegistry.from_snapshot(TagRegistrySnapshot.load("tags.bin"))
+        """
+        registry = cls()
+        registry._table = snapshot
+        registry._snapshot = snapshot
+        registry._strict_mode = True
+        return registry
+    
+    def get_tag_by_id(self, tag_id: int) -> GameplayTag:
+        """
+        Internal: Get the interned handle for a tag ID.
+        
+        Args:
+            tag_id: Internal tag ID
+        
+        Returns:
+            Flyweight GameplayTag (NONE if invalid ID)
+        """
+        table = self._table
+        if table is None:
+            if 0 <= tag_id < len(self._tags):
+                return self._tags[tag_id]
+            return GameplayTag.NONE
+        
+        tag = self._handles.get(tag_id)
+        if tag is None:
+            if not 0 < tag_id <= table.get_tag_count():
+                return GameplayTag.NONE
+            tag = self._handles[tag_id] = GameplayTag(tag_id, self)
+        return tag
+    
+    @classmethod
+    def get(cls) -> TagRegistry:
+        """
+        Get the active registry.
+        
+        Creates and activates an empty registry if none is active yet
+        (convenient for scripts; the app activates its own in lifespan).
+        
+        Returns:
+            Active TagRegistry
+        """
+        registry = cls._active
+        if registry is None:
+            registry = cls()
+            registry.activate()
+        return registry
+    
+    def activate(self) -> TagRegistry | None:
+        """
+        Make this the active registry.
+        
+        TagRegistry.get() returns it, and handles not bound to a registry
+        (GameplayTag.NONE, handles built from raw IDs) resolve through it.
+        
+        Returns:
+            Previously active registry (or None)
+        """
+        previous = TagRegistry._active
+        TagRegistry._active = self
+        set_active_registry(self)
+        return previous
+    
+    @contextmanager
+    def activated(self) -> Iterator[TagRegistry]:
+        """
+        Activate this registry for the duration of a with-block.
+        
+        The previously active registry is restored on exit.
+        
+        Example:
+            >>> with TagRegistry().activated() as registry:
+            ...     container.add_tag("Status.Frozen")
+        """
+        previous = self.activate()
+        try:
+            yield self
+        finally:
+            TagRegistry._active = previous
+            set_active_registry(previous)
     
     def register_tags_from_source(self, loader: Callable[[], list[str]]) -> None:
         """
@@ -99,13 +229,66 @@ class TagRegistry:
         
         Args:
             strict: True to enable strict mode
+        
+        Raises:
+            RuntimeError: If disabling strict mode on a frozen registry
         """
+        if not strict and self._snapshot is not None:
+            raise RuntimeError("Cannot disable strict mode on a frozen TagRegistry")
         self._strict_mode = strict
     
     def is_strict_mode(self) -> bool:
         """Check if strict mode is enabled."""
         return self._strict_mode
     
+    def freeze(self) -> TagRegistrySnapshot:
+        """
+        Lock the registry and compile an immutable snapshot.
+        
+        Enables strict mode and rejects any further registration. The
+        snapshot holds compact array tables (parents, depths, DFS order)
+        for descendant queries and is safe to share read-only across
+        threads and forked workers. Calling freeze() again returns the
+        same snapshot.
+        
+        Returns:
+            Compiled TagRegistrySnapshot
+        
+        Example:
+            >>> snapshot = registry.freeze()
+            >>> snapshot.get_descendant_ids(snapshot.find_tag_id("Ability"))
+        """
+        if self._snapshot is None:
+            self._snapshot = TagRegistrySnapshot.build(self._strings, self._parent_ids)
+            self._strict_mode = True
+        return self._snapshot
+    
+    def is_frozen(self) -> bool:
+        """Check if freeze() has been called."""
+        return self._snapshot is not None
+    
+    def get_snapshot(self) -> TagRegistrySnapshot | None:
+        """Get the compiled snapshot, or None if not frozen yet."""
+        return self._snapshot
+    
+    def get_checksum(self) -> str:
+        """
+        Get the checksum of the ID -> name mapping (hex string).
+        
+        Registries with equal checksums assign identical tag IDs, so it can
+        be compared between client and server or across workers. Cheap once
+        frozen; otherwise recomputed only after new tags are registered.
+        """
+        snapshot = self._snapshot
+        if snapshot is not None:
+            return snapshot.get_checksum()
+        
+        cached = self._checksum_cache
+        if cached is None or cached[0] != len(self._strings):
+            checksum = TagRegistrySnapshot.build(self._strings, self._parent_ids).get_checksum()
+            cached = self._checksum_cache = (len(self._strings), checksum)
+        return cached[1]
+    
     def get_tag_name(self, tag_id: int) -> str:
         """
         Internal: Get tag path string by ID.
@@ -116,6 +299,8 @@ class TagRegistry:
         Returns:
             Tag path string (empty if invalid ID)
         """
+        if self._table is not None:
+            return self._table.get_tag_name(tag_id)
         if 0 <= tag_id < len(self._strings):
             return self._strings[tag_id]
         return ""
@@ -130,10 +315,39 @@ class TagRegistry:
         Returns:
             Parent tag ID (0 if no parent)
         """
+        if self._table is not None:
+            return self._table.get_parent_id(tag_id)
         if 0 <= tag_id < len(self._parent_ids):
             return self._parent_ids[tag_id]
         return 0
     
+    def get_ancestor_mask(self, tag_id: int) -> int:
+        """
+        Internal: Get bitmask of a tag and all of its ancestors.
+        
+        Bit N is set for tag ID N. Masks are computed once when the tag is
+        interned, so bitmask containers can apply parent matching with a
+        single OR instead of walking the hierarchy.
+        
+        Args:
+            tag_id: Internal tag ID
+        
+        Returns:
+            Ancestor mask (0 if invalid ID)
+        
+        Example:
+            >>> mask = registry.get_ancestor_mask(registry.request_tag("A.B")._id)
+            >>> # Bits set for "A" and "A.B"
+        """
+        if self._table is not None:
+            mask = self._mask_cache.get(tag_id)
+            if mask is None:
+                mask = self._mask_cache[tag_id] = self._table.get_ancestor_mask(tag_id)
+            return mask
+        if 0 < tag_id < len(self._ancestor_masks):
+            return self._ancestor_masks[tag_id]
+        return 0
+    
     def _find_tag(self, tag_path: str) -> int:
         """
         Find tag ID by path (returns 0 if not found).
@@ -144,6 +358,8 @@ class TagRegistry:
         Returns:
             Tag ID or 0 if not found
         """
+        if self._table is not None:
+            return self._table.find_tag_id(tag_path)
         return self._lookup.get(tag_path, 0)
     
     def _intern_tag(self, tag_path: str) -> int:
@@ -157,12 +373,18 @@ class TagRegistry:
         
         Returns:
             Tag ID
+        
+        Raises:
+            RuntimeError: If the registry is frozen and the tag is new
         """
         # Check if already exists
         existing = self._find_tag(tag_path)
         if existing != 0:
             return existing
         
+        if self._snapshot is not None:
+            raise RuntimeError(f"Cannot register tag '{tag_path}' on a frozen TagRegistry")
+        
         # Find parent path (everything before last '.')
         parent_id = 0
         last_dot = tag_path.rfind('.')
@@ -174,6 +396,8 @@ class TagRegistry:
         new_id = len(self._strings)
         self._strings.append(tag_path)
         self._parent_ids.append(parent_id)
+        self._ancestor_masks.append(self._ancestor_masks[parent_id] | (1 << new_id))
+        self._tags.append(GameplayTag(new_id, self))
         self._lookup[tag_path] = new_id
         
         return new_id
@@ -185,8 +409,12 @@ class TagRegistry:
         Returns:
             List of all tag paths (excluding empty string at index 0)
         """
+        if self._table is not None:
+            return self._table.get_all_tags()
         return self._strings[1:]  # Skip index 0 (invalid tag)
     
     def get_tag_count(self) -> int:
         """Get total number of registered tags (excluding NONE)."""
+        if self._table is not None:
+            return self._table.get_tag_count()
         return len(self._strings) - 1
@@ -0,0 +1,541 @@
+"""
+TagRegistrySnapshot - compiled, immutable view of a TagRegistry.
+
+Produced by TagRegistry.freeze() once all tags are registered.
+All tables are flat read-only buffers (no per-tag Python objects), so a
+snapshot can be shared across threads or inherited by forked workers
+without reference-count writes dirtying copy-on-write pages.
+
+Hierarchy queries use DFS numbering over the tag tree (rooted at NONE):
+- "is X a descendant of Y" is an interval comparison
+- "all descendants of Y" is a contiguous slice of the preorder table
+
+Snapshots can be saved as a versioned binary tag table and memory-mapped
+back at startup (see save()/load()), skipping tag registration entirely.
+
+Example:
+    >>> snapshot = registry.freeze()
+    >>> fire = snapshot.find_tag_id("Ability.Elemental.Fire")
+    >>> elemental = snapshot.find_tag_id("Ability.Elemental")
+    >>> snapshot.is_descendant(fire, elemental)
+    True
+"""
+
+from __future__ import annotations
+import hashlib
+import mmap
+import struct
+import sys
+import zlib
+from array import array
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+
+# Binary tag table layout (little-endian, every section 4-byte aligned):
+#   header: magic, format version, tag count (incl. NONE), bucket count,
+#           name blob size, SHA-256 checksum of every section below,
+#           source digest (opaque to the table; identifies what it was built from)
+#   uint32 name_offsets[count + 1], parent_ids[count], preorder[count],
+#          postorder[count], order[count], hashes[count], buckets[bucket_count]
+#   uint16 depths[count] (padded to 4 bytes)
+#   name blob
+TAG_TABLE_MAGIC = b"ZCTAGTBL"
+TAG_TABLE_VERSION = 2
+_HEADER = struct.Struct("<8sIIII32s32s")
+_NO_SOURCE_DIGEST = bytes(32)
+
+
+class TagTableError(ValueError):
+    """Raised when a binary tag table is malformed or fails verification."""
+    pass
+
+
+def hash_tag_path(tag_path: str) -> int:
+    """
+    Hash a tag path for snapshot lookup tables.
+
+    Args:
+        tag_path: Full tag path
+
+    Returns:
+        Unsigned 32-bit hash (CRC-32 of the UTF-8 path)
+    """
+    return zlib.crc32(tag_path.encode('utf-8'))
+
+
+class TagRegistrySnapshot:
+    """
+    Immutable, array-backed tag table.
+
+    Per tag ID (index 0 is NONE and acts as the tree root):
+    - _name_offsets: Start offset of the name in _name_blob (N+1 entries)
+    - _parent_ids: Parent tag ID
+    - _depths: Number of path segments ("A.B" = 2, NONE = 0)
+    - _preorder/_postorder: DFS visit numbers
+    - _hashes: hash_tag_path() of the name
+
+    Plus:
+    - _order: Tag IDs in preorder (descendants of a tag are contiguous)
+    - _buckets: Open-addressing hash index mapping names to IDs (0 = empty)
+    - _checksum: SHA-256 of every table (tables are derived from the
+      ID -> name mapping, so equal checksums mean equal tag IDs, e.g.
+      between client and server)
+    - _source_digest: What the table was built from (see load())
+
+    Tables are exposed as read-only memoryviews; use TagRegistry.freeze()
+    to create one rather than calling build() directly.
+    """
+
+    __slots__ = (
+        '_name_blob', '_name_offsets', '_parent_ids', '_depths',
+        '_preorder', '_postorder', '_order', '_hashes', '_buckets', '_checksum',
+        '_source_digest',
+    )
+
+    def __init__(
+        self,
+        name_blob: bytes | memoryview,
+        name_offsets: memoryview,
+        parent_ids: memoryview,
+        depths: memoryview,
+        preorder: memoryview,
+        postorder: memoryview,
+        order: memoryview,
+        hashes: memoryview,
+        buckets: memoryview,
+        checksum: bytes,
+        source_digest: bytes = _NO_SOURCE_DIGEST,
+    ) -> None:
+        """
+        Private constructor. Use TagRegistry.freeze() or build() instead.
+
+        Args:
+            name_blob: UTF-8 tag names, concatenated in ID order
+            name_offsets: Name start offsets (one extra trailing entry)
+            parent_ids: Parent ID per tag
+            depths: Depth per tag
+            preorder: DFS preorder number per tag
+            postorder: DFS postorder number per tag
+            order: Tag IDs sorted by preorder number
+            hashes: Name hash per tag
+            buckets: Hash index (power-of-two length)
+            checksum: compute_checksum() of every table
+            source_digest: 32-byte digest of the table's sources (zeros if unknown)
+        """
+        self._name_blob = name_blob
+        self._name_offsets = name_offsets
+        self._parent_ids = parent_ids
+        self._depths = depths
+        self._preorder = preorder
+        self._postorder = postorder
+        self._order = order
+        self._hashes = hashes
+        self._buckets = buckets
+        self._checksum = checksum
+        self._source_digest = source_digest
+
+    @classmethod
+    def build(cls, tag_paths: Sequence[str], parent_ids: Sequence[int]) -> TagRegistrySnapshot:
+        """
+        Compile registry tables into a snapshot.
+
+        Args:
+            tag_paths: Tag path per ID (index 0 must be "")
+            parent_ids: Parent ID per ID (parents must have lower IDs)
+
+        Returns:
+            New immutable snapshot
+        """
+        count = len(tag_paths)
+
+        encoded = [path.encode('utf-8') for path in tag_paths]
+        name_offsets = array('I', [0]) * (count + 1)
+        offset = 0
+        for tag_id, name in enumerate(encoded):
+            name_offsets[tag_id] = offset
+            offset += len(name)
+        name_offsets[count] = offset
+
+        children: list[list[int]] = [[] for _ in range(count)]
+        for tag_id in range(1, count):
+            children[parent_ids[tag_id]].append(tag_id)
+
+        # Iterative DFS from the NONE root (hierarchies can be deep)
+        depths = array('H', [0]) * count
+        preorder = array('I', [0]) * count
+        postorder = array('I', [0]) * count
+        order = array('I', [0])
+        next_post = 0
+        stack = [(0, iter(children[0]))]
+        while stack:
+            node, pending = stack[-1]
+            child = next(pending, None)
+            if child is None:
+                stack.pop()
+                postorder[node] = next_post
+                next_post += 1
+                continue
+            depths[child] = depths[node] + 1
+            preorder[child] = len(order)
+            order.append(child)
+            stack.append((child, iter(children[child])))
+
+        hashes = array('I', [zlib.crc32(name) for name in encoded])
+        bucket_count = 8
+        while bucket_count < count * 2:
+            bucket_count *= 2
+        buckets = array('I', [0]) * bucket_count
+        bucket_mask = bucket_count - 1
+        for tag_id in range(1, count):
+            slot = hashes[tag_id] & bucket_mask
+            while buckets[slot]:
+                slot = (slot + 1) & bucket_mask
+            buckets[slot] = tag_id
+
+        def freeze(table: array[int]) -> memoryview:
+            return memoryview(table).toreadonly()
+
+        snapshot = cls(
+            name_blob=b''.join(encoded),
+            name_offsets=freeze(name_offsets),
+            parent_ids=freeze(array('I', parent_ids)),
+            depths=freeze(depths),
+            preorder=freeze(preorder),
+            postorder=freeze(postorder),
+            order=freeze(order),
+            hashes=freeze(hashes),
+            buckets=freeze(buckets),
+            checksum=b"",
+        )
+        snapshot._checksum = cls.compute_checksum(snapshot._get_sections())
+        return snapshot
+
+    @staticmethod
+    def compute_checksum(sections: Iterable[bytes | memoryview]) -> bytes:
+        """
+        Hash the serialized tables.
+
+        Every table is covered, so a corrupted parent, order or index table
+        fails verification just like a corrupted name. Tables are derived
+        deterministically from the names, so the digest still identifies
+        the ID -> name mapping.
+
+        Args:
+            sections: Table bytes in file order (see TAG_TABLE_MAGIC layout comment)
+
+        Returns:
+            32-byte SHA-256 digest
+        """
+        digest = hashlib.sha256()
+        for section in sections:
+            digest.update(section)
+        return digest.digest()
+
+    def to_bytes(self, source_digest: bytes | None = None) -> bytes:
+        """
+        Serialize to the binary tag table format.
+
+        Args:
+            source_digest: 32-byte digest to record (defaults to the snapshot's own)
+
+        Returns:
+            Table bytes (see TAG_TABLE_MAGIC layout comment)
+        """
+        if source_digest is None:
+            source_digest = self._source_digest
+        if len(source_digest) != 32:
+            raise ValueError("Tag table source digest must be 32 bytes")
+
+        header = _HEADER.pack(
+            TAG_TABLE_MAGIC,
+            TAG_TABLE_VERSION,
+            len(self._parent_ids),
+            len(self._buckets),
+            len(self._name_blob),
+            self._checksum,
+            source_digest,
+        )
+        return b"".join([header, *self._get_sections()])
+
+    @classmethod
+    def from_buffer(cls, buffer: bytes | memoryview | mmap.mmap, verify: bool = True) -> TagRegistrySnapshot:
+        """
+        Use a binary tag table in place (no copies of the tables are made).
+
+        Args:
+            buffer: Table bytes (e.g., a memory-mapped file)
+            verify: Recompute and compare the checksum
+
+        Returns:
+            Snapshot whose tables are views into buffer
+
+        Raises:
+            TagTableError: If the table is malformed or the checksum mismatches
+        """
+        if sys.byteorder != "little" or array('I').itemsize != 4:
+            raise TagTableError("Binary tag tables require a little-endian platform")
+
+        view = memoryview(buffer).toreadonly()
+        if len(view) < _HEADER.size:
+            raise TagTableError("Tag table is truncated")
+
+        magic, version, count, bucket_count, blob_size, checksum, source_digest = _HEADER.unpack_from(view)
+        if magic != TAG_TABLE_MAGIC:
+            raise TagTableError("Not a tag table (bad magic)")
+        if version != TAG_TABLE_VERSION:
+            raise TagTableError(f"Unsupported tag table version {version} (expected {TAG_TABLE_VERSION})")
+        # Lookups probe until an empty bucket: the index must be a power of two with free slots
+        if count < 1 or bucket_count < 2 * count or bucket_count & (bucket_count - 1):
+            raise TagTableError("Tag table header is inconsistent")
+
+        offset = _HEADER.size
+
+        def take(length: int, typecode: str, item_size: int) -> memoryview:
+            nonlocal offset
+            end = offset + length * item_size
+            if end > len(view):
+                raise TagTableError("Tag table is truncated")
+            section = view[offset:end].cast(typecode)
+            offset = end
+            return section
+
+        name_offsets = take(count + 1, 'I', 4)
+        parent_ids = take(count, 'I', 4)
+        preorder = take(count, 'I', 4)
+        postorder = take(count, 'I', 4)
+        order = take(count, 'I', 4)
+        hashes = take(count, 'I', 4)
+        buckets = take(bucket_count, 'I', 4)
+        depths = take(count, 'H', 2)
+        offset += -offset % 4
+        name_blob = take(blob_size, 'B', 1)
+        if offset != len(view):
+            raise TagTableError("Tag table has trailing bytes")
+
+        if verify and cls.compute_checksum((view[_HEADER.size:],)) != checksum:
+            raise TagTableError("Tag table checksum mismatch")
+
+        return cls(
+            name_blob=name_blob,
+            name_offsets=name_offsets,
+            parent_ids=parent_ids,
+            depths=depths,
+            preorder=preorder,
+            postorder=postorder,
+            order=order,
+            hashes=hashes,
+            buckets=buckets,
+            checksum=checksum,
+            source_digest=source_digest,
+        )
+
+    def save(self, path: Path | str, source_digest: bytes | None = None) -> None:
+        """
+        Write the snapshot as a binary tag table file.
+
+        Args:
+            path: Output file path
+            source_digest: 32-byte digest of what the table was built from,
+                checked by loaders to detect a stale table without rebuilding it
+        """
+        Path(path).write_bytes(self.to_bytes(source_digest))
+
+    @classmethod
+    def load(cls, path: Path | str, verify: bool = True) -> TagRegistrySnapshot:
+        """
+        Memory-map a binary tag table file.
+
+        Pages are shared with every process mapping the same file, and
+        only the pages actually touched are read from disk.
+
+        Args:
+            path: Table file path
+            verify: Recompute and compare the checksum
+
+        Returns:
+            Snapshot backed by the mapped file
+
+        Raises:
+            TagTableError: If the table is malformed or the checksum mismatches
+            OSError: If the file cannot be opened
+        """
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls.from_buffer(mapped, verify=verify)
+
+    def get_source_digest(self) -> bytes:
+        """Get the source digest recorded by save() (32 zero bytes if none)."""
+        return self._source_digest
+
+    def get_checksum(self) -> str:
+        """
+        Get the table checksum as a hex string.
+
+        Two snapshots with the same checksum assign identical tag IDs.
+        """
+        return self._checksum.hex()
+
+    def find_tag_id(self, tag_path: str) -> int:
+        """
+        Find tag ID by path via the hash index.
+
+        Args:
+            tag_path: Tag path to lookup
+
+        Returns:
+            Tag ID or 0 if not found
+        """
+        if not tag_path:
+            return 0
+        encoded = tag_path.encode('utf-8')
+        path_hash = zlib.crc32(encoded)
+        buckets = self._buckets
+        bucket_mask = len(buckets) - 1
+        slot = path_hash & bucket_mask
+        while tag_id := buckets[slot]:
+            if self._hashes[tag_id] == path_hash and self._name_bytes(tag_id) == encoded:
+                return tag_id
+            slot = (slot + 1) & bucket_mask
+        return 0
+
+    def get_tag_name(self, tag_id: int) -> str:
+        """
+        Get tag path string by ID.
+
+        Args:
+            tag_id: Internal tag ID
+
+        Returns:
+            Tag path string (empty if invalid ID)
+        """
+        if 0 < tag_id < len(self._parent_ids):
+            return self._name_bytes(tag_id).decode('utf-8')
+        return ""
+
+    def get_parent_id(self, tag_id: int) -> int:
+        """
+        Get parent tag ID.
+
+        Args:
+            tag_id: Internal tag ID
+
+        Returns:
+            Parent tag ID (0 if no parent or invalid ID)
+        """
+        if 0 <= tag_id < len(self._parent_ids):
+            return self._parent_ids[tag_id]
+        return 0
+
+    def get_depth(self, tag_id: int) -> int:
+        """
+        Get number of path segments ("A.B.C" = 3).
+
+        Args:
+            tag_id: Internal tag ID
+
+        Returns:
+            Depth (0 for NONE or invalid ID)
+        """
+        if 0 <= tag_id < len(self._depths):
+            return self._depths[tag_id]
+        return 0
+
+    def get_ancestor_mask(self, tag_id: int) -> int:
+        """
+        Get bitmask of a tag and all of its ancestors.
+
+        Computed from the parent table on demand (snapshots hold no
+        per-tag Python objects).
+
+        Args:
+            tag_id: Internal tag ID
+
+        Returns:
+            Ancestor mask (0 if invalid ID)
+        """
+        if not 0 < tag_id < len(self._parent_ids):
+            return 0
+        mask = 0
+        parent_ids = self._parent_ids
+        while tag_id:
+            mask |= 1 << tag_id
+            tag_id = parent_ids[tag_id]
+        return mask
+
+    def is_descendant(self, tag_id: int, ancestor_id: int) -> bool:
+        """
+        Check if a tag is a strict descendant of another tag.
+
+        Uses the DFS interval: X is below Y iff Y is visited before X in
+        preorder and finished after X in postorder.
+
+        Args:
+            tag_id: Candidate descendant
+            ancestor_id: Candidate ancestor
+
+        Returns:
+            True if tag_id lies in ancestor_id's subtree (and differs from it)
+
+        Example:
+            >>> snapshot.is_descendant(id_of("A.B.C"), id_of("A"))  # True
+            >>> snapshot.is_descendant(id_of("A"), id_of("A"))      # False
+        """
+        count = len(self._parent_ids)
+        if not (0 < tag_id < count and 0 <= ancestor_id < count):
+            return False
+        return (
+            self._preorder[ancestor_id] < self._preorder[tag_id]
+            and self._postorder[tag_id] < self._postorder[ancestor_id]
+        )
+
+    def get_descendant_ids(self, tag_id: int) -> memoryview:
+        """
+        Get IDs of all descendants of a tag (excluding the tag itself).
+
+        Returns a zero-copy slice of the preorder table. Subtree size
+        follows from the DFS numbering: post = pre + size - 1 - depth.
+
+        Args:
+            tag_id: Internal tag ID (0 returns every tag)
+
+        Returns:
+            Read-only view of descendant IDs in preorder
+        """
+        if not 0 <= tag_id < len(self._parent_ids):
+            return self._order[0:0]
+        start = self._preorder[tag_id]
+        size = self._postorder[tag_id] - start + self._depths[tag_id] + 1
+        return self._order[start + 1:start + size]
+
+    def get_tag_count(self) -> int:
+        """Get total number of tags (excluding NONE)."""
+        return len(self._parent_ids) - 1
+
+    def get_all_tags(self) -> list[str]:
+        """
+        Get all tag paths in ID order (excluding NONE).
+
+        Returns:
+            List of tag paths
+        """
+        return [self.get_tag_name(tag_id) for tag_id in range(1, len(self._parent_ids))]
+
+    def _get_sections(self) -> list[bytes | memoryview]:
+        """Get the tables as bytes, in file order (with depth padding)."""
+        depths = self._depths.cast('B')
+        return [
+            self._name_offsets.cast('B'),
+            self._parent_ids.cast('B'),
+            self._preorder.cast('B'),
+            self._postorder.cast('B'),
+            self._order.cast('B'),
+            self._hashes.cast('B'),
+            self._buckets.cast('B'),
+            depths,
+            b"\0" * (-len(depths) % 4),
+            self._name_blob,
+        ]
+
+    def _name_bytes(self, tag_id: int) -> bytes:
+        """Get the raw UTF-8 name of a tag."""
+        return bytes(self._name_blob[self._name_offsets[tag_id]:self._name_offsets[tag_id + 1]])
@@ -0,0 +1,191 @@
+"""
+Compact binary wire format for tag containers.
+
+Replaces comma-separated tag paths (to_string()) in network payloads with
+tag IDs. Each encoded container is one of:
+- ID list: varint count, then varint deltas of the sorted tag IDs
+- Bitmask: varint byte length, then the little-endian explicit mask
+
+The encoder picks whichever is smaller. By default a 4-byte registry version
+(prefix of TagRegistry.get_checksum()) is included so that a peer with a
+different tag table rejects the payload instead of misreading IDs.
+
+Layout:
+    byte 0      flags: bit 0 = bitmask encoding, bit 1 = version present
+    [bytes 1-4] registry version (big-endian), if flagged
+    payload
+
+Example:
+    >>> data = encode_tags(tile_tags, registry)  # a few bytes instead of full paths
+    >>> restored = decode_tags(data, registry)   # GameplayTagBitmaskContainer
+"""
+
+from __future__ import annotations
+from .gameplay_tag_bitmask_container import GameplayTagBitmaskContainer, iter_mask_ids
+from .gameplay_tag_container import GameplayTagContainer
+from .tag_registry import TagRegistry
+
+_FLAG_BITMASK = 0x01
+_FLAG_VERSION = 0x02
+# Enough for any 64-bit value; longer runs of continuation bytes are rejected
+_MAX_VARINT_BYTES = 10
+
+
+class TagWireError(ValueError):
+    """Raised when encoded tags are malformed or from another registry version."""
+    pass
+
+
+def get_registry_version(registry: TagRegistry | None = None) -> int:
+    """
+    Get the 32-bit registry version embedded in encoded containers.
+
+    Args:
+        registry: Registry to identify (defaults to TagRegistry.get())
+
+    Returns:
+        First 4 bytes of the registry checksum as an int
+    """
+    registry = registry if registry is not None else TagRegistry.get()
+    return int(registry.get_checksum()[:8], 16)
+
+
+def encode_tags(
+    container: GameplayTagContainer,
+    registry: TagRegistry | None = None,
+    include_version: bool = True,
+) -> bytes:
+    """
+    Encode a container's explicit tags.
+
+    Args:
+        container: Container to encode
+        registry: Registry the container belongs to (defaults to TagRegistry.get())
+        include_version: Prefix the registry version (omit when the enclosing
+            message already carries it)
+
+    Returns:
+        Encoded bytes
+    """
+    mask = container.get_explicit_mask()
+
+    id_list = bytearray()
+    _write_varint(id_list, mask.bit_count())
+    previous = 0
+    for tag_id in iter_mask_ids(mask):
+        _write_varint(id_list, tag_id - previous)
+        previous = tag_id
+
+    mask_length = (mask.bit_length() + 7) // 8
+    bitmask = bytearray()
+    _write_varint(bitmask, mask_length)
+    bitmask_size = len(bitmask) + mask_length
+
+    flags = 0
+    if bitmask_size <= len(id_list):
+        flags |= _FLAG_BITMASK
+        bitmask += mask.to_bytes(mask_length, 'little')
+        payload = bitmask
+    else:
+        payload = id_list
+
+    header = bytearray()
+    if include_version:
+        flags |= _FLAG_VERSION
+        header += get_registry_version(registry).to_bytes(4, 'big')
+
+    return bytes([flags]) + bytes(header) + bytes(payload)
+
+
+def decode_tags(
+    data: bytes | memoryview,
+    registry: TagRegistry | None = None,
+    container_type: type[GameplayTagContainer] = GameplayTagBitmaskContainer,
+) -> GameplayTagContainer:
+    """
+    Decode a container in one pass (parents are computed once, at the end).
+
+    Args:
+        data: Bytes produced by encode_tags()
+        registry: Registry to resolve IDs against (defaults to TagRegistry.get())
+        container_type: GameplayTagBitmaskContainer (default) or GameplayTagContainer
+
+    Returns:
+        New container with the decoded explicit tags
+
+    Raises:
+        TagWireError: If data is malformed, has unknown tag IDs, or was
+            encoded with a different registry version
+    """
+    registry = registry if registry is not None else TagRegistry.get()
+    view = memoryview(data)
+    if len(view) < 1:
+        raise TagWireError("Encoded tags are empty")
+
+    flags = view[0]
+    pos = 1
+    if flags & _FLAG_VERSION:
+        if len(view) < 5:
+            raise TagWireError("Encoded tags are truncated")
+        version = int.from_bytes(view[1:5], 'big')
+        expected = get_registry_version(registry)
+        if version != expected:
+            raise TagWireError(
+                f"Encoded tags use registry version {version:08x}, expected {expected:08x}"
+            )
+        pos = 5
+
+    max_tag_id = registry.get_tag_count()
+    if flags & _FLAG_BITMASK:
+        length, pos = _read_varint(view, pos)
+        if pos + length != len(view):
+            raise TagWireError("Encoded tag bitmask has the wrong length")
+        mask = int.from_bytes(view[pos:pos + length], 'little')
+    else:
+        count, pos = _read_varint(view, pos)
+        mask = 0
+        tag_id = 0
+        for _ in range(count):
+            delta, pos = _read_varint(view, pos)
+            if delta == 0 and tag_id != 0:
+                raise TagWireError("Encoded tag IDs are not strictly increasing")
+            tag_id += delta
+            # Checked before shifting: a huge delta would otherwise allocate a huge int
+            if tag_id > max_tag_id:
+                raise TagWireError("Encoded tags reference unknown tag IDs")
+            mask |= 1 << tag_id
+        if pos != len(view):
+            raise TagWireError("Trailing bytes after encoded tag IDs")
+
+    if mask & 1 or mask.bit_length() > max_tag_id + 1:
+        raise TagWireError("Encoded tags reference unknown tag IDs")
+
+    if container_type is GameplayTagBitmaskContainer:
+        return GameplayTagBitmaskContainer.from_mask(mask, registry)
+    return GameplayTagContainer.from_mask(mask, registry)
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    """Append an unsigned LEB128 varint."""
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(view: memoryview, pos: int) -> tuple[int, int]:
+    """Read an unsigned LEB128 varint. Returns (value, next position)."""
+    result = 0
+    shift = 0
+    end = pos + _MAX_VARINT_BYTES
+    while True:
+        if pos >= len(view):
+            raise TagWireError("Encoded tags are truncated")
+        if pos >= end:
+            raise TagWireError("Encoded varint is too long")
+        byte = view[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
@@ -0,0 +1,180 @@
+"""Backplane tests: matchmaking, presence and relay across worker processes."""
+
+import asyncio
+import multiprocessing
+
+import pytest
+from fastapi.testclient import TestClient
+
+from zc_api.config import settings
+from zc_api.game_manager.backplane import UnixBackplane
+from zc_api.game_manager.backplane.bus import BusError, read_frame, write_frame
+from zc_api.game_manager.backplane.hub import BackplaneHub
+from zc_api.main import create_app
+
+
+async def _worker(path: str, name: str, results, done) -> None:
+    backplane = UnixBackplane(path)
+    relayed: asyncio.Queue[dict] = asyncio.Queue()
+    both_connected = asyncio.Event()
+
+    async def on_relay(match_id: str, token: str, payload: dict) -> None:
+        relayed.put_nowait(payload)
+
+    async def on_presence(match_id: str, connected: frozenset[str]) -> None:
+        if len(connected) == 2:
+            both_connected.set()
+
+    backplane.bind(on_relay, on_presence)
+    await backplane.start()
+    try:
+        assignment = await backplane.wait_for_match(name, "fire")
+        presence = await backplane.claim(assignment.match_id, assignment.player_token)
+        if len(presence.connected) == 2:
+            both_connected.set()
+
+        players = await backplane.get_match(assignment.match_id)
+        opponent = next(slot for slot in players if slot.token != assignment.player_token)
+        results.put(("matched", name, assignment.match_id, opponent.name, backplane.is_hub()))
+
+        await asyncio.wait_for(both_connected.wait(), 10)
+        await backplane.relay(assignment.match_id, opponent.token, {"type": "pinged", "from": name})
+        payload = await asyncio.wait_for(relayed.get(), 10)
+        results.put(("relayed", name, payload["from"]))
+
+        # Keep the bus (and possibly the hub) up until every worker is done
+        await asyncio.get_running_loop().run_in_executor(None, done.wait, 10)
+    finally:
+        await backplane.stop()
+
+
+def _run_worker(path: str, name: str, results, done) -> None:
+    asyncio.run(_worker(path, name, results, done))
+
+
+def test_workers_share_matchmaking_and_relay(tmp_path):
+    context = multiprocessing.get_context("spawn")
+    path = str(tmp_path / "bp.sock")
+    results = context.Queue()
+    done = context.Event()
+    workers = [
+        context.Process(target=_run_worker, args=(path, name, results, done))
+        for name in ("A", "B")
+    ]
+    for worker in workers:
+        worker.start()
+
+    try:
+        events = [results.get(timeout=30) for _ in range(4)]
+    finally:
+        done.set()
+        for worker in workers:
+            worker.join(10)
+
+    matched = {event[1]: event for event in events if event[0] == "matched"}
+    assert matched["A"][2] == matched["B"][2]
+    assert (matched["A"][3], matched["B"][3]) == ("B", "A")
+    # Exactly one worker won the lock and hosted the hub
+    assert matched["A"][4] != matched["B"][4]
+
+    relayed = {event[1]: event[2] for event in events if event[0] == "relayed"}
+    assert relayed == {"A": "B", "B": "A"}
+    assert [worker.exitcode for worker in workers] == [0, 0]
+
+
+async def test_relay_to_unconnected_player_returns_to_sender(tmp_path):
+    backplane = UnixBackplane(str(tmp_path / "bp.sock"))
+    relayed: list[tuple[str, dict]] = []
+
+    async def on_relay(match_id: str, token: str, payload: dict) -> None:
+        relayed.append((token, payload))
+
+    async def on_presence(match_id: str, connected: frozenset[str]) -> None:
+        pass
+
+    backplane.bind(on_relay, on_presence)
+    await backplane.start()
+    try:
+        assert backplane.is_hub()
+        first, second = await asyncio.gather(
+            backplane.wait_for_match("A", "fire"),
+            backplane.wait_for_match("B", "water"),
+        )
+        assert first.match_id == second.match_id
+        assert await backplane.get_match("missing") is None
+
+        # Nobody hosts B yet, so the sender gets it back to buffer for resume
+        await backplane.relay(first.match_id, second.player_token, {"type": "pinged"})
+        for _ in range(100):
+            if relayed:
+                break
+            await asyncio.sleep(0.01)
+        assert relayed == [(second.player_token, {"type": "pinged"})]
+
+        presence = await backplane.claim(first.match_id, first.player_token)
+        assert presence.connected == {first.player_token} and not presence.was_started
+    finally:
+        await backplane.stop()
+
+
+async def test_hub_survives_malformed_frames(tmp_path):
+    path = str(tmp_path / "bp.sock")
+    hub = BackplaneHub(path)
+    await hub.start()
+    try:
+        reader, writer = await asyncio.open_unix_connection(path)
+        write_frame(writer, {"op": "enqueue"})
+        write_frame(writer, {"op": "relay", "match_id": 1, "token": None})
+        write_frame(writer, {"op": "claim", "id": 1})
+        write_frame(writer, {"op": "bogus", "id": 2})
+        write_frame(writer, {"op": "get_match", "id": 3, "match_id": "missing"})
+
+        replies = [await asyncio.wait_for(read_frame(reader), 5) for _ in range(3)]
+        assert [reply["id"] for reply in replies] == [1, 2, 3]
+        assert "error" in replies[0] and "error" in replies[1]
+        assert replies[2] == {"id": 3, "result": None}
+        assert hub.get_stats()["workers"] == 1
+        writer.close()
+    finally:
+        await hub.stop()
+
+
+async def test_hub_matchmaking_failure_fails_the_ticket(tmp_path, monkeypatch):
+    backplane = UnixBackplane(str(tmp_path / "bp.sock"))
+    await backplane.start()
+    try:
+        async def broken_wait_for_match(*args, **kwargs):
+            raise RuntimeError("create_matches failed")
+
+        monkeypatch.setattr(backplane._hub._matchmaker, "wait_for_match", broken_wait_for_match)
+        with pytest.raises(BusError, match="create_matches failed"):
+            await asyncio.wait_for(backplane.wait_for_match("A", "fire"), timeout=5)
+    finally:
+        await backplane.stop()
+
+
+def test_game_messages_relay_between_app_workers(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "backplane", "unix")
+    monkeypatch.setattr(settings, "backplane_socket_path", str(tmp_path / "bp.sock"))
+    headers = {"origin": "http://localhost:5173"}
+
+    # Two apps on separate event loops stand in for two uvicorn workers
+    with TestClient(create_app()) as worker_1, TestClient(create_app()) as worker_2:
+        with worker_1.websocket_connect("/ws/matchmaking?name=A", headers=dict(headers)) as ws_a:
+            ws_a.receive_json()
+            with worker_2.websocket_connect("/ws/matchmaking?name=B", headers=dict(headers)) as ws_b:
+                ws_b.receive_json()
+                found_b = ws_b.receive_json()
+            found_a = ws_a.receive_json()
+        assert found_a["match_id"] == found_b["match_id"]
+
+        url = f"/ws/game/{found_a['match_id']}?token="
+        with worker_1.websocket_connect(url + found_a["player_token"], headers=dict(headers)) as ws_a:
+            with worker_2.websocket_connect(url + found_b["player_token"], headers=dict(headers)) as ws_b:
+                assert ws_a.receive_json()["opponent"] == "B"
+                assert ws_b.receive_json()["opponent"] == "A"
+
+                ws_a.send_json({"type": "ping"})
+                assert ws_b.receive_json()["type"] == "pinged"
+
+            assert ws_a.receive_json()["type"] == "opponent_disconnected"
@@ -0,0 +1,71 @@
+"""Binary WebSocket subprotocol tests."""
+
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from zc_api.common.binary_protocol import BINARY_SUBPROTOCOL, BinaryProtocolError
+from zc_api.models.matchmaking import ServerMatchFound, ServerStatus
+from zc_api.models.protocol import WIRE_PROTOCOL, decode_session_client_message
+from zc_api.models.session import ClientPing, ServerGameReady, ServerPinged
+
+
+def test_binary_round_trip_is_compact():
+    messages = [
+        ServerGameReady(type="game_ready", match_id="m1", you="Ünï", opponent="B", opponent_elemental="fire"),
+        ServerPinged(type="pinged"),
+        ServerStatus(type="status", status="matched", detail=""),
+        ServerMatchFound(type="match_found", match_id="m1", player_token="t" * 32),
+    ]
+    for message in messages:
+        data = WIRE_PROTOCOL.encode(message)
+        assert WIRE_PROTOCOL.decode(data) == message
+        assert len(data) < len(message.model_dump_json())
+
+    # Type ID + seq
+    assert len(WIRE_PROTOCOL.encode(ServerPinged(type="pinged"))) == 2
+    assert WIRE_PROTOCOL.encode({"type": "pinged"}) == WIRE_PROTOCOL.encode(ServerPinged(type="pinged"))
+
+
+def test_binary_decode_rejects_bad_frames():
+    ping = WIRE_PROTOCOL.encode(ClientPing(type="ping"))
+    assert decode_session_client_message(ping) == ClientPing(type="ping")
+    assert decode_session_client_message('{"type": "ping"}') == ClientPing(type="ping")
+
+    with pytest.raises(BinaryProtocolError):
+        decode_session_client_message(WIRE_PROTOCOL.encode(ServerPinged(type="pinged")))
+    with pytest.raises(BinaryProtocolError):
+        WIRE_PROTOCOL.decode(b"\x7f")
+    with pytest.raises(BinaryProtocolError):
+        WIRE_PROTOCOL.decode(ping + b"\x00")
+
+
+def test_binary_decode_rejects_overlong_varints_quickly():
+    hostile = b"\xff" * 1_000_000
+    started = time.perf_counter()
+    with pytest.raises(BinaryProtocolError):
+        WIRE_PROTOCOL.decode(hostile)
+    with pytest.raises(BinaryProtocolError):
+        decode_session_client_message(hostile)
+    # Overlong field varint after a valid type ID
+    with pytest.raises(BinaryProtocolError):
+        WIRE_PROTOCOL.decode(WIRE_PROTOCOL.encode(ServerPinged(type="pinged"))[:1] + hostile)
+    assert time.perf_counter() - started < 0.1
+
+
+def test_matchmaking_negotiates_binary_subprotocol(app):
+    headers = {"origin": "http://localhost:5173"}
+    with TestClient(app) as client:
+        with client.websocket_connect("/ws/matchmaking", headers=dict(headers), subprotocols=[BINARY_SUBPROTOCOL]) as ws:
+            assert ws.accepted_subprotocol == BINARY_SUBPROTOCOL
+            status = WIRE_PROTOCOL.decode(ws.receive_bytes())
+            assert status == ServerStatus(type="status", status="queueing", detail="waiting for opponent")
+
+        with client.websocket_connect("/ws/matchmaking", headers=dict(headers)) as ws:
+            assert ws.accepted_subprotocol is None
+            assert ws.receive_json()["type"] == "status"
+
+        schema = client.get("/protocol/binary").json()
+        assert schema["subprotocol"] == BINARY_SUBPROTOCOL
+        assert schema["messages"][1]["type"] == "pinged"
@@ -0,0 +1,18 @@
+"""WebSocket codec tests."""
+
+import json
+
+from zc_api.common.codec import encode_dict, encode_message, get_message_type
+from zc_api.models.session import ServerGameReady
+
+
+def test_codec_matches_legacy_json_output():
+    model = ServerGameReady(
+        type="game_ready", match_id="m1", you="Ünïcode", opponent="B", opponent_elemental="fire"
+    )
+    payload = {"type": "state_delta", "tiles": [{"x": 1, "owner": "P1"}], "note": "é"}
+
+    assert json.loads(encode_message(model)) == model.model_dump()
+    assert encode_dict(payload) == json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+    assert get_message_type(model) == "game_ready"
+    assert get_message_type(payload) == "state_delta"
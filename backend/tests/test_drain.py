@@ -0,0 +1,128 @@
+"""Drain mode tests."""
+
+import asyncio
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from zc_api.config import settings
+from zc_api.game_manager.backplane import InMemoryBackplane, UnixBackplane
+from zc_api.game_manager.drain import DrainController, DrainState
+from zc_api.game_manager.session import MatchmakingClosedError, SessionRegistry
+from zc_api.main import create_app
+
+HEADERS = {"origin": "http://localhost:5173"}
+
+
+class SilentWebSocket:
+    async def send_text(self, payload: str) -> None:
+        pass
+
+
+async def test_drain_closes_matchmaking_and_times_out_on_stuck_sessions():
+    registry = SessionRegistry(shard_count=4)
+    backplane = InMemoryBackplane(registry)
+    drained: list[bool] = []
+    drain = DrainController(registry, backplane, timeout=0.2, poll_interval=0.01, on_drained=lambda: drained.append(True))
+
+    waiting = asyncio.create_task(backplane.wait_for_match("A", "fire"))
+    await asyncio.sleep(0)
+    match_id, token_a, _ = await registry.create_match("B", "fire", "C", "water")
+    session = await registry.get_session(match_id)
+    await session.join(token_a, SilentWebSocket())
+
+    assert drain.start("test")
+    assert not drain.start("again")
+    with pytest.raises(MatchmakingClosedError):
+        await waiting
+    with pytest.raises(MatchmakingClosedError):
+        await backplane.wait_for_match("D", "fire")
+
+    await asyncio.wait_for(drain._task, timeout=2)
+    status = drain.get_status()
+    assert drain.get_state() is DrainState.DRAINED and drained == [True]
+    assert status["timed_out"] and status["active_sessions"] == 1
+    await session.leave(token_a)
+
+
+async def test_hub_worker_waits_for_other_workers_before_exiting(tmp_path):
+    path = str(tmp_path / "bp.sock")
+    hub_worker, other_worker = UnixBackplane(path), UnixBackplane(path)
+    await hub_worker.start()
+    await other_worker.start()
+    try:
+        assert hub_worker.is_hub() and not other_worker.is_hub()
+        drained: list[bool] = []
+        drain = DrainController(
+            SessionRegistry(shard_count=1),
+            hub_worker,
+            timeout=0.1,
+            poll_interval=0.01,
+            on_drained=lambda: drained.append(True),
+        )
+        assert drain.start("test")
+
+        # No sessions here, but the other worker still needs the hub
+        await asyncio.sleep(0.2)
+        status = drain.get_status()
+        assert not drained and status["state"] == "draining" and status["dependent_workers"] == 1
+        first, second = await asyncio.wait_for(
+            asyncio.gather(other_worker.wait_for_match("A", "fire"), other_worker.wait_for_match("B", "water")),
+            timeout=5,
+        )
+        assert first.match_id == second.match_id
+
+        await other_worker.stop()
+        await asyncio.wait_for(drain._task, timeout=2)
+        assert drained == [True] and drain.get_state() is DrainState.DRAINED
+    finally:
+        await other_worker.stop()
+        await hub_worker.stop()
+
+
+def test_drain_lets_matches_finish_and_turns_away_new_players(monkeypatch):
+    monkeypatch.setattr(settings, "drain_exit_when_done", False)
+
+    with TestClient(create_app()) as client:
+        with client.websocket_connect("/ws/matchmaking?name=A", headers=dict(HEADERS)) as ws_a:
+            ws_a.receive_json()
+            with client.websocket_connect("/ws/matchmaking?name=B", headers=dict(HEADERS)) as ws_b:
+                ws_b.receive_json()
+                found_b = ws_b.receive_json()
+            found_a = ws_a.receive_json()
+
+        url = f"/ws/game/{found_a['match_id']}?token="
+        with client.websocket_connect(url + found_a["player_token"], headers=dict(HEADERS)) as ws_a, \
+                client.websocket_connect(url + found_b["player_token"], headers=dict(HEADERS)) as ws_b, \
+                client.websocket_connect("/ws/matchmaking?name=C", headers=dict(HEADERS)) as ws_c:
+            assert ws_a.receive_json()["type"] == "game_ready"
+            assert ws_b.receive_json()["type"] == "game_ready"
+            assert ws_c.receive_json()["status"] == "queueing"
+
+            assert client.post("/admin/drain").json()["started"] is True
+
+            # Queued player is turned away; in-game players are told once
+            assert ws_c.receive_json()["type"] == "error"
+            with pytest.raises(WebSocketDisconnect) as closed:
+                ws_c.receive_json()
+            assert closed.value.code == 1013
+            assert ws_a.receive_json()["type"] == "server_shutdown"
+            assert ws_b.receive_json()["type"] == "server_shutdown"
+
+            health = client.get("/health")
+            assert health.status_code == 503 and health.json()["status"] == "draining"
+            status = client.get("/admin/drain").json()
+            assert status["state"] == "draining" and status["active_sessions"] == 1
+
+            # The match keeps working while draining
+            ws_a.send_json({"type": "ping"})
+            assert ws_b.receive_json()["type"] == "pinged"
+
+        deadline = time.monotonic() + 5
+        while (status := client.get("/admin/drain").json())["state"] != "drained":
+            assert time.monotonic() < deadline
+            time.sleep(0.05)
+        assert status["active_sessions"] == 0 and not status["timed_out"]
+        assert status["notified"] == {"sent": 2, "failed": 0, "timed_out": 0}
@@ -0,0 +1,57 @@
+"""HTTP matchmaking ticket tests."""
+
+import asyncio
+import time
+
+from fastapi.testclient import TestClient
+
+from zc_api.game_manager.backplane import InMemoryBackplane
+from zc_api.game_manager.session import SessionRegistry
+from zc_api.game_manager.tickets import MatchTicketStore, TicketStatus
+from zc_api.main import create_app
+
+HEADERS = {"origin": "http://localhost:5173"}
+
+
+async def test_unpolled_ticket_expires_and_leaves_the_queue():
+    backplane = InMemoryBackplane(SessionRegistry(shard_count=4))
+    store = MatchTicketStore(backplane, ttl=5, max_wait=1)
+
+    ticket = await store.create("A", "fire")
+    polled = await store.wait(ticket.ticket_id, timeout=0.01)
+    assert polled is ticket and ticket.get_status() is TicketStatus.QUEUED
+
+    assert store.expire_tickets(now=time.monotonic() + 1) == []
+    assert store.expire_tickets(now=time.monotonic() + 10) == [ticket.ticket_id]
+    await asyncio.sleep(0)
+
+    assert await store.wait(ticket.ticket_id, timeout=0) is None
+    assert store.get_stats() == {"tickets": 0, "queued": 0, "created": 1, "expired": 1}
+    stats = await backplane.get_matchmaking_stats()
+    assert stats["waiting"] == 0 and stats["abandoned"] == 1
+
+
+def test_ticket_flow_long_polls_until_matched_and_joins_the_game():
+    with TestClient(create_app()) as client:
+        first = client.post("/api/matchmaking/tickets", json={"name": "A", "elemental": "fire"})
+        assert first.status_code == 202 and first.json()["status"] == "queued"
+        ticket_a = first.json()["ticket_id"]
+
+        polled = client.get(f"/api/matchmaking/tickets/{ticket_a}", params={"wait": 0.05})
+        assert polled.status_code == 200 and polled.json()["status"] == "queued"
+
+        second = client.post("/api/matchmaking/tickets", json={"name": "B", "elemental": "water"}).json()
+        assert second["status"] == "matched"
+        matched = client.get(f"/api/matchmaking/tickets/{ticket_a}", params={"wait": 5}).json()
+        assert matched["status"] == "matched" and matched["match_id"] == second["match_id"]
+
+        url = f"/ws/game/{matched['match_id']}?token="
+        with client.websocket_connect(url + matched["player_token"], headers=dict(HEADERS)) as ws_a, \
+                client.websocket_connect(url + second["player_token"], headers=dict(HEADERS)) as ws_b:
+            assert ws_a.receive_json()["type"] == "game_ready"
+            assert ws_b.receive_json()["type"] == "game_ready"
+
+        third = client.post("/api/matchmaking/tickets", json={"name": "C"}).json()
+        assert client.delete(f"/api/matchmaking/tickets/{third['ticket_id']}").status_code == 204
+        assert client.get(f"/api/matchmaking/tickets/{third['ticket_id']}").status_code == 404
+        assert client.get("/admin/matchmaking").json()["tickets"]["created"] == 3
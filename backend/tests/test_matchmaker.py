@@ -0,0 +1,180 @@
+"""Matchmaker and wait queue tests."""
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from zc_api.config import settings
+from zc_api.game_manager.session import (
+    Matchmaker,
+    MatchPreferences,
+    RatingPool,
+    RatingWindow,
+    SessionRegistry,
+    WaitingEntry,
+    WaitingQueue,
+)
+from zc_api.main import create_app
+
+HEADERS = {"origin": "http://localhost:5173"}
+
+
+def make_entry(
+    name: str,
+    enqueued_at: float,
+    elemental: str = "fire",
+    preferences: MatchPreferences = MatchPreferences(),
+) -> WaitingEntry:
+    future = asyncio.get_running_loop().create_future()
+    return WaitingEntry(name=name, elemental=elemental, future=future, enqueued_at=enqueued_at, preferences=preferences)
+
+
+def names(pairs: list[tuple[WaitingEntry, WaitingEntry]]) -> set[frozenset[str]]:
+    return {frozenset((a.name, b.name)) for a, b in pairs}
+
+
+async def test_cancelled_entries_leave_the_queue_immediately():
+    queue = WaitingQueue()
+    entries = [make_entry(name, enqueued_at) for name, enqueued_at in (("A", 10.0), ("B", 11.0), ("C", 12.0))]
+    for entry in entries:
+        queue.push(entry)
+
+    entries[0].future.cancel()
+    await asyncio.sleep(0)  # Done-callbacks run on the next loop iteration
+
+    assert len(queue) == 2
+    stats = queue.get_stats(now=14.0)
+    assert stats["oldest_wait_seconds"] == 3.0 and stats["mean_wait_seconds"] == 2.5
+    assert queue.pop_oldest() is entries[1]
+
+    stats = queue.get_stats(now=14.0)
+    assert stats == {
+        "waiting": 1,
+        "oldest_wait_seconds": 2.0,
+        "mean_wait_seconds": 2.0,
+        "enqueued": 3,
+        "matched": 1,
+        "abandoned": 1,
+    }
+    assert queue.drain() == [entries[2]] and len(queue) == 0
+
+
+async def test_matchmaker_pairs_in_arrival_order_and_skips_disconnected_players():
+    matchmaker = Matchmaker(SessionRegistry(shard_count=4))
+
+    gone = asyncio.create_task(matchmaker.wait_for_match("A", "fire"))
+    await asyncio.sleep(0)
+    gone.cancel()
+    await asyncio.sleep(0)
+    assert matchmaker.get_stats()["waiting"] == 0
+
+    first = asyncio.create_task(matchmaker.wait_for_match("B", "fire"))
+    await asyncio.sleep(0)
+    assert matchmaker.get_stats()["waiting"] == 1
+
+    second = await matchmaker.wait_for_match("C", "water")
+    assert (await first).match_id == second.match_id
+
+    stats = matchmaker.get_stats()
+    assert stats["waiting"] == 0 and stats["matched"] == 1 and stats["abandoned"] == 1
+
+
+async def test_batched_tick_pairs_the_whole_queue_in_one_bulk_call():
+    class CountingRegistry(SessionRegistry):
+        bulk_calls = 0
+
+        async def create_matches(self, players):
+            CountingRegistry.bulk_calls += 1
+            return await super().create_matches(players)
+
+    registry = CountingRegistry(shard_count=4)
+    matchmaker = Matchmaker(registry, tick_interval=60)
+    waiters = [asyncio.create_task(matchmaker.wait_for_match(f"P{index}", "fire")) for index in range(5)]
+    await asyncio.sleep(0)
+
+    assert await matchmaker.tick() == 2
+    assert CountingRegistry.bulk_calls == 1 and registry.get_session_count() == 2
+    first, second, third, fourth = await asyncio.gather(*waiters[:4])
+    assert first.match_id == second.match_id and third.match_id == fourth.match_id
+
+    # The odd player out waits for the next tick
+    assert matchmaker.get_stats()["waiting"] == 1 and not waiters[4].done()
+    late = asyncio.create_task(matchmaker.wait_for_match("P5", "water"))
+    await asyncio.sleep(0)
+    assert await matchmaker.tick() == 1
+    assert (await waiters[4]).match_id == (await late).match_id
+
+
+async def test_batched_tick_fails_every_player_if_matches_go_missing():
+    class ShortRegistry(SessionRegistry):
+        async def create_matches(self, players):
+            return (await super().create_matches(players))[:-1]
+
+    matchmaker = Matchmaker(ShortRegistry(shard_count=4), tick_interval=60)
+    waiters = [asyncio.create_task(matchmaker.wait_for_match(f"P{index}", "fire")) for index in range(4)]
+    await asyncio.sleep(0)
+
+    with pytest.raises(RuntimeError):
+        await matchmaker.tick()
+    results = await asyncio.gather(*waiters, return_exceptions=True)
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+async def test_batched_matchmaker_runs_its_own_tick():
+    matchmaker = Matchmaker(SessionRegistry(shard_count=4), tick_interval=0.01)
+    matchmaker.start()
+    try:
+        first, second = await asyncio.wait_for(
+            asyncio.gather(matchmaker.wait_for_match("A", "fire"), matchmaker.wait_for_match("B", "water")),
+            timeout=2,
+        )
+    finally:
+        await matchmaker.stop()
+    assert first.match_id == second.match_id and first.player_token != second.player_token
+
+
+async def test_rating_pool_pairs_nearest_rating_and_widens_with_wait():
+    pool = RatingPool(RatingWindow(initial=100, widen_per_second=25, maximum=1000))
+    for name, rating in (("low", 1000), ("mid", 1500), ("mid2", 1560), ("high", 2000)):
+        pool.push(make_entry(name, enqueued_at=0.0, preferences=MatchPreferences(rating=rating)))
+
+    assert names(pool.pop_matches(now=0.0)) == {frozenset(("mid", "mid2"))}
+    assert pool.pop_matches(now=20.0) == []  # Window 600 < gap 1000
+    assert names(pool.pop_matches(now=40.0)) == {frozenset(("low", "high"))}  # Capped at 1000
+    assert len(pool) == 0 and pool.get_stats()["regions"] == {}
+
+
+async def test_rating_pool_respects_region_and_elemental_preferences():
+    pool = RatingPool(RatingWindow(initial=100))
+    entries = [
+        make_entry("eu", 0.0, preferences=MatchPreferences(region="eu")),
+        make_entry("us", 0.0, preferences=MatchPreferences(region="us")),
+        make_entry("wants_water", 0.0, preferences=MatchPreferences(elementals=frozenset({"water"}))),
+        make_entry("fire", 0.0),
+        make_entry("water", 0.0, elemental="water"),
+    ]
+    for entry in entries:
+        pool.push(entry)
+
+    assert names(pool.pop_matches(now=0.0)) == {frozenset(("wants_water", "water"))}
+    assert {entry.name for entry in pool.drain()} == {"eu", "us", "fire"}
+
+
+def test_rated_matchmaking_over_websocket(monkeypatch):
+    monkeypatch.setattr(settings, "matchmaking_mode", "rated")
+    monkeypatch.setattr(settings, "matchmaking_tick_ms", 10)
+
+    with TestClient(create_app()) as client:
+        with pytest.raises(WebSocketDisconnect) as closed:
+            with client.websocket_connect("/ws/matchmaking?name=A&rating=abc", headers=dict(HEADERS)):
+                pass
+        assert closed.value.code == 1008
+
+        url = "/ws/matchmaking?name={}&rating={}&region=eu"
+        with client.websocket_connect(url.format("A", 1200), headers=dict(HEADERS)) as ws_a, \
+                client.websocket_connect(url.format("B", 1250), headers=dict(HEADERS)) as ws_b:
+            assert ws_a.receive_json()["status"] == "queueing"
+            assert ws_b.receive_json()["status"] == "queueing"
+            assert ws_a.receive_json()["match_id"] == ws_b.receive_json()["match_id"]
@@ -0,0 +1,34 @@
+"""Fan-out tests."""
+
+import asyncio
+
+from zc_api.common.codec import encode_message
+from zc_api.game_manager.session import fan_out
+
+
+async def test_fan_out_bounds_concurrency_and_reports_failures():
+    in_flight = 0
+    peak = 0
+    received: list[int] = []
+
+    async def send(target: int, frame: str) -> None:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        try:
+            if target == 3:
+                raise ConnectionError("gone")
+            await asyncio.sleep(1 if target == 5 else 0.001)
+            received.append(target)
+        finally:
+            in_flight -= 1
+
+    frame = encode_message({"type": "server_shutdown"})
+    result = await fan_out(range(20), frame, send, concurrency=4, timeout=0.05)
+
+    assert frame == '{"type":"server_shutdown"}'
+    assert peak <= 4
+    assert result.sent == 18
+    assert [target for target, _ in result.failed] == [3]
+    assert result.timed_out == [5]
+    assert not result.ok
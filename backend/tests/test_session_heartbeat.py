@@ -0,0 +1,144 @@
+"""Server heartbeat (RTT + dead socket reaping) tests."""
+
+import asyncio
+import json
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from zc_api.config import settings
+from zc_api.game_manager.session import HEARTBEAT_CLOSE_CODE, HeartbeatMonitor, SessionRegistry
+from zc_api.main import create_app
+
+
+class RecordingWebSocket:
+    def __init__(self) -> None:
+        self.sent: list[object] = []
+
+    async def send_text(self, payload: str) -> None:
+        self.sent.append(json.loads(payload))
+
+    async def close(self, code: int = 1000, reason: str = "") -> None:
+        pass
+
+
+async def test_one_tick_heartbeats_all_sessions_and_reaps_silent_sockets():
+    registry = SessionRegistry(shard_count=4)
+    reaped: list[str] = []
+
+    async def on_dead(session, token: str) -> None:
+        reaped.append(token)
+        await session.leave(token)
+
+    monitor = HeartbeatMonitor(registry, on_dead, interval=1.0, timeout=3.0)
+    sockets = {}
+    sessions = []
+    for _ in range(3):
+        match_id, token_a, token_b = await registry.create_match("A", "fire", "B", "water")
+        session = await registry.get_session(match_id)
+        for token in (token_a, token_b):
+            sockets[token] = RecordingWebSocket()
+            await session.join(token, sockets[token])
+        sessions.append((session, token_a, token_b))
+
+    start = time.monotonic()
+    assert await monitor.tick(now=start) == 0
+    for session, _, _ in sessions:
+        assert await session.drain(timeout=1)
+    assert all(ws.sent == [{"type": "heartbeat", "id": 1}] for ws in sockets.values())
+
+    # Players A answer; players B go silent
+    for session, token_a, _ in sessions:
+        session.ack_heartbeat(token_a, 1)
+        metrics = session.get_heartbeat_metrics()
+        assert metrics[0]["rtt_ms"] is not None
+        assert metrics[1]["rtt_ms"] is None
+
+    later = time.monotonic() + 3.5
+    for session, token_a, _ in sessions:
+        session._heartbeats[token_a].last_seen = later
+    assert await monitor.tick(now=later) == 3
+    assert sorted(reaped) == sorted(token_b for _, _, token_b in sessions)
+    assert monitor.get_reaped_count() == 3
+    for session, _, _ in sessions:
+        assert await session.get_connected_count() == 1
+        await session.leave(next(iter(session.get_connected_tokens())))
+
+
+async def test_failed_tick_does_not_stop_the_monitor(monkeypatch):
+    registry = SessionRegistry(shard_count=1)
+    monitor = HeartbeatMonitor(registry, on_dead=None, interval=0.01, timeout=3.0)
+    ticks = []
+
+    async def flaky_tick(now=None):
+        ticks.append(now)
+        if len(ticks) == 1:
+            raise RuntimeError("writer exploded")
+        return 0
+
+    monkeypatch.setattr(monitor, "tick", flaky_tick)
+    monitor.start()
+    try:
+        for _ in range(100):
+            if len(ticks) >= 3:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        await monitor.stop()
+    assert len(ticks) >= 3
+
+
+async def test_metrics_are_keyed_by_slot_not_name():
+    registry = SessionRegistry(shard_count=1)
+    match_id, token_a, token_b = await registry.create_match("Same", "fire", "Same", "water")
+    session = await registry.get_session(match_id)
+    for token in (token_a, token_b):
+        await session.join(token, RecordingWebSocket())
+
+    (info,) = await registry.get_all_sessions_info()
+    assert set(info["heartbeat"]) == {0, 1}
+    assert set(info["outbound"]) == {0, 1}
+    for token in (token_a, token_b):
+        await session.leave(token)
+
+
+def _receive_answering_heartbeats(ws) -> dict:
+    """Next non-heartbeat message; heartbeats on the way are acked."""
+    while (message := ws.receive_json())["type"] == "heartbeat":
+        ws.send_json({"type": "heartbeat_ack", "id": message["id"]})
+    return message
+
+
+def test_unresponsive_client_is_closed_and_rtt_is_reported(monkeypatch):
+    monkeypatch.setattr(settings, "heartbeat_interval_seconds", 0.05)
+    monkeypatch.setattr(settings, "heartbeat_timeout_seconds", 0.3)
+    headers = {"origin": "http://localhost:5173"}
+
+    with TestClient(create_app()) as client:
+        with client.websocket_connect("/ws/matchmaking?name=A", headers=dict(headers)) as ws_a:
+            ws_a.receive_json()
+            with client.websocket_connect("/ws/matchmaking?name=B", headers=dict(headers)) as ws_b:
+                ws_b.receive_json()
+                found_b = ws_b.receive_json()
+            found_a = ws_a.receive_json()
+
+        url = f"/ws/game/{found_a['match_id']}?token="
+        with client.websocket_connect(url + found_a["player_token"], headers=dict(headers)) as ws_a:
+            with client.websocket_connect(url + found_b["player_token"], headers=dict(headers)) as ws_b:
+                assert _receive_answering_heartbeats(ws_a)["type"] == "game_ready"
+
+                # A keeps answering; B never does, so the server drops it within the timeout
+                assert _receive_answering_heartbeats(ws_a)["type"] == "opponent_disconnected"
+                with pytest.raises(WebSocketDisconnect) as closed:
+                    while True:
+                        ws_b.receive_json()
+                assert closed.value.code == HEARTBEAT_CLOSE_CODE
+
+                sessions = client.get("/admin/sessions").json()["sessions"]
+                # Keyed by player slot ("0" = A, who queued first)
+                assert [player["name"] for player in sessions[0]["players"]] == ["A", "B"]
+                players = sessions[0]["heartbeat"]
+                assert players["0"]["rtt_ms"] is not None
+                assert "1" not in players
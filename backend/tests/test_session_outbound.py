@@ -0,0 +1,71 @@
+"""Outbound queue (ConnectionWriter) tests."""
+
+import asyncio
+
+from zc_api.game_manager.session import ConnectionWriter, OverflowPolicy
+
+
+class SlowWebSocket:
+    """Fake socket whose sends block until released."""
+
+    def __init__(self) -> None:
+        self.sent: list[object] = []
+        self.closed_code: int | None = None
+        self.gate = asyncio.Event()
+
+    async def send_json(self, payload: object) -> None:
+        await self.gate.wait()
+        self.sent.append(payload)
+
+    async def send_text(self, payload: str) -> None:
+        await self.send_json(payload)
+
+    async def close(self, code: int = 1000, reason: str = "") -> None:
+        self.closed_code = code
+
+
+async def test_send_does_not_wait_for_slow_peer():
+    ws = SlowWebSocket()
+    writer = ConnectionWriter(ws, max_queue_size=4, overflow_policy=OverflowPolicy.DROP_OLDEST)
+    writer.start()
+
+    for index in range(6):
+        assert writer.send({"type": "tick", "n": index})
+
+    assert writer.get_metrics()["dropped"] == 2
+    ws.gate.set()
+    assert await writer.drain(timeout=1)
+    assert [payload["n"] for payload in ws.sent] == [2, 3, 4, 5]
+    assert writer.get_metrics()["sent"] == 4
+    await writer.close()
+
+
+async def test_coalesce_replaces_oldest_of_same_type():
+    ws = SlowWebSocket()
+    writer = ConnectionWriter(ws, max_queue_size=3, overflow_policy=OverflowPolicy.COALESCE)
+
+    writer.send({"type": "state", "v": 1})
+    writer.send({"type": "chat", "v": 2})
+    writer.send({"type": "state", "v": 3})
+    writer.send({"type": "state", "v": 4})
+
+    ws.gate.set()
+    writer.start()
+    await writer.drain(timeout=1)
+    assert ws.sent == [{"type": "chat", "v": 2}, {"type": "state", "v": 3}, {"type": "state", "v": 4}]
+    assert writer.get_metrics()["coalesced"] == 1
+    await writer.close()
+
+
+async def test_disconnect_policy_closes_slow_client():
+    ws = SlowWebSocket()
+    writer = ConnectionWriter(ws, max_queue_size=2, overflow_policy=OverflowPolicy.DISCONNECT)
+    writer.start()
+
+    writer.send({"type": "a"})
+    writer.send({"type": "b"})
+    assert not writer.send({"type": "c"})
+    assert writer.is_closed()
+
+    await asyncio.wait_for(writer._task, timeout=1)
+    assert ws.closed_code == 1013
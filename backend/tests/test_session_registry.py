@@ -0,0 +1,71 @@
+"""SessionRegistry tests."""
+
+import time
+
+import pytest
+
+from zc_api.game_manager.session import SessionRegistry, SessionState, SessionTtls, TimingWheel
+from zc_api.game_manager.session.registry import shard_index
+
+
+async def test_sessions_are_spread_across_shards():
+    registry = SessionRegistry(shard_count=4)
+    match_ids = [(await registry.create_match("A", "fire", "B", "water"))[0] for _ in range(40)]
+
+    assert registry.get_session_count() == 40
+    assert {session.match_id for session in registry.iter_sessions()} == set(match_ids)
+    assert sum(1 for stats in registry.get_shard_stats() if stats["sessions"]) > 1
+
+    match_id = match_ids[0]
+    assert (await registry.get_session(match_id)).match_id == match_id
+    await registry.remove_session(match_id)
+    await registry.remove_session(match_id)
+
+    assert await registry.get_session(match_id) is None
+    stats = registry.get_shard_stats()[shard_index(match_id, 4)]
+    assert stats["removed"] == 1
+    assert sum(stats["created"] for stats in registry.get_shard_stats()) == 40
+
+
+def test_shard_count_must_be_power_of_two():
+    with pytest.raises(ValueError):
+        SessionRegistry(shard_count=3)
+
+
+def test_timing_wheel_reschedules_lazily():
+    now = 1000.0
+    wheel = TimingWheel[str](tick_seconds=1.0, slot_count=8, clock=lambda: now)
+    wheel.schedule("a", now + 3)
+    wheel.schedule("b", now + 5)
+    wheel.schedule("a", now + 20)  # Later deadline, beyond one rotation
+    wheel.schedule("b", now + 2)   # Earlier deadline moves immediately
+
+    assert wheel.advance(now + 2) == ["b"]
+    assert wheel.advance(now + 10) == []
+    assert wheel.advance(now + 19.5) == []
+    assert wheel.advance(now + 20) == ["a"]
+    assert len(wheel) == 0
+
+
+async def test_registry_expires_sessions_by_state_ttl():
+    registry = SessionRegistry(
+        shard_count=2,
+        ttls=SessionTtls(waiting_for_join=10, in_game=100, disconnected=5),
+    )
+    waiting_id, _, _ = await registry.create_match("A", "fire", "B", "water")
+    playing_id, token_a, token_b = await registry.create_match("C", "fire", "D", "water")
+    session = await registry.get_session(playing_id)
+    await session.join(token_a, object())
+    await session.join(token_b, object())
+    assert session.get_state() is SessionState.IN_GAME
+
+    now = time.monotonic()
+    assert await registry.expire_sessions(now + 11) == [waiting_id]
+    assert await registry.expire_sessions(now + 50) == []
+
+    await session.leave(token_a)
+    (writer_b,) = session.get_writers()
+    assert await registry.expire_sessions(now + 56) == [playing_id]  # 5s after leaving, not 100s
+    assert registry.get_session_count() == 0
+    # B's socket was still attached: its writer stops with the session
+    assert writer_b.is_closed() and session.get_writers() == []
@@ -0,0 +1,73 @@
+"""Session resume (sequence numbers + replay buffer) tests."""
+
+from fastapi.testclient import TestClient
+
+from zc_api.common.codec import EncodedMessage
+from zc_api.game_manager.session import ReplayBuffer
+
+HEADERS = {"origin": "http://localhost:5173"}
+
+
+def test_replay_buffer_returns_missed_or_none_after_eviction():
+    buffer = ReplayBuffer(capacity=3)
+    assert buffer.since(0) == []
+
+    for seq in (2, 5, 6, 9):
+        buffer.append(seq, EncodedMessage({"type": "pinged", "seq": seq}))
+
+    assert [seq for seq, _ in buffer.since(5)] == [6, 9]
+    assert buffer.since(9) == []
+    assert buffer.since(2) is not None
+    # seq 2 was evicted, so a client that last saw seq 1 needs a snapshot
+    assert buffer.since(1) is None
+    assert buffer.get_last_seq() == 9
+
+
+def _match(client: TestClient) -> tuple[str, str, str]:
+    with client.websocket_connect("/ws/matchmaking?name=A&elemental=fire", headers=dict(HEADERS)) as ws_a:
+        ws_a.receive_json()
+        with client.websocket_connect("/ws/matchmaking?name=B&elemental=water", headers=dict(HEADERS)) as ws_b:
+            ws_b.receive_json()
+            found_b = ws_b.receive_json()
+        found_a = ws_a.receive_json()
+    return found_a["match_id"], found_a["player_token"], found_b["player_token"]
+
+
+def test_reconnect_replays_only_missed_messages(app):
+    with TestClient(app) as client:
+        match_id, token_a, token_b = _match(client)
+        url = f"/ws/game/{match_id}?token="
+
+        with client.websocket_connect(url + token_a, headers=dict(HEADERS)) as ws_a:
+            with client.websocket_connect(url + token_b, headers=dict(HEADERS)) as ws_b:
+                ready_a = ws_a.receive_json()
+                ready_b = ws_b.receive_json()
+                assert (ready_a["type"], ready_b["type"]) == ("game_ready", "game_ready")
+                assert ready_a["seq"] < ready_b["seq"]
+
+            disconnected = ws_a.receive_json()
+            assert disconnected["type"] == "opponent_disconnected"
+
+            # B is away; the ping is buffered for them
+            ws_a.send_json({"type": "ping"})
+            ws_a.send_json({"type": "ping"})
+
+            resume_url = f"{url}{token_b}&last_seq={ready_b['seq']}"
+            with client.websocket_connect(resume_url, headers=dict(HEADERS)) as ws_b:
+                missed = [ws_b.receive_json(), ws_b.receive_json()]
+                assert [msg["type"] for msg in missed] == ["pinged", "pinged"]
+                assert missed[0]["seq"] > disconnected["seq"]
+                assert missed[1]["seq"] == missed[0]["seq"] + 1
+                assert ws_a.receive_json()["type"] == "opponent_reconnected"
+
+            assert ws_a.receive_json()["type"] == "opponent_disconnected"
+
+            # No last_seq (e.g. page reload): full snapshot instead of a replay
+            with client.websocket_connect(url + token_b, headers=dict(HEADERS)) as ws_b:
+                resync = ws_b.receive_json()
+                assert resync["type"] == "resync"
+                assert resync["you"] == "B" and resync["opponent"] == "A"
+                assert resync["opponent_connected"] is True
+
+        info = client.get("/admin/sessions").json()
+        assert any(session["match_id"] == match_id for session in info["sessions"])
@@ -0,0 +1,91 @@
+"""TagContainerArray tests (requires the optional NumPy dependency)."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from zc_api.tags import GameplayTagBitmaskContainer, TagRegistry  # noqa: E402
+from zc_api.tags.tag_container_array import TagContainerArray  # noqa: E402
+
+
+@pytest.fixture
+def registry():
+    registry = TagRegistry()
+    for path in ["Ability.Elemental.Fire.Burn", "Status.Frozen", "Status.Burning", "Player.Owner.P1"]:
+        registry.request_tag(path)
+    registry.freeze()
+    return registry
+
+
+def test_add_and_query_rows(registry):
+    board = TagContainerArray(4, registry)
+    board.add_tag("Status.Frozen", rows=[0, 2])
+    board.add_tag("Player.Owner.P1", rows=np.array([True, True, False, False]))
+
+    assert board.has_tag("Status").tolist() == [True, False, True, False]
+    assert board.has_tag_exact("Status").tolist() == [False, False, False, False]
+    assert board.has_tag("Player.Owner").tolist() == [True, True, False, False]
+
+    query = GameplayTagBitmaskContainer(registry)
+    query.add_tag("Status")
+    query.add_tag("Player")
+    assert board.has_any(query).tolist() == [True, True, True, False]
+    assert board.has_all(query).tolist() == [True, False, False, False]
+    assert not board.has_any_exact(query).any()
+
+
+def test_remove_recomputes_shared_parents(registry):
+    board = TagContainerArray(3, registry)
+    board.add_tag("Status.Frozen")
+    board.add_tag("Status.Burning", rows=[1])
+
+    board.remove_tag("Status.Frozen")
+
+    assert board.has_tag("Status").tolist() == [False, True, False]
+    assert not board.has_tag("Status.Frozen").any()
+
+
+def test_round_trip_with_containers(registry):
+    containers = []
+    for paths in (["Status.Frozen"], [], ["Ability.Elemental.Fire.Burn", "Player.Owner.P1"]):
+        container = GameplayTagBitmaskContainer(registry)
+        for path in paths:
+            container.add_tag(path)
+        containers.append(container)
+
+    board = TagContainerArray.from_containers(containers, registry)
+
+    assert len(board) == 3
+    for index, container in enumerate(containers):
+        restored = board.get_container(index)
+        assert restored.get_explicit_mask() == container.get_explicit_mask()
+        assert restored.get_tag_mask() == container.get_tag_mask()
+
+
+def test_tags_registered_after_sizing_are_absent():
+    registry = TagRegistry()
+    registry.request_tag("Status.Frozen")
+    board = TagContainerArray(2, registry)
+    board.add_tag("Status.Frozen")
+    for index in range(100):
+        registry.request_tag(f"Late.Tag{index}")
+    late = registry.request_tag("Late.Tag99")
+
+    query = GameplayTagBitmaskContainer(registry)
+    query.add_tag(late)
+    query.add_tag("Status.Frozen")
+
+    assert board.has_tag(late).tolist() == [False, False]
+    assert board.has_tag_exact("Late.Tag99").tolist() == [False, False]
+    assert board.has_any(query).tolist() == [True, True]
+    assert board.has_all(query).tolist() == [False, False]
+    board.remove_tag(late)
+    with pytest.raises(ValueError):
+        board.add_tag(late)
+
+    # Read-only queries must not register unknown tags
+    count = registry.get_tag_count()
+    assert board.has_tag("Typo.Tag").tolist() == [False, False]
+    assert board.has_tag_exact("Typo.Other").tolist() == [False, False]
+    board.remove_tag("Typo.Removed")
+    assert registry.get_tag_count() == count
@@ -0,0 +1,437 @@
+"""GameplayTags tests."""
+
+import pytest
+
+from zc_api.tags import (
+    GameplayTag,
+    GameplayTagBitmaskContainer,
+    GameplayTagContainer,
+    GameplayTagCountContainer,
+    TagEventType,
+    TagQuery,
+    TagRegistry,
+    TagRegistrySnapshot,
+    TagTableError,
+    TagWireError,
+    decode_tags,
+    encode_tags,
+)
+
+
+@pytest.fixture
+def registry():
+    with TagRegistry().activated() as registry:
+        yield registry
+
+
+def test_tags_are_interned_flyweights(registry):
+    tag = registry.request_tag("Player.Owner.P1")
+
+    assert registry.request_tag("Player.Owner.P1") is tag
+    assert tag.get_parent() is registry.request_tag("Player.Owner")
+    assert tag.get_parent().get_parent().get_parent() is GameplayTag.NONE
+    assert registry.get_tag_by_id(tag.get_id()) is tag
+    assert repr(tag) == "GameplayTag('Player.Owner.P1')"
+
+
+def test_handles_stay_bound_to_their_registry(registry):
+    tag = registry.request_tag("Status.Frozen")
+
+    with TagRegistry().activated() as other:
+        assert TagRegistry.get() is other
+        assert tag.get_name() == "Status.Frozen"
+
+    assert TagRegistry.get() is registry
+
+
+def test_list_container_uses_active_registry(registry):
+    container = GameplayTagContainer()
+    container.add_tag("Player.Owner.P1")
+    container.add_tag("Status.Frozen")
+
+    assert container.has_tag("Player.Owner")
+    assert container.to_string() == "Player.Owner.P1,Status.Frozen"
+    assert container.get_tag_mask() == (
+        registry.get_ancestor_mask(registry.request_tag("Player.Owner.P1").get_id())
+        | registry.get_ancestor_mask(registry.request_tag("Status.Frozen").get_id())
+    )
+
+
+def test_list_container_masks_use_the_tags_registry(registry):
+    other = TagRegistry()
+    other.request_tag("Padding.Shifts.The.IDs")
+    frozen = other.request_tag("Status.Frozen")
+    container = GameplayTagContainer()
+    container.add_tag(frozen)
+
+    assert container.get_tag_mask() == other.get_ancestor_mask(frozen.get_id())
+
+    container.add_tag("Status.Burning")  # Resolved against the active registry
+    with pytest.raises(ValueError):
+        container.get_tag_mask()
+
+
+def test_ancestor_mask_includes_parents(registry):
+    tag = registry.request_tag("Player.Owner.P1")
+    parent = registry.request_tag("Player.Owner")
+    root = registry.request_tag("Player")
+
+    mask = registry.get_ancestor_mask(tag.get_id())
+    assert mask == (1 << tag.get_id()) | (1 << parent.get_id()) | (1 << root.get_id())
+
+
+def test_bitmask_container_parent_matching(registry):
+    container = GameplayTagBitmaskContainer(registry)
+    container.add_tag("Player.Owner.P1")
+    container.add_tag("GameData.Elemental.Fire")
+
+    assert container.has_tag("Player.Owner")
+    assert container.has_tag("GameData")
+    assert container.has_tag_exact("Player.Owner.P1")
+    assert not container.has_tag_exact("Player.Owner")
+    assert not container.has_tag("Player.Owner.P2")
+    assert container.num() == 2
+
+
+def test_bitmask_container_remove_keeps_shared_parents(registry):
+    container = GameplayTagBitmaskContainer(registry)
+    container.add_tag("Status.Frozen")
+    container.add_tag("Status.Burning")
+
+    assert container.remove_tag("Status.Frozen")
+    assert not container.remove_tag("Status.Frozen")
+    assert container.has_tag("Status")
+    assert not container.has_tag("Status.Frozen")
+
+    container.remove_tag("Status.Burning")
+    assert not container.has_tag("Status")
+    assert container.is_empty()
+
+
+@pytest.mark.parametrize("container_type", [GameplayTagContainer, GameplayTagBitmaskContainer])
+def test_bulk_add_remove_keeps_parents_consistent(registry, container_type):
+    paths = ["A.B.C", "A.B", "A.D", "E.F.G", "E.F.H"]
+    container = container_type.from_iterable(paths)
+    other = container_type.from_iterable(["E.F.I"])
+
+    container.update(other)
+    assert container.num() == 6
+    assert container.remove_tags(["A.B", "E.F.G", "Missing.Tag"]) == 2
+
+    assert container.has_tag("A.B")  # Still implied by A.B.C
+    assert not container.has_tag_exact("A.B")
+    assert container.has_tag("E.F")
+
+    container.remove_tags(["A.B.C", "A.D"])
+    assert not container.has_tag("A")
+    assert container.get_tag_mask() == container_type.from_iterable(["E.F.H", "E.F.I"]).get_tag_mask()
+
+
+def test_bitmask_container_set_operations(registry):
+    container1 = GameplayTagBitmaskContainer(registry)
+    container1.add_tag("Player.Owner.P1")
+    container1.add_tag("Status.Frozen")
+
+    container2 = GameplayTagBitmaskContainer(registry)
+    container2.add_tag("Player.Owner.P2")
+    container2.add_tag("Status.Frozen")
+
+    parents = GameplayTagBitmaskContainer(registry)
+    parents.add_tag("Player")
+    parents.add_tag("Status")
+
+    assert container1.has_any(container2)
+    assert not container1.has_all(container2)
+    assert container1.has_any_exact(container2)
+    assert container1.has_all(parents)
+    assert not container1.has_any_exact(parents)
+
+
+def test_bitmask_container_implements_every_base_method(registry):
+    # Anything touching the base's (uninitialized) set storage must be overridden;
+    # __str__/__bool__ only delegate to to_string()/is_empty()
+    base_methods = {
+        name for name, value in vars(GameplayTagContainer).items()
+        if callable(value) or isinstance(value, staticmethod)
+    }
+    assert base_methods - {"__str__", "__bool__"} <= set(vars(GameplayTagBitmaskContainer))
+
+    container = GameplayTagBitmaskContainer(registry)
+    other = GameplayTagBitmaskContainer.from_iterable(["Status.Frozen"], registry)
+    container.add_tag("Player.Owner.P1")
+    container.add_tags(["Status.Burning", registry.request_tag("Status.Frozen")])
+    container.update(other)
+    assert container.remove_tag("Status.Burning")
+    assert container.remove_tags(["Status.Burning", "Player.Owner.P1"]) == 1
+    assert container.has_tag("Status") and not container.has_tag_exact("Status")
+    assert container.has_any(other) and container.has_all(other)
+    assert container.has_any_exact(other) and container.has_all_exact(other)
+    assert container.num() == 1 and not container.is_empty() and container
+    assert container.get_explicit_tags() == [registry.request_tag("Status.Frozen")]
+    assert container.get_explicit_mask() == other.get_explicit_mask()
+    assert container.get_tag_mask() == other.get_tag_mask()
+    assert str(container) == container.to_string() == "Status.Frozen"
+    assert repr(container) == "GameplayTagBitmaskContainer([Status.Frozen])"
+    assert GameplayTagBitmaskContainer.from_string("Status.Frozen", registry).get_explicit_mask() == other.get_explicit_mask()
+    assert GameplayTagBitmaskContainer.from_mask(other.get_explicit_mask(), registry).has_tag("Status")
+    assert container._contains_in_either(registry.request_tag("Status"))
+    container._remove_resolved(registry.request_tag("Status.Frozen"))
+    container._add_resolved(registry.request_tag("Status.Burning"))
+    container._rebuild_parent_tags()
+    assert list(container._iter_explicit_tags()) == [registry.request_tag("Status.Burning")]
+    container.clear()
+    assert container.is_empty()
+
+
+def test_bitmask_container_string_round_trip(registry):
+    container = GameplayTagBitmaskContainer.from_string("Status.Frozen, Player.Owner.P1", registry)
+
+    restored = GameplayTagBitmaskContainer.from_string(container.to_string(), registry)
+
+    assert restored.get_explicit_mask() == container.get_explicit_mask()
+    assert restored.get_tag_mask() == container.get_tag_mask()
+
+
+def test_frozen_registry_rejects_new_tags(registry):
+    registry.request_tag("Status.Frozen")
+    registry.freeze()
+
+    assert registry.is_strict_mode()
+    assert registry.request_tag("Status.Frozen").is_valid()
+    assert not registry.request_tag("Status.Burning").is_valid()
+    with pytest.raises(RuntimeError):
+        registry.register_tags_from_source(lambda: ["Status.Burning"])
+    with pytest.raises(RuntimeError):
+        registry.set_strict_mode(False)
+
+
+def test_snapshot_hierarchy_queries(registry):
+    for path in ["Ability.Elemental.Fire.Burn", "Ability.Elemental.Water.Squirt", "Status.Frozen"]:
+        registry.request_tag(path)
+    snapshot = registry.freeze()
+
+    ability = snapshot.find_tag_id("Ability")
+    fire = snapshot.find_tag_id("Ability.Elemental.Fire")
+    burn = snapshot.find_tag_id("Ability.Elemental.Fire.Burn")
+    frozen = snapshot.find_tag_id("Status.Frozen")
+
+    assert snapshot.find_tag_id("Missing.Tag") == 0
+    assert snapshot.get_tag_name(burn) == "Ability.Elemental.Fire.Burn"
+    assert snapshot.get_parent_id(burn) == fire
+    assert snapshot.get_depth(burn) == 4
+    assert snapshot.is_descendant(burn, ability)
+    assert not snapshot.is_descendant(ability, ability)
+    assert not snapshot.is_descendant(frozen, ability)
+    assert snapshot.get_ancestor_mask(burn) == registry.get_ancestor_mask(burn)
+
+    descendants = {snapshot.get_tag_name(tag_id) for tag_id in snapshot.get_descendant_ids(ability)}
+    assert descendants == {
+        "Ability.Elemental",
+        "Ability.Elemental.Fire",
+        "Ability.Elemental.Fire.Burn",
+        "Ability.Elemental.Water",
+        "Ability.Elemental.Water.Squirt",
+    }
+    assert len(snapshot.get_descendant_ids(0)) == snapshot.get_tag_count()
+
+
+def test_tag_query_hierarchical_and_exact(registry):
+    tile = GameplayTagBitmaskContainer(registry)
+    tile.add_tag("Ability.Elemental.Fire.Burn")
+    tile.add_tag("Player.Owner.P1")
+
+    assert TagQuery.parse("ANY(Ability.Elemental.Fire) AND NONE(Status.Frozen)").compile(registry)(tile)
+    assert not TagQuery.parse("ANY_EXACT(Ability.Elemental.Fire)").compile(registry)(tile)
+    assert TagQuery.parse("ANY_EXACT(Ability.Elemental.Fire.*)").compile(registry)(tile)
+    assert TagQuery.parse("all(Player, Ability) and not any(Player.Owner.P2)").compile(registry)(tile)
+
+    tile.add_tag("Status.Frozen")
+    assert not TagQuery.parse("ANY(Ability.Elemental.Fire) AND NONE(Status.Frozen)").compile(registry)(tile)
+    assert TagQuery.parse("NONE(Ability) OR (ALL(Status) AND NOT ALL_EXACT(Status))").compile(registry)(tile)
+
+
+def test_tag_query_builders_round_trip(registry):
+    query = TagQuery.any_tags_match(["Ability.Elemental.Fire"]) & ~TagQuery.no_tags_match(
+        ["Status.Frozen", "Status.Burning"], exact=True
+    )
+
+    assert TagQuery.parse(str(query)) == query
+    assert str(query) == "ANY(Ability.Elemental.Fire) AND NOT NONE_EXACT(Status.Frozen, Status.Burning)"
+
+
+def test_tag_query_rejects_bad_input(registry):
+    registry.request_tag("Status.Frozen")
+    registry.freeze()
+
+    with pytest.raises(ValueError):
+        TagQuery.parse("ANY(Status.Frozen")
+    with pytest.raises(ValueError):
+        TagQuery.parse("SOME(Status.Frozen)")
+    with pytest.raises(ValueError):
+        TagQuery.parse("ANY(Status.Frozen) Status.Burning")
+
+
+def test_tag_query_does_not_register_unknown_tags(registry):
+    tile = GameplayTagBitmaskContainer(registry)
+    tile.add_tag("Status.Frozen")
+    tag_count = registry.get_tag_count()
+
+    assert not TagQuery.parse("ANY(Status.Burning)").compile(registry)(tile)
+    assert TagQuery.parse("NONE(Status.Burning)").compile(registry)(tile)
+    assert not TagQuery.parse("ALL(Status.Frozen, Status.Burning)").compile(registry)(tile)
+    assert not TagQuery.parse("ALL(Status.Burning) AND NONE(Player)").compile(registry)(tile)
+    assert TagQuery.parse("ANY(Status.Frozen, Status.Burning.*)").compile(registry)(tile)
+    assert registry.get_tag_count() == tag_count
+    assert not registry.find_tag("Status.Burning").is_valid()
+
+
+def test_tag_table_round_trip(registry, tmp_path):
+    for path in ["Ability.Elemental.Fire.Burn", "Status.Frozen", "GameData.Elemental.Ice"]:
+        registry.request_tag(path)
+    snapshot = registry.freeze()
+    table_path = tmp_path / "tags.bin"
+    snapshot.save(table_path)
+
+    loaded = TagRegistrySnapshot.load(table_path)
+    restored = TagRegistry.from_snapshot(loaded)
+
+    assert loaded.get_checksum() == snapshot.get_checksum()
+    assert restored.get_checksum() == registry.get_checksum()
+    assert loaded.get_all_tags() == snapshot.get_all_tags()
+    assert restored.is_frozen()
+    for path in registry.get_all_tags():
+        tag = restored.request_tag(path)
+        assert tag.get_id() == registry.request_tag(path).get_id()
+        assert loaded.find_tag_id(path) == tag.get_id()
+        assert tag.get_name() == path
+    burn = loaded.find_tag_id("Ability.Elemental.Fire.Burn")
+    assert loaded.is_descendant(burn, loaded.find_tag_id("Ability"))
+    assert restored.get_ancestor_mask(burn) == registry.get_ancestor_mask(burn)
+
+
+def test_tag_table_rejects_corruption(registry):
+    registry.request_tag("Status.Frozen")
+    data = registry.freeze().to_bytes()
+    corrupt_name = bytearray(data)
+    corrupt_name[-1] ^= 0xFF
+    # Parent of tag 1: after the 88-byte header and the (count + 1) name offsets
+    corrupt_parent = bytearray(data)
+    corrupt_parent[88 + 4 * (registry.get_tag_count() + 2) + 4] ^= 0xFF
+
+    for corrupt in (corrupt_name, corrupt_parent, data[:-4], data + b"\0\0\0\0", b"not a tag table"):
+        with pytest.raises(TagTableError):
+            TagRegistrySnapshot.from_buffer(bytes(corrupt))
+
+
+def test_tag_table_records_source_digest(registry, tmp_path):
+    registry.request_tag("Status.Frozen")
+    table_path = tmp_path / "tags.bin"
+    registry.freeze().save(table_path, source_digest=b"\x01" * 32)
+
+    loaded = TagRegistrySnapshot.load(table_path)
+    restored = TagRegistry.from_snapshot(loaded)
+
+    assert loaded.get_source_digest() == b"\x01" * 32
+    assert restored.request_tag("Status.Frozen") is restored.request_tag("Status.Frozen")
+    assert restored.request_tag("Status.Burning") == GameplayTag.NONE
+    assert restored.get_all_tags() == ["Status", "Status.Frozen"]
+
+
+def test_count_container_tracks_stacks_and_parents(registry):
+    counts = GameplayTagCountContainer(registry)
+
+    assert counts.update_tag_count("Status.Frozen", 2)
+    assert not counts.update_tag_count("Status.Frozen", 1)
+    counts.update_tag_count("Status.Burning", 1)
+
+    assert counts.get_explicit_tag_count("Status.Frozen") == 3
+    assert counts.get_tag_count("Status") == 4
+    assert counts.get_explicit_tag_count("Status") == 0
+    assert counts.has_matching_tag("Status")
+
+    assert counts.update_tag_count("Status.Frozen", -5)
+    assert counts.get_tag_count("Status") == 1
+    assert not counts.get_explicit_tags().has_tag("Status.Frozen")
+
+
+def test_count_container_events_are_scoped_to_tag(registry):
+    counts = GameplayTagCountContainer(registry)
+    frozen_events = []
+    status_events = []
+    burning_events = []
+
+    counts.register_tag_event("Status.Frozen", TagEventType.NEW_OR_REMOVED, lambda tag, n: frozen_events.append(n))
+    handle = counts.register_tag_event(
+        "Status", TagEventType.ANY_COUNT_CHANGE, lambda tag, n: status_events.append((tag.get_name(), n))
+    )
+    counts.register_tag_event("Status.Burning", TagEventType.ANY_COUNT_CHANGE, lambda tag, n: burning_events.append(n))
+
+    counts.update_tag_count("Status.Frozen", 1)
+    counts.update_tag_count("Status.Frozen", 1)
+    counts.update_tag_count("Status.Frozen", -2)
+
+    assert frozen_events == [1, 0]
+    assert status_events == [("Status", 1), ("Status", 2), ("Status", 0)]
+    assert burning_events == []
+
+    assert counts.unregister_tag_event(handle)
+    assert not counts.unregister_tag_event(handle)
+    counts.update_tag_count("Status.Frozen", 1)
+    assert len(status_events) == 3
+
+
+def test_wire_format_round_trip(registry):
+    container = GameplayTagBitmaskContainer(registry)
+    container.add_tag("Player.Owner.P1")
+    container.add_tag("Status.Frozen")
+    for index in range(200):
+        registry.request_tag(f"Filler.Tag{index}")
+    container.add_tag("Filler.Tag199")
+    registry.freeze()
+
+    data = encode_tags(container, registry)
+    restored = decode_tags(data, registry)
+    as_list = decode_tags(encode_tags(container, registry, include_version=False), registry, GameplayTagContainer)
+
+    assert len(data) < len(container.to_string())
+    assert restored.get_explicit_mask() == container.get_explicit_mask()
+    assert restored.get_tag_mask() == container.get_tag_mask()
+    assert as_list.get_explicit_mask() == container.get_explicit_mask()
+    assert as_list.has_tag("Filler")
+
+
+def test_wire_format_picks_bitmask_for_dense_sets(registry):
+    container = GameplayTagBitmaskContainer(registry)
+    for index in range(40):
+        container.add_tag(f"Dense.Tag{index}")
+
+    data = encode_tags(container, registry, include_version=False)
+
+    assert data[0] & 0x01
+    assert decode_tags(data, registry).get_explicit_mask() == container.get_explicit_mask()
+
+
+def test_wire_format_rejects_other_registry(registry):
+    container = GameplayTagBitmaskContainer(registry)
+    container.add_tag("Status.Frozen")
+    data = encode_tags(container, registry)
+
+    other = TagRegistry()
+    other.request_tag("Status.Burning")
+    with pytest.raises(TagWireError):
+        decode_tags(data, other)
+    with pytest.raises(TagWireError):
+        decode_tags(data[:-1], registry)
+
+
+def test_wire_format_rejects_huge_ids_early(registry):
+    registry.request_tag("Status.Frozen")
+
+    # ID list: count 1, one delta of 2**32 (5-byte varint)
+    huge_delta = bytes([0x00, 0x01, 0x80, 0x80, 0x80, 0x80, 0x10])
+    with pytest.raises(TagWireError, match="unknown tag IDs"):
+        decode_tags(huge_delta, registry)
+
+    endless_varint = bytes([0x00, 0x01]) + b"\xff" * 64 + b"\x01"
+    with pytest.raises(TagWireError, match="too long"):
+        decode_tags(endless_varint, registry)
@@ -103,6 +103,13 @@ export function useMatchmaking() {
     ws.onmessage = (ev) => {
       const msg = JSON.parse(ev.data as string) as ServerMessage
 
+      // Server liveness probe: answer or the server closes the socket as dead
+      if (msg.type === 'heartbeat') {
+        const ack: ClientMessage = { type: 'heartbeat_ack', id: msg.id }
+        ws.send(JSON.stringify(ack))
+        return
+      }
+
       if (msg.type === 'game_ready') {
         store.setOpponent(msg.opponent, msg.opponent_elemental as ElementalType)
         store.setPhase('vs-screen')
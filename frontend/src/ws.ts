@@ -26,6 +26,11 @@ export type ServerOpponentDisconnected = {
   type: 'opponent_disconnected'
 }
 
+export type ServerHeartbeat = {
+  type: 'heartbeat'
+  id: number
+}
+
 export type ServerError = {
   type: 'error'
   message: string
@@ -37,11 +42,14 @@ export type ServerMessage =
   | ServerGameReady
   | ServerPinged
   | ServerOpponentDisconnected
+  | ServerHeartbeat
   | ServerError
 
 export type ClientPing = { type: 'ping' }
 
-export type ClientMessage = ClientPing
+export type ClientHeartbeatAck = { type: 'heartbeat_ack'; id: number }
+
+export type ClientMessage = ClientPing | ClientHeartbeatAck
 
 export function getWsBaseUrl(): string {
   const url = new URL(window.location.href)